@@ -0,0 +1,12 @@
+"""Offline benchmarks for lyricsgenius.
+
+The benchmarks run against :class:`MockGeniusServer`, a local HTTP stand-in
+for genius.com and api.genius.com, so they can be run repeatedly without
+network access or an access token.
+
+Run them from the repository root::
+
+    python -m benchmarks.api --latency 0.05 --error-rate 0.01
+"""
+
+from .mock_server import MockGeniusServer
@@ -0,0 +1,64 @@
+"""Timing and reporting helpers shared by the benchmark scripts."""
+
+import statistics
+import time
+from typing import Any, Callable
+
+
+class Result:
+    """Timings collected for one benchmark case."""
+
+    def __init__(self, name: str, items: int = 1) -> None:
+        self.name = name
+        self.items = items
+        self.times: list[float] = []
+        self.errors = 0
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else float("nan")
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second, based on the median run."""
+        return self.items / self.median if self.times else 0.0
+
+    def row(self) -> str:
+        best = min(self.times) if self.times else float("nan")
+        return (
+            f"{self.name:<34} {len(self.times):>4} {best * 1000:>10.2f} "
+            f"{self.median * 1000:>10.2f} {self.throughput:>10.1f} {self.errors:>6}"
+        )
+
+
+HEADER = (
+    f"{'benchmark':<34} {'runs':>4} {'best ms':>10} "
+    f"{'median ms':>10} {'items/s':>10} {'errors':>6}"
+)
+
+
+def measure(
+    name: str, func: Callable[[], Any], repeat: int = 5, items: int = 1
+) -> Result:
+    """Runs ``func`` ``repeat`` times and records the wall time of each run.
+
+    Exceptions raised by ``func`` are counted as errors instead of
+    aborting the benchmark.
+    """
+    result = Result(name, items=items)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception:
+            result.errors += 1
+            continue
+        result.times.append(time.perf_counter() - start)
+    return result
+
+
+def report(results: list[Result]) -> None:
+    print(HEADER)
+    print("-" * len(HEADER))
+    for result in results:
+        print(result.row())
@@ -0,0 +1,121 @@
+"""End-to-end benchmarks of the high-level :class:`Genius` methods.
+
+Usage::
+
+    python -m benchmarks.api [--latency SECONDS] [--error-rate P] [--repeat N]
+        [--transport requests|http2|httpx]
+"""
+
+import argparse
+
+from ._timing import Result, measure, report
+from .mock_server import Catalogue, MockGeniusServer
+
+
+def run(
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    repeat: int = 5,
+    songs: int = 20,
+    page_padding: int = 50,
+    transport: str = "requests",
+) -> list[Result]:
+    """Runs every API benchmark against a fresh :class:`MockGeniusServer`."""
+    catalogue = Catalogue(num_artists=3, songs_per_artist=max(songs, 1))
+    results = []
+    with MockGeniusServer(
+        catalogue, latency=latency, error_rate=error_rate, page_padding=page_padding
+    ) as server:
+        genius = server.client(transport=transport)
+        artist = catalogue.artists[1]
+        album = catalogue.albums[100]
+        urls = [catalogue.songs[i]["url"] for i in catalogue.songs_by_artist[1]]
+
+        results.append(
+            measure(
+                f"search_artist (max_songs={songs})",
+                lambda: genius.search_artist(artist["name"], max_songs=songs),
+                repeat=repeat,
+                items=songs,
+            )
+        )
+        results.append(
+            measure(
+                "search_artist (max_songs=0)",
+                lambda: genius.search_artist(artist["name"], max_songs=0),
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                "search_album",
+                lambda: genius.search_album(album["name"], artist["name"]),
+                repeat=repeat,
+                items=len(urls),
+            )
+        )
+        results.append(
+            measure(
+                "search_song",
+                lambda: genius.search_song("Mock Song 1", artist["name"]),
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                "lyrics (single page)",
+                lambda: genius.lyrics(song_url=urls[0]),
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                f"bulk lyrics ({len(urls)} pages)",
+                lambda: [genius.lyrics(song_url=url) for url in urls],
+                repeat=repeat,
+                items=len(urls),
+            )
+        )
+        results.append(
+            measure(
+                f"iter_lyrics ({len(urls)} pages)",
+                lambda: list(genius.iter_lyrics(urls, fetch_workers=8)),
+                repeat=repeat,
+                items=len(urls),
+            )
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.api")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--songs", type=int, default=20)
+    parser.add_argument(
+        "--page-padding",
+        type=int,
+        default=50,
+        help="Kilobytes of extra markup in each lyrics page.",
+    )
+    parser.add_argument(
+        "--transport",
+        default="requests",
+        help="Transport of the client (requests, http2 or httpx).",
+    )
+    args = parser.parse_args()
+    report(
+        run(
+            latency=args.latency,
+            error_rate=args.error_rate,
+            repeat=args.repeat,
+            songs=args.songs,
+            page_padding=args.page_padding,
+            transport=args.transport,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
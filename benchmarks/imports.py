@@ -0,0 +1,84 @@
+"""Benchmarks of the time taken to import lyricsgenius.
+
+Each statement runs in a fresh interpreter, like a short-lived CLI or
+serverless invocation would. The time taken by an interpreter that imports
+nothing is reported first, as a baseline.
+
+Usage::
+
+    python -m benchmarks.imports [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+from ._timing import Result, measure, report
+
+STATEMENTS = {
+    "python (baseline)": "pass",
+    "import lyricsgenius": "import lyricsgenius",
+    "from lyricsgenius import Genius": "from lyricsgenius import Genius",
+    "Genius + lyrics parsing": (
+        "from lyricsgenius import Genius; "
+        "Genius('token').parse_lyrics_html('<html></html>')"
+    ),
+}
+
+# Modules that importing the package alone must not import
+HEAVY_MODULES = ("requests", "bs4", "webbrowser", "lyricsgenius.genius")
+
+# Modules that importing Genius must not import, they're only imported by
+# the methods that use them
+DEFERRED_MODULES = (
+    "bs4",
+    "webbrowser",
+    "multiprocessing",
+    "concurrent.futures",
+    "msgspec",
+    "sqlite3",
+    "difflib",
+    "lyricsgenius.archive",
+    "lyricsgenius.cache",
+)
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Returns the modules that are imported after running a statement."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+def run(repeat: int = 10) -> list[Result]:
+    """Times each statement in :data:`STATEMENTS`."""
+    return [
+        measure(
+            name,
+            lambda statement=statement: subprocess.run(
+                [sys.executable, "-c", statement], check=True
+            ),
+            repeat=repeat,
+        )
+        for name, statement in STATEMENTS.items()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.imports")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    report(run(repeat=args.repeat))
+    heavy = loaded_modules("import lyricsgenius").intersection(HEAVY_MODULES)
+    if heavy:
+        print(f"\nimport lyricsgenius imports {', '.join(sorted(heavy))}")
+    statement = "from lyricsgenius import Genius"
+    deferred = loaded_modules(statement).intersection(DEFERRED_MODULES)
+    if deferred:
+        print(f"\n{statement} imports {', '.join(sorted(deferred))}")
+
+
+if __name__ == "__main__":
+    main()
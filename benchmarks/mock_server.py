@@ -0,0 +1,462 @@
+"""A local HTTP stand-in for the Genius API, public API and web pages.
+
+The server generates a small synthetic catalogue (artists, albums and songs)
+and serves it in the same shape as the real endpoints used by
+:class:`lyricsgenius.Genius`. Latency and error rates can be configured to
+simulate a slow or flaky upstream.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Collection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from lyricsgenius import Genius
+
+GENIUS_WEB = "https://genius.com/"
+
+
+def _slug(s: str) -> str:
+    return re.sub(r"\s+", "-", s.strip()).capitalize()
+
+
+class Catalogue:
+    """Synthetic artists, albums and songs served by :class:`MockGeniusServer`.
+
+    Args:
+        num_artists (:obj:`int`): Number of artists to generate.
+        songs_per_artist (:obj:`int`): Number of songs for each artist.
+        verses (:obj:`int`): Number of verses in each song's lyrics.
+    """
+
+    def __init__(
+        self, num_artists: int = 5, songs_per_artist: int = 50, verses: int = 4
+    ) -> None:
+        self.verses = verses
+        self.artists: dict[int, dict[str, Any]] = {}
+        self.songs: dict[int, dict[str, Any]] = {}
+        self.albums: dict[int, dict[str, Any]] = {}
+        self.songs_by_artist: dict[int, list[int]] = {}
+        self.songs_by_path: dict[str, int] = {}
+        self.songs_by_page_path: dict[str, int] = {}
+
+        for a in range(1, num_artists + 1):
+            name = f"Mock Artist {a}"
+            artist = {
+                "id": a,
+                "name": name,
+                "api_path": f"/artists/{a}",
+                "url": f"{GENIUS_WEB}artists/{_slug(name)}",
+                "header_image_url": "https://example.com/header.jpg",
+                "image_url": "https://example.com/image.jpg",
+                "is_meme_verified": False,
+                "is_verified": True,
+            }
+            self.artists[a] = artist
+
+            album_id = a * 100
+            album_name = f"Mock Album {a}"
+            album = {
+                "id": album_id,
+                "name": album_name,
+                "full_title": f"{album_name} by {name}",
+                "name_with_artist": f"{album_name} ({name})",
+                "api_path": f"/albums/{album_id}",
+                "url": f"{GENIUS_WEB}albums/{_slug(name)}/{_slug(album_name)}",
+                "cover_art_url": "https://example.com/cover.jpg",
+                "cover_art_thumbnail_url": "https://example.com/cover-thumb.jpg",
+                "release_date_components": {"year": 2020, "month": 1, "day": a},
+                "artist": artist,
+            }
+            self.albums[album_id] = album
+
+            ids = []
+            for n in range(1, songs_per_artist + 1):
+                song_id = a * 10000 + n
+                title = f"Mock Song {n}"
+                path = f"/{_slug(name)}-{_slug(title).lower()}-lyrics"
+                self.songs[song_id] = {
+                    "id": song_id,
+                    "title": title,
+                    "full_title": f"{title} by {name}",
+                    "title_with_featured": title,
+                    "path": path,
+                    "api_path": f"/songs/{song_id}",
+                    "url": GENIUS_WEB + path[1:],
+                    "lyrics_state": "complete",
+                    "instrumental": False,
+                    "annotation_count": n % 7,
+                    "pyongs_count": n % 5,
+                    "lyrics_owner_id": 1,
+                    "header_image_url": "https://example.com/header.jpg",
+                    "header_image_thumbnail_url": "https://example.com/thumb.jpg",
+                    "song_art_image_url": "https://example.com/art.jpg",
+                    "song_art_image_thumbnail_url": "https://example.com/art-t.jpg",
+                    "primary_artist": artist,
+                    "primary_artists": [artist],
+                    "featured_artists": [],
+                    "writer_artists": [],
+                    "producer_artists": [],
+                    "album": {k: v for k, v in album.items() if k != "artist"},
+                }
+                self.songs_by_path[path[1:]] = song_id
+                slug = _slug(name)
+                page_path = path[1:].replace(slug + "-", slug + "/")
+                self.songs_by_page_path["/songs/" + page_path[: -len("-lyrics")]] = (
+                    song_id
+                )
+                ids.append(song_id)
+            self.songs_by_artist[a] = ids
+
+    def lyrics_html(self, song_id: int, padding: int = 0) -> str:
+        """Renders a song page with lyrics containers like the ones on genius.com.
+
+        Args:
+            song_id (:obj:`int`): ID of the song.
+            padding (:obj:`int`): Approximate number of kilobytes of unrelated
+                markup to add around the lyrics, to mimic real page sizes.
+        """
+        song = self.songs[song_id]
+        containers = []
+        for v in range(1, self.verses + 1):
+            lines = "<br/>".join(
+                f"Line {i} of verse {v} in <i>{song['title']}</i>" for i in range(8)
+            )
+            containers.append(
+                '<div data-lyrics-container="true" class="Lyrics__Container">'
+                f"[Verse {v}]<br/>{lines}<br/><br/>"
+                '<span data-exclude-from-selection="true">Embed</span>'
+                "</div>"
+            )
+        filler = '<div class="filler"><a href="/x">related</a><p>filler</p></div>'
+        pad = filler * (padding * 1024 // len(filler))
+        return (
+            "<!DOCTYPE html><html><head>"
+            f"<title>{song['full_title']} | Genius Lyrics</title></head><body>"
+            f"{pad}"
+            '<div id="lyrics-root">'
+            '<div class="LyricsHeader__Container">'
+            f"{song['title']} Lyrics</div>" + "".join(containers) + "</div>"
+            f"{pad}</body></html>"
+        )
+
+    def lyrics_fragment(self, song_id: int) -> str:
+        """Renders the lyrics of a song like the ``lyrics_data`` of its page data."""
+        song = self.songs[song_id]
+        paragraphs = []
+        for v in range(1, self.verses + 1):
+            lines = "".join(
+                f"<br>\nLine {i} of verse {v} in <i>{song['title']}</i>"
+                for i in range(8)
+            )
+            paragraphs.append(f"<p>[Verse {v}]{lines}</p>")
+        return "\n\n".join(paragraphs)
+
+    def tag_html(self, page: int = 1) -> str:
+        """Renders a page of the songs tagged ``mock`` (every song), 20 per page.
+
+        Every third song features the next artist, like ``(Ft. X)`` on Genius.
+        """
+        ids = list(self.songs)[(page - 1) * 20 : page * 20]
+        items = []
+        for song_id in ids:
+            song = self.songs[song_id]
+            artist = song["primary_artist"]["name"].replace(" ", "\xa0")
+            featuring = ""
+            if song_id % 3 == 0:
+                guest = self.artists[
+                    song["primary_artist"]["id"] % len(self.artists) + 1
+                ]
+                featuring = f" (Ft.\xa0<span>{guest['name']}</span>)"
+            items.append(
+                f'<li><a href="{song["url"]}" class="song_link">'
+                '<span class="title_with_artists">'
+                f'<span class="song_title">{song["title"]}</span>'
+                f' by <span class="artist_name">{artist}</span>{featuring}'
+                "</span></a></li>"
+            )
+        return (
+            "<!DOCTYPE html><html><head><title>Mock | Genius</title></head><body>"
+            '<div class="header"><a href="/">Genius</a></div>'
+            f'<ul class="song_list primary_list">{"".join(items)}</ul>'
+            "</body></html>"
+        )
+
+    def search(self, q: str) -> dict[str, list[dict[str, Any]]]:
+        """Returns hits for each item type matching the query."""
+        q = q.lower()
+        artists = [
+            {"index": "artist", "type": "artist", "result": a}
+            for a in self.artists.values()
+            if a["name"].lower() in q or q in a["name"].lower()
+        ]
+        albums = [
+            {"index": "album", "type": "album", "result": a}
+            for a in self.albums.values()
+            if a["name"].lower() in q or q in a["name"].lower()
+        ]
+        songs = [
+            {"index": "song", "type": "song", "result": s}
+            for s in self.songs.values()
+            if s["title"].lower() in q or q in s["title"].lower()
+        ]
+        # Exact title matches first, like Genius' relevance ordering
+        songs.sort(key=lambda h: not q.startswith(h["result"]["title"].lower()))
+        return {"song": songs, "artist": artists, "album": albums}
+
+
+class MockGeniusServer:
+    """Serves a :class:`Catalogue` over HTTP on localhost.
+
+    Use it as a context manager, then create clients with :meth:`client`,
+    which points every request root of :class:`Genius` at this server.
+
+    Args:
+        catalogue (:class:`Catalogue`, optional): Data to serve.
+        latency (:obj:`float`, optional): Seconds to wait before each response.
+        error_rate (:obj:`float`, optional): Probability (0-1) of answering a
+            request with a 500 error.
+        page_padding (:obj:`int`, optional): Kilobytes of extra markup added
+            to each lyrics page.
+        seed (:obj:`int`, optional): Seed for the error generator.
+        token_quota (:obj:`int`, optional): Number of requests each access
+            token may make. Later requests get a 429 response.
+        revoked_tokens (:obj:`Collection`, optional): Access tokens whose
+            requests get a 401 response.
+
+    Attributes:
+        tokens (:obj:`Counter`): Number of requests made with each token.
+
+    Examples:
+        .. code:: python
+
+            with MockGeniusServer(latency=0.05) as server:
+                genius = server.client()
+                artist = genius.search_artist("Mock Artist 1", max_songs=5)
+    """
+
+    def __init__(
+        self,
+        catalogue: Catalogue | None = None,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        page_padding: int = 0,
+        seed: int = 0,
+        token_quota: int | None = None,
+        revoked_tokens: Collection[str] = (),
+    ) -> None:
+        self.catalogue = catalogue if catalogue is not None else Catalogue()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.page_padding = page_padding
+        self.token_quota = token_quota
+        self.revoked_tokens = frozenset(revoked_tokens)
+        self.requests = 0
+        self.errors = 0
+        self.tokens: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Root URL of the running server."""
+        assert self._httpd is not None, "Server is not running."
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def start(self) -> "MockGeniusServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def handle(self) -> None:
+                try:
+                    super().handle()
+                except ConnectionError:
+                    pass  # The client gave up, e.g. it timed out
+
+            def do_GET(self) -> None:
+                server._handle(self)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockGeniusServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def client(self, **kwargs: Any) -> Genius:
+        """Returns a :class:`Genius` instance that talks to this server."""
+        kwargs.setdefault("sleep_time", 0)
+        kwargs.setdefault("access_token", "mock-token")
+        genius = Genius(**kwargs)
+        genius.API_ROOT = self.url
+        genius.PUBLIC_API_ROOT = self.url + "api/"
+        genius.WEB_ROOT = self.url
+        return genius
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        token = (handler.headers.get("authorization") or "").removeprefix("Bearer ")
+        with self._lock:
+            self.requests += 1
+            fail = self._random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+            if token:
+                self.tokens[token] += 1
+            used = self.tokens[token]
+        if token in self.revoked_tokens:
+            self._send_json(handler, 401, {"meta": {"status": 401}})
+            return
+        if token and self.token_quota is not None and used > self.token_quota:
+            body = {"meta": {"status": 429}}
+            self._send_json(handler, 429, body, {"Retry-After": "60"})
+            return
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            self._send_json(handler, 500, {"meta": {"status": 500}})
+            return
+
+        url = urlparse(handler.path)
+        path = url.path.strip("/")
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if path.startswith("api/"):
+            path = path[len("api/") :]
+
+        song_id = self.catalogue.songs_by_path.get(path)
+        if song_id is not None:
+            html = self.catalogue.lyrics_html(song_id, self.page_padding)
+            self._send(handler, 200, html.encode("utf-8"), "text/html")
+            return
+
+        if path == "tags/mock/all":
+            html = self.catalogue.tag_html(int(query.get("page") or 1))
+            self._send(handler, 200, html.encode("utf-8"), "text/html")
+            return
+
+        response = self._route(path, query)
+        if response is None:
+            self._send_json(handler, 404, {"meta": {"status": 404}})
+        else:
+            self._send_json(
+                handler, 200, {"meta": {"status": 200}, "response": response}
+            )
+
+    def _route(self, path: str, query: dict[str, str]) -> dict[str, Any] | None:
+        c = self.catalogue
+        parts = path.split("/")
+        per_page = int(query.get("per_page") or 20)
+        page = int(query.get("page") or 1)
+
+        def paginate(items: list[Any]) -> tuple[list[Any], int | None]:
+            start = (page - 1) * per_page
+            chunk = items[start : start + per_page]
+            next_page = page + 1 if start + per_page < len(items) else None
+            return chunk, next_page
+
+        match parts:
+            case ["songs", id_] if int(id_) in c.songs:
+                return {"song": c.songs[int(id_)]}
+            case ["artists", id_] if int(id_) in c.artists:
+                return {"artist": c.artists[int(id_)]}
+            case ["artists", id_, "songs"] if int(id_) in c.artists:
+                ids, next_page = paginate(c.songs_by_artist[int(id_)])
+                return {"songs": [c.songs[i] for i in ids], "next_page": next_page}
+            case ["albums", id_] if int(id_) in c.albums:
+                return {"album": c.albums[int(id_)]}
+            case ["albums", id_, "tracks"] if int(id_) in c.albums:
+                album = c.albums[int(id_)]
+                ids, next_page = paginate(c.songs_by_artist[album["artist"]["id"]])
+                tracks = [
+                    {"number": n, "song": c.songs[i]}
+                    for n, i in enumerate(ids, start=(page - 1) * per_page + 1)
+                ]
+                return {"tracks": tracks, "next_page": next_page}
+            case ["search", "multi"]:
+                found = c.search(query.get("q", ""))
+                sections = []
+                top: list[dict[str, Any]] = []
+                for type_ in ("song", "artist", "album"):
+                    hits, _ = paginate(found[type_])
+                    sections.append({"type": type_, "hits": hits})
+                    top.extend(hits[:1])
+                return {"sections": [{"type": "top_hit", "hits": top[:1]}, *sections]}
+            case ["referents"] if int(query.get("song_id") or 0) in c.songs:
+                song_id = int(query["song_id"])
+                referents = [
+                    {
+                        "id": song_id * 10 + v,
+                        "api_path": f"/referents/{song_id * 10 + v}",
+                        "classification": "accepted",
+                        "fragment": f"Line 0 of verse {v}",
+                        "song_id": song_id,
+                        "annotations": [
+                            {
+                                "id": song_id * 100 + v,
+                                "body": {"plain": f"About verse {v}."},
+                                "state": "accepted",
+                                "votes_total": v,
+                                "verified": False,
+                            }
+                        ],
+                    }
+                    for v in range(1, c.verses + 1)
+                ]
+                items, _ = paginate(referents)
+                return {"referents": items}
+            case ["page_data"] if query.get("page_path") in c.songs_by_page_path:
+                song_id = c.songs_by_page_path[query["page_path"]]
+                html = c.lyrics_fragment(song_id)
+                return {"page_data": {"lyrics_data": {"body": {"html": html}}}}
+            case ["search"]:
+                hits, _ = paginate(c.search(query.get("q", ""))["song"])
+                return {"hits": hits}
+        return None
+
+    def _send_json(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        body: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self._send(handler, status, data, "application/json", headers)
+
+    @staticmethod
+    def _send(
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
@@ -0,0 +1,114 @@
+"""Micro-benchmarks for :meth:`Genius.parse_lyrics_html`.
+
+Parses a corpus of saved song pages with each available BeautifulSoup
+parser backend, and reports pages per second and peak memory.
+
+Usage::
+
+    python -m benchmarks.parsing [CORPUS_DIR] [--parsers html.parser lxml]
+
+``CORPUS_DIR`` should contain song pages saved as ``*.html`` (or gzipped
+``*.html.gz``) files. Without it, synthetic pages from the mock server's
+catalogue are used.
+"""
+
+import argparse
+import gzip
+import importlib.util
+import time
+import tracemalloc
+from pathlib import Path
+
+from lyricsgenius import Genius
+
+from .mock_server import Catalogue
+
+# BeautifulSoup parser names and the module each of them needs
+PARSERS = {"html.parser": None, "lxml": "lxml", "html5lib": "html5lib"}
+
+
+def load_corpus(directory: Path) -> list[str]:
+    """Reads every ``.html`` and ``.html.gz`` page in ``directory``."""
+    pages = []
+    for p in sorted(directory.iterdir()):
+        if p.name.endswith(".html.gz"):
+            pages.append(gzip.decompress(p.read_bytes()).decode("utf-8"))
+        elif p.suffix == ".html":
+            pages.append(p.read_text(encoding="utf-8"))
+    return pages
+
+
+def synthetic_corpus(size: int, page_padding: int) -> list[str]:
+    catalogue = Catalogue(num_artists=1, songs_per_artist=size)
+    return [catalogue.lyrics_html(i, page_padding) for i in catalogue.songs]
+
+
+def is_installed(parser: str) -> bool:
+    module = PARSERS.get(parser)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def bench_parser(
+    genius: Genius, pages: list[str], parser: str, repeat: int = 3
+) -> tuple[float, float, int]:
+    """Parses ``pages`` with ``parser``.
+
+    Returns:
+        :obj:`tuple`: pages per second (best of ``repeat`` runs),
+        peak traced memory in MiB, and the number of pages without lyrics.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            genius.parse_lyrics_html(html, parser=parser)
+        best = min(best, time.perf_counter() - start)
+
+    # Measure memory in a separate pass, tracemalloc slows parsing down
+    missing = 0
+    tracemalloc.start()
+    for html in pages:
+        if genius.parse_lyrics_html(html, parser=parser) is None:
+            missing += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(pages) / best, peak / 2**20, missing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.parsing")
+    parser.add_argument("corpus", nargs="?", type=Path, default=None)
+    parser.add_argument("--parsers", nargs="+", default=list(PARSERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=50,
+        help="Number of synthetic pages to parse when no corpus is given.",
+    )
+    parser.add_argument("--page-padding", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.corpus is not None:
+        pages = load_corpus(args.corpus)
+        source = str(args.corpus)
+    else:
+        pages = synthetic_corpus(args.synthetic, args.page_padding)
+        source = "synthetic"
+    size = sum(len(p) for p in pages) / 2**20
+    print(f"Corpus: {len(pages)} pages ({size:.1f} MiB) from {source}")
+
+    genius = Genius("benchmark-token")
+    header = f"{'parser':<14} {'pages/s':>10} {'peak MiB':>10} {'no lyrics':>10}"
+    print(header)
+    print("-" * len(header))
+    for name in args.parsers:
+        if not is_installed(name):
+            print(f"{name:<14} {'not installed':>10}")
+            continue
+        rate, peak, missing = bench_parser(genius, pages, name, repeat=args.repeat)
+        print(f"{name:<14} {rate:>10.1f} {peak:>10.1f} {missing:>10}")
+
+
+if __name__ == "__main__":
+    main()
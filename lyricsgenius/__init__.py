@@ -3,14 +3,44 @@
 # See LICENSE for details
 """A library that provides a Python interface to the Genius API"""
 
+import importlib
 import logging
 import sys
+from typing import TYPE_CHECKING, Any
 
 assert sys.version_info[0] == 3, "LyricsGenius requires Python 3."
-from lyricsgenius.api import API, PublicAPI
-from lyricsgenius.auth import OAuth2
-from lyricsgenius.genius import Genius
-from lyricsgenius.utils import auth_from_environment
+
+if TYPE_CHECKING:
+    from lyricsgenius.api import API, PublicAPI
+    from lyricsgenius.auth import OAuth2
+    from lyricsgenius.genius import Genius
+    from lyricsgenius.utils import auth_from_environment
+
+# The public classes are imported on first use, so that importing the
+# package (e.g. to use a single submodule) doesn't import requests and
+# every API mixin
+_LAZY = {
+    "API": "lyricsgenius.api",
+    "PublicAPI": "lyricsgenius.api",
+    "OAuth2": "lyricsgenius.auth",
+    "Genius": "lyricsgenius.genius",
+    "auth_from_environment": "lyricsgenius.utils",
+}
+
+__all__ = [*_LAZY, "enable_logging"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
 
 # Standard library best practice for packages: add NullHandler so that log
 # records are silently discarded unless the *application* configures logging.
@@ -1,2 +1,3 @@
 from .api import API, PublicAPI
 from .base import Sender
+from .typed_methods import TypedMethods
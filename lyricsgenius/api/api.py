@@ -1,5 +1,10 @@
+from collections.abc import Sequence
 from typing import Any, Literal
 
+from ..codec import JSONCodec
+from ..credentials import CredentialPool
+from ..proxies import ProxyPool
+from ..transports import Transport
 from ..types.types import TextFormatT
 from .base import Sender
 from .public_methods import (
@@ -33,7 +38,10 @@ class API(Sender):
     All methods of this class are available through the :class:`Genius` class.
 
     Args:
-        access_token (:obj:`str`): API key provided by Genius.
+        access_token (:obj:`str`): API key provided by Genius. Several keys
+            (a :obj:`list` or a :class:`CredentialPool
+            <lyricsgenius.credentials.CredentialPool>`) can be given to spread
+            requests over them.
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
         sleep_time (:obj:`str`, optional): time to wait between requests.
@@ -41,6 +49,18 @@ class API(Sender):
             errors with a >= 500 response code. By default, requests are only made once.
         user_agent (:obj:`str`, optional): User agent for the request header.
         proxy (:obj:`dict[str, str]`, optional): Proxy settings.
+        json_codec (:obj:`str` | :class:`JSONCodec <lyricsgenius.codec.JSONCodec>`,
+            optional): Codec used to decode responses (``orjson``, ``msgspec``
+            or ``json``). Defaults to the fastest one installed.
+        proxy_pool (:class:`ProxyPool <lyricsgenius.proxies.ProxyPool>`,
+            optional): Proxies that API requests are spread over.
+        web_proxy_pool (:class:`ProxyPool <lyricsgenius.proxies.ProxyPool>`,
+            optional): Proxies that scraped pages are spread over.
+        transport (:obj:`str` | :class:`Transport
+            <lyricsgenius.transports.Transport>`, optional): How requests are
+            sent: ``requests`` (the default), ``http2`` (httpx with HTTP/2,
+            which multiplexes concurrent requests over one connection per
+            host) or ``httpx``.
 
     Attributes:
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
@@ -48,6 +68,17 @@ class API(Sender):
         sleep_time (:obj:`str`, optional): time to wait between requests.
         retries (:obj:`int`, optional): Number of retries in case of timeouts and
             errors with a >= 500 response code. By default, requests are only made once.
+        json_codec (:class:`JSONCodec <lyricsgenius.codec.JSONCodec>`): Codec used
+            to decode responses.
+        credentials (:class:`CredentialPool
+            <lyricsgenius.credentials.CredentialPool>` \\| :obj:`None`): Tokens
+            that requests are spread over, if several were given.
+        proxy_pool (:class:`ProxyPool <lyricsgenius.proxies.ProxyPool>`
+            \\| :obj:`None`): Proxies of API requests.
+        web_proxy_pool (:class:`ProxyPool <lyricsgenius.proxies.ProxyPool>`
+            \\| :obj:`None`): Proxies of scraped pages.
+        transport (:class:`Transport <lyricsgenius.transports.Transport>`):
+            Transport that sends the requests.
 
     Returns:
         :class:`API`: An object of the `API` class.
@@ -56,13 +87,17 @@ class API(Sender):
 
     def __init__(
         self,
-        access_token: str | None = None,
+        access_token: str | Sequence[str] | CredentialPool | None = None,
         response_format: Literal["dom", "plain", "html"] = "plain",
         timeout: int = 5,
         sleep_time: float = 0.2,
         retries: int = 0,
         user_agent: str = "",
         proxy: dict[str, str] | None = None,
+        json_codec: str | JSONCodec | None = None,
+        proxy_pool: ProxyPool | None = None,
+        web_proxy_pool: ProxyPool | None = None,
+        transport: str | Transport | None = None,
     ) -> None:
         super().__init__(
             access_token=access_token,
@@ -72,6 +107,10 @@ class API(Sender):
             retries=retries,
             user_agent=user_agent,
             proxy=proxy,
+            json_codec=json_codec,
+            proxy_pool=proxy_pool,
+            web_proxy_pool=web_proxy_pool,
+            transport=transport,
         )
 
     def account(self, text_format: TextFormatT | None = None) -> dict[str, Any]:
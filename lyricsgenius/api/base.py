@@ -1,15 +1,22 @@
 import os
 import platform
 import time
+from collections.abc import Sequence
 from json.decoder import JSONDecodeError
-from typing import Any
+from typing import Any, TypeVar, cast
 
 import requests
 from requests.exceptions import HTTPError, RequestException, Timeout
 
 from ..api.protocols import RequestCapable
+from ..codec import JSONCodec, get_codec
+from ..credentials import CredentialPool
+from ..proxies import BLOCKED_STATUSES, ProxyPool
+from ..transports import Response, Transport, get_transport
 from ..types.types import ResponseFormatT
 
+T = TypeVar("T")
+
 
 class Sender(RequestCapable):
     """Sends requests to Genius."""
@@ -21,7 +28,7 @@ class Sender(RequestCapable):
 
     def __init__(
         self,
-        access_token: str | None = None,
+        access_token: str | Sequence[str] | CredentialPool | None = None,
         response_format: ResponseFormatT = "plain",
         timeout: int = 5,
         sleep_time: float = 0.2,
@@ -29,23 +36,33 @@ class Sender(RequestCapable):
         public_api_constructor: bool = False,
         user_agent: str = "",
         proxy: dict[str, str] | None = None,
+        json_codec: str | JSONCodec | None = None,
+        proxy_pool: ProxyPool | None = None,
+        web_proxy_pool: ProxyPool | None = None,
+        transport: str | Transport | None = None,
     ) -> None:
-        self._session = requests.Session()
+        self.transport = get_transport(transport)
         user_agent_root = f"{platform.system()} {platform.release()}; Python {platform.python_version()}"
-        self._session.headers = {
+        self.headers = {
             "application": "LyricsGenius",
             "User-Agent": f"({user_agent}) ({user_agent_root})"
             if user_agent
             else user_agent_root,
         }
-        if proxy:
-            self._session.proxies = proxy
+        self.proxy = proxy
+        self.proxy_pool = proxy_pool
+        self.web_proxy_pool = web_proxy_pool
         if access_token is None:
             access_token = os.environ["GENIUS_ACCESS_TOKEN"]
 
-        if public_api_constructor:
-            self.authorization_header = {}
-        else:
+        self.credentials: CredentialPool | None = None
+        self.authorization_header: dict[str, str] = {}
+        if isinstance(access_token, (list, tuple)):
+            access_token = CredentialPool(access_token)
+        if isinstance(access_token, CredentialPool):
+            # Several tokens, picked for each request
+            self.credentials = access_token
+        elif not public_api_constructor:
             if not access_token or not isinstance(access_token, str):
                 raise TypeError("Invalid token")
             self.access_token = "Bearer " + access_token
@@ -57,6 +74,7 @@ class Sender(RequestCapable):
         if retries < 0:
             raise ValueError("retries must be a non-negative integer")
         self.retries = retries
+        self.json_codec = get_codec(json_codec)
 
     def _make_request(
         self,
@@ -68,7 +86,51 @@ class Sender(RequestCapable):
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Makes a request to Genius."""
+        response = self._send(path, method, params_, public_api, web, **kwargs)
+        if web:
+            return {"html": response.text}
+        self._check_status(response)
+        response_data: dict[str, Any] = self.json_codec.loads(response.content)
+        return response_data.get("response", response_data)
+
+    def _make_typed_request(
+        self,
+        path: str,
+        type_: type[T],
+        params_: dict[str, Any] | None = None,
+        public_api: bool = False,
+    ) -> T:
+        """Makes a GET request and decodes the response into a struct.
+
+        Args:
+            path (:obj:`str`): Path of the endpoint.
+            type_: Struct type of the ``response`` object in the body
+                (see :mod:`lyricsgenius.types.structs`).
+            params_ (:obj:`dict`, optional): Query parameters.
+            public_api (:obj:`bool`, optional): Use the public API.
+
+        """
+        # msgspec is slow to import, and most uses don't need it
+        from ..types import structs
+
+        response = self._send(path, "GET", params_, public_api, False)
+        self._check_status(response)
+        envelope: Any = structs.Envelope
+        body = structs.decode(response.content, envelope[type_], self.json_codec)
+        return cast(T, body.response)
+
+    def _send(
+        self,
+        path: str,
+        method: str,
+        params_: dict[str, Any] | list[tuple[Any, Any]] | None,
+        public_api: bool,
+        web: bool,
+        **kwargs: Any,
+    ) -> Response:
+        """Sends a request, retrying it if needed."""
         header = None
+        credentials = None
         if public_api:
             uri = self.PUBLIC_API_ROOT
         elif web:
@@ -76,6 +138,8 @@ class Sender(RequestCapable):
         else:
             uri = self.API_ROOT
             header = self.authorization_header
+            credentials = self.credentials
+        proxies = self.web_proxy_pool if web else self.proxy_pool
         uri += path
         params_ = params_ if params_ else {}
 
@@ -84,25 +148,63 @@ class Sender(RequestCapable):
         tries = 0
         while response is None and tries <= self.retries:
             tries += 1
+            token = None
+            if credentials is not None:
+                token = credentials.acquire()
+                header = {"authorization": "Bearer " + token}
+            proxy = None
+            proxy_urls = self.proxy
+            if proxies is not None:
+                proxy = proxies.acquire()
+                proxy_urls = proxies.proxies(proxy)
+            started = time.monotonic()
             try:
-                response = self._session.request(
-                    method,
-                    uri,
-                    timeout=self.timeout,
-                    params=params_,
-                    headers=header,
-                    **kwargs,
-                )
+                try:
+                    response = self.transport.request(
+                        method,
+                        uri,
+                        timeout=self.timeout,
+                        params=params_,
+                        headers={**self.headers, **(header or {})},
+                        proxies=proxy_urls,
+                        **kwargs,
+                    )
+                finally:
+                    # Release the proxy however the request ended
+                    if proxies is not None and proxy is not None:
+                        status = None if response is None else response.status_code
+                        proxies.report(proxy, status, time.monotonic() - started)
             except Timeout as e:
                 error = f"Request timed out:\n{e}"
                 if tries > self.retries:
                     raise Timeout(error) from e
+            except requests.ConnectionError:
+                # The proxy may be down, another one can make the request
+                if proxies is None or proxy is None:
+                    raise
+                if not proxies.ready():
+                    raise
+                tries -= 1
             except HTTPError as e:
                 assert response is not None
                 error = get_description(e)
                 if response.status_code < 500 or tries > self.retries:
                     raise HTTPError(response.status_code, error) from e
 
+            if response is not None:
+                status = response.status_code
+                retry = False
+                if credentials is not None and token is not None:
+                    retry_after = response.headers.get("Retry-After")
+                    credentials.report(token, status, retry_after)
+                    retry = status in (401, 429) and credentials.ready()
+                if proxies is not None and proxy is not None:
+                    retry = retry or (status in BLOCKED_STATUSES and proxies.ready())
+                if retry:
+                    # Another token or proxy can make the request right away
+                    response = None
+                    tries -= 1
+
             # Enforce rate limiting
             time.sleep(self.sleep_time)
 
@@ -111,11 +213,12 @@ class Sender(RequestCapable):
                 f"Response is None after {tries} attempts (max {self.retries}). "
                 f"Request details: method={method}, uri={uri}, params={params_}."
             )
-        if web:
-            return {"html": response.text}
+        return response
+
+    @staticmethod
+    def _check_status(response: Response) -> None:
         if response.status_code == 200:
-            response_data: dict[str, Any] = response.json()
-            return response_data.get("response", response_data)
+            return
         raise AssertionError(
             f"Unexpected response status code: {response.status_code}. "
             f"Expected 200 or 204. Response body: {response.text}. "
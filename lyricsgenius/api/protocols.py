@@ -2,10 +2,12 @@
 Protocol definitions for static typing of mixin capabilities.
 """
 
-from typing import Any, Protocol
+from typing import Any, Protocol, TypeVar
 
 from ..types.types import ResponseFormatT, TextFormatT
 
+T = TypeVar("T")
+
 
 class RequestCapable(Protocol):
     response_format: ResponseFormatT
@@ -20,6 +22,14 @@ class RequestCapable(Protocol):
         **kwargs: Any,
     ) -> dict[str, Any]: ...
 
+    def _make_typed_request(
+        self,
+        path: str,
+        type_: type[T],
+        params_: dict[str, Any] | None = None,
+        public_api: bool = False,
+    ) -> T: ...
+
 
 class ChartsCapable(Protocol):
     """Interface for classes that support the .charts(...) method."""
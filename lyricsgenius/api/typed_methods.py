@@ -0,0 +1,155 @@
+from typing import TYPE_CHECKING
+
+from ..types.types import TextFormatT
+from .protocols import RequestCapable
+
+if TYPE_CHECKING:
+    from ..types.structs import (
+        AlbumData,
+        ArtistData,
+        ReferentData,
+        SearchHitData,
+        SongData,
+    )
+
+
+class TypedMethods(RequestCapable):
+    """Methods that return typed structs instead of dictionaries.
+
+    They make the same requests as the methods they're named after, but
+    only keep the fields defined in :mod:`lyricsgenius.types.structs`.
+    """
+
+    def song_data(self, song_id: int) -> "SongData":
+        """Gets data for a specific song.
+
+        Args:
+            song_id (:obj:`int`): Genius song ID
+
+        Returns:
+            :class:`SongData <lyricsgenius.types.structs.SongData>`
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token)
+                song = genius.song_data(2857381)
+                print(song.full_title, song.primary_artist.name)
+
+        """
+        from ..types import structs
+
+        return self._make_typed_request(
+            f"songs/{song_id}", structs.SongResponse, params_={"text_format": "plain"}
+        ).song
+
+    def artist_data(self, artist_id: int) -> "ArtistData":
+        """Gets data for a specific artist.
+
+        Args:
+            artist_id (:obj:`int`): Genius artist ID
+
+        Returns:
+            :class:`ArtistData <lyricsgenius.types.structs.ArtistData>`
+
+        """
+        from ..types import structs
+
+        return self._make_typed_request(
+            f"artists/{artist_id}",
+            structs.ArtistResponse,
+            params_={"text_format": "plain"},
+        ).artist
+
+    def album_data(self, album_id: int) -> "AlbumData":
+        """Gets data for a specific album.
+
+        Args:
+            album_id (:obj:`int`): Genius album ID
+
+        Returns:
+            :class:`AlbumData <lyricsgenius.types.structs.AlbumData>`
+
+        """
+        from ..types import structs
+
+        return self._make_typed_request(
+            f"albums/{album_id}",
+            structs.AlbumResponse,
+            params_={"text_format": "plain"},
+            public_api=True,
+        ).album
+
+    def search_songs_data(
+        self, search_term: str, per_page: int | None = None, page: int | None = None
+    ) -> "list[SearchHitData]":
+        """Searches songs hosted on Genius.
+
+        Args:
+            search_term (:obj:`str`): A term to search on Genius.
+            per_page (:obj:`int`, optional): Number of results to
+                return per page. It can't be more than 5 for this method.
+            page (:obj:`int`, optional): Number of the page.
+
+        Returns:
+            :obj:`list` of :class:`SearchHitData
+            <lyricsgenius.types.structs.SearchHitData>`
+
+        """
+        from ..types import structs
+
+        return self._make_typed_request(
+            "search",
+            structs.SearchResponse,
+            params_={"q": search_term, "per_page": per_page, "page": page},
+        ).hits
+
+    def referents_data(
+        self,
+        song_id: int | None = None,
+        web_page_id: int | None = None,
+        created_by_id: int | None = None,
+        per_page: int | None = None,
+        page: int | None = None,
+        text_format: TextFormatT = "plain",
+    ) -> "list[ReferentData]":
+        """Gets item's referents.
+
+        Args:
+            song_id (:obj:`int`, optional): song ID
+            web_page_id (:obj:`int`, optional): web page ID
+            created_by_id (:obj:`int`, optional): User ID of the contributor
+                who created the annotation(s).
+            per_page (:obj:`int`, optional): Number of results to
+                return per page. It can't be more than 50.
+            page (:obj:`int`, optional): Number of the page.
+            text_format (:obj:`str`, optional): Text format of the annotations
+                ('dom', 'html', 'markdown' or 'plain').
+
+        Returns:
+            :obj:`list` of :class:`ReferentData
+            <lyricsgenius.types.structs.ReferentData>`
+
+        Note:
+            You may pass only one of :obj:`song_id` and
+            :obj:`web_page_id`, not both.
+
+        """
+        msg = "Must supply `song_id`, `web_page_id`, or `created_by_id`."
+        assert any([song_id, web_page_id, created_by_id]), msg
+        msg = "Pass only one of `song_id` and `web_page_id`, not both."
+        assert not (song_id and web_page_id), msg
+
+        params = {
+            "song_id": song_id,
+            "web_page_id": web_page_id,
+            "created_by_id": created_by_id,
+            "per_page": per_page,
+            "page": page,
+            "text_format": text_format,
+        }
+        from ..types import structs
+
+        return self._make_typed_request(
+            "referents", structs.ReferentsResponse, params_=params
+        ).referents
@@ -0,0 +1,297 @@
+"""Archive of raw song page HTML, for re-extracting lyrics offline.
+
+Pages are stored gzip-compressed under the SHA-256 digest of their content,
+so identical pages are only stored once. An index file maps each page path
+(e.g. ``Andy-shauf-the-magician-lyrics``) to the digest of the last version
+that was saved for it.
+
+Lyrics in saved JSON results (see :meth:`Song.save_lyrics
+<lyricsgenius.types.Song.save_lyrics>`) can be rebuilt from the archive with
+:func:`reextract_lyrics`, or from the command line::
+
+    python -m lyricsgenius.archive ARCHIVE_DIR results/*.json --workers 8
+"""
+
+import argparse
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .codec import JSONCodec, get_codec
+from .parsing import DEFAULT_PARSER, _process_pool, extract_lyrics
+from .types.base import _write_file
+
+logger = logging.getLogger(__name__)
+
+WEB_ROOT = "https://genius.com/"
+
+
+class HTMLArchive:
+    """Content-addressed store of song page HTML.
+
+    Args:
+        directory (:obj:`str` | :obj:`Path`): Directory of the archive.
+            It is created if it doesn't exist.
+
+    Examples:
+        .. code:: python
+
+            genius = Genius(token, html_archive="pages/")
+            song = genius.search_song("The Magician", "Andy Shauf")
+
+            archive = HTMLArchive("pages/")
+            html = archive.get(song.url)
+
+    """
+
+    INDEX = "index.tsv"
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: dict[str, str] | None = None
+
+    @staticmethod
+    def key(url: str) -> str:
+        """Returns the index key of a song URL or path."""
+        return url.replace(WEB_ROOT, "").lstrip("/")
+
+    def path(self, digest: str) -> Path:
+        """Returns the location of the page with the given digest."""
+        return self.directory / digest[:2] / f"{digest}.html.gz"
+
+    @property
+    def index(self) -> dict[str, str]:
+        """Mapping of page paths to digests."""
+        with self._lock:
+            if self._index is None:
+                self._index = {}
+                index = self.directory / self.INDEX
+                if index.is_file():
+                    with index.open(encoding="utf-8") as f:
+                        for line in f:
+                            key, _, digest = line.rstrip("\n").rpartition("\t")
+                            if key:
+                                self._index[key] = digest
+            return self._index
+
+    def put(self, url: str, html: str) -> str:
+        """Stores the HTML of a page.
+
+        Args:
+            url (:obj:`str`): URL or path of the song page.
+            html (:obj:`str`): HTML of the page.
+
+        Returns:
+            :obj:`str`: Digest of the stored page.
+
+        """
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        p = self.path(digest)
+        if not p.is_file():
+            p.parent.mkdir(exist_ok=True)
+            # Write to a temporary file first so readers never see partial pages
+            fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=6))
+            os.replace(tmp, p)
+
+        key = self.key(url)
+        index = self.index
+        with self._lock:
+            if index.get(key) != digest:
+                index[key] = digest
+                with (self.directory / self.INDEX).open("a", encoding="utf-8") as f:
+                    f.write(f"{key}\t{digest}\n")
+        return digest
+
+    def digest(self, url: str) -> str | None:
+        """Returns the digest of the page saved for a URL, if any."""
+        return self.index.get(self.key(url))
+
+    def read(self, digest: str) -> str:
+        """Returns the HTML of the page with the given digest."""
+        return gzip.decompress(self.path(digest).read_bytes()).decode("utf-8")
+
+    def get(self, url: str) -> str | None:
+        """Returns the HTML saved for a URL, or `None` if there isn't any."""
+        digest = self.digest(url)
+        return self.read(digest) if digest is not None else None
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and self.key(url) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+def _extract_file(path: str, remove_section_headers: bool, parser: str) -> str | None:
+    # Runs in worker processes, so pages are read there instead of pickled
+    html = gzip.decompress(Path(path).read_bytes()).decode("utf-8")
+    return extract_lyrics(html, remove_section_headers, parser)
+
+
+def _songs_in(data: Any) -> Iterator[dict[str, Any]]:
+    """Yields the song dictionaries in saved Song, Artist or Album JSON."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _songs_in(item)
+    elif isinstance(data, dict):
+        if "songs" in data:
+            yield from _songs_in(data["songs"])
+        elif "tracks" in data:
+            yield from _songs_in([track["song"] for track in data["tracks"]])
+        elif "lyrics" in data and "url" in data:
+            yield data
+
+
+def reextract_lyrics(
+    archive: HTMLArchive | str | Path,
+    files: Iterable[str | Path],
+    remove_section_headers: bool = False,
+    workers: int | None = None,
+    parser: str = DEFAULT_PARSER,
+    output_dir: str | Path | None = None,
+    batch_size: int = 256,
+    codec: str | JSONCodec | None = None,
+) -> int:
+    """Rebuilds the lyrics in saved JSON results from archived pages.
+
+    Pages are parsed in parallel using all cores (or :obj:`workers`
+    processes). Each page is parsed once, even if several results
+    contain the same song.
+
+    Args:
+        archive (:class:`HTMLArchive` | :obj:`str` | :obj:`Path`): The archive.
+        files (:obj:`list`): JSON files saved by :meth:`save_lyrics` for
+            songs, artists or albums.
+        remove_section_headers (:obj:`bool`, optional):
+            If `True`, removes [Chorus], [Bridge], etc. headers from lyrics.
+        workers (:obj:`int`, optional): Number of processes. Defaults to
+            the number of CPUs. Pass ``1`` to parse in this process.
+        parser (:obj:`str`, optional): Parser used by BeautifulSoup.
+        output_dir (:obj:`str` | :obj:`Path`, optional): Directory for the
+            updated files. If not specified, files are updated in place.
+        batch_size (:obj:`int`, optional): Number of files loaded at a time.
+        codec (:obj:`str` | :class:`JSONCodec <lyricsgenius.codec.JSONCodec>`,
+            optional): JSON codec used to read the files. Defaults to the
+            fastest one installed. Files are always written with :mod:`json`,
+            atomically, so an interrupted run doesn't leave them truncated.
+
+    Returns:
+        :obj:`int`: Number of songs whose lyrics were re-extracted.
+
+    """
+    if not isinstance(archive, HTMLArchive):
+        archive = HTMLArchive(archive)
+    out = Path(output_dir) if output_dir is not None else None
+    if out is not None:
+        out.mkdir(parents=True, exist_ok=True)
+    paths = [Path(f) for f in files]
+    json_codec = get_codec(codec)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    pool = _process_pool(workers) if workers > 1 else None
+
+    updated = 0
+    try:
+        for start in range(0, len(paths), batch_size):
+            batch = [
+                (f, json_codec.loads(f.read_bytes()))
+                for f in paths[start : start + batch_size]
+            ]
+
+            digests = {
+                digest
+                for _, data in batch
+                for song in _songs_in(data)
+                if (digest := archive.digest(song["url"])) is not None
+            }
+            ordered = sorted(digests)
+            pages = [str(archive.path(d)) for d in ordered]
+            args = (
+                pages,
+                [remove_section_headers] * len(pages),
+                [parser] * len(pages),
+            )
+            results: Iterable[str | None]
+            if pool is None:
+                results = map(_extract_file, *args)
+            else:
+                chunksize = max(1, len(pages) // (4 * workers))
+                results = pool.map(_extract_file, *args, chunksize=chunksize)
+            lyrics = dict(zip(ordered, results, strict=True))
+
+            for f, data in batch:
+                for song in _songs_in(data):
+                    digest = archive.digest(song["url"])
+                    if digest is None:
+                        logger.debug("No archived page for %s.", song["url"])
+                        continue
+                    song["lyrics"] = lyrics[digest] or ""
+                    updated += 1
+                target = out / f.name if out is not None else f
+                _write_json(target, data)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    logger.info("Re-extracted lyrics for %d songs.", updated)
+    return updated
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Writes a saved result atomically, always with :mod:`json`."""
+    text = get_codec("json").dumps(data, indent=4)
+    _write_file(path, lambda fp: fp.write(text))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m lyricsgenius.archive",
+        description="Re-extract lyrics in saved JSON results from archived pages.",
+    )
+    parser.add_argument("archive", type=Path, help="Directory of the HTML archive.")
+    parser.add_argument("files", type=Path, nargs="+", help="Saved JSON results.")
+    parser.add_argument(
+        "--remove-section-headers",
+        action="store_true",
+        help="Remove [Chorus], [Bridge], etc. headers from lyrics.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes (defaults to the number of CPUs).",
+    )
+    parser.add_argument("--parser", default=DEFAULT_PARSER, help="HTML parser.")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Write updated files here instead of updating them in place.",
+    )
+    args = parser.parse_args()
+
+    updated = reextract_lyrics(
+        args.archive,
+        args.files,
+        remove_section_headers=args.remove_section_headers,
+        workers=args.workers,
+        parser=args.parser,
+        output_dir=args.output_dir,
+    )
+    print(f"Re-extracted lyrics for {updated} songs.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 import logging
 import os
-import webbrowser
 from typing import Any, ClassVar, Self
 from urllib.parse import urlencode
 
@@ -157,6 +156,8 @@ class OAuth2(Sender):
             :obj:`str`: User token.
 
         """
+        import webbrowser
+
         url = self.url
         logger.info("Opening browser for Genius login...")
         webbrowser.open(url)
@@ -0,0 +1,187 @@
+"""Persistent cache of resolved search terms.
+
+:meth:`Genius.search_song <lyricsgenius.Genius.search_song>`,
+:meth:`Genius.search_artist <lyricsgenius.Genius.search_artist>` and
+:meth:`Genius.search_album <lyricsgenius.Genius.search_album>` resolve names
+to IDs by searching Genius, which can take several requests. With a
+:class:`ResolutionCache`, each name is only searched once: later lookups use
+the ID that was found, and skip the search endpoints entirely.
+
+Names are normalized with :func:`clean_str <lyricsgenius.utils.clean_str>`,
+so ``"Andy Shauf"`` and ``"andy shauf!"`` share an entry.
+
+Only confident resolutions are saved (an exact match, or a ranked match that
+reaches :attr:`Genius.match_threshold <lyricsgenius.Genius.match_threshold>`),
+not the first hit a search falls back to. Entries are also keyed by the
+settings that change what a search resolves to (e.g.
+:attr:`skip_non_songs <lyricsgenius.Genius.skip_non_songs>`), so clients with
+different settings can share a cache file.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .utils import clean_str
+
+#: Default time (in seconds) before an entry expires: 30 days.
+DEFAULT_TTL = 30 * 24 * 60 * 60
+
+# Separates the search from the settings in a term. It's a control
+# character, which searches don't contain in practice.
+_SETTINGS = "\x1f"
+
+
+class ResolutionCache:
+    """SQLite-backed cache of name to ID resolutions.
+
+    Args:
+        path (:obj:`str` | :obj:`Path`, optional): Database file. It is
+            created if it doesn't exist. Defaults to an in-memory database,
+            which only lasts as long as the cache.
+        ttl (:obj:`float`, optional): Seconds before an entry expires.
+            If `None`, entries never expire.
+
+    Examples:
+        .. code:: python
+
+            genius = Genius(token, resolution_cache="resolved.sqlite")
+            artist = genius.search_artist("Andy Shauf", max_songs=3)
+
+            # The artist was renamed, search for it again next time
+            genius.resolution_cache.invalidate("artist", "Andy Shauf")
+
+    """
+
+    KINDS = ("song", "artist", "album")
+
+    def __init__(
+        self, path: str | Path = ":memory:", ttl: float | None = DEFAULT_TTL
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resolutions ("
+            " kind TEXT NOT NULL,"
+            " term TEXT NOT NULL,"
+            " id INTEGER NOT NULL,"
+            " expires REAL,"
+            " PRIMARY KEY (kind, term))"
+        )
+
+    @staticmethod
+    def key(*parts: str, settings: str = "") -> str:
+        """Returns the normalized term of a search (e.g. a title and artist)."""
+        term = "\t".join(clean_str(part) for part in parts)
+        return f"{term}{_SETTINGS}{settings}" if settings else term
+
+    def _check_kind(self, kind: str) -> None:
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {', '.join(self.KINDS)}.")
+
+    def get(self, kind: str, *parts: str, settings: str = "") -> int | None:
+        """Returns the ID a search resolved to.
+
+        Args:
+            kind (:obj:`str`): ``song``, ``artist`` or ``album``.
+            *parts (:obj:`str`): The search, e.g. the title and the artist
+                of a song.
+            settings (:obj:`str`, optional): Identifies the settings the
+                search was made with. Entries saved with other settings
+                aren't returned.
+
+        Returns:
+            :obj:`int` \\| :obj:`None`: The ID, or `None` if the search
+            isn't in the cache (or has expired).
+
+        """
+        self._check_kind(kind)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, expires FROM resolutions WHERE kind = ? AND term = ?",
+                (kind, self.key(*parts, settings=settings)),
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return None
+        return int(row[0])
+
+    def set(self, kind: str, id_: int, *parts: str, settings: str = "") -> None:
+        """Saves the ID a search resolved to.
+
+        Args:
+            kind (:obj:`str`): ``song``, ``artist`` or ``album``.
+            id_ (:obj:`int`): The ID.
+            *parts (:obj:`str`): The search.
+            settings (:obj:`str`, optional): Identifies the settings the
+                search was made with.
+
+        """
+        self._check_kind(kind)
+        expires = None if self.ttl is None else time.time() + self.ttl
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?)",
+                (kind, self.key(*parts, settings=settings), id_, expires),
+            )
+
+    def invalidate(self, kind: str | None = None, *parts: str) -> int:
+        """Removes entries from the cache.
+
+        Args:
+            kind (:obj:`str`, optional): ``song``, ``artist`` or ``album``.
+                If `None`, the whole cache is cleared.
+            *parts (:obj:`str`): The search to remove, whatever settings
+                it was made with. If not given, every entry of the
+                :obj:`kind` is removed.
+
+        Returns:
+            :obj:`int`: Number of removed entries.
+
+        """
+        query = "DELETE FROM resolutions"
+        args: tuple[str | int, ...] = ()
+        if kind is not None:
+            self._check_kind(kind)
+            query += " WHERE kind = ?"
+            args = (kind,)
+            if parts:
+                term = self.key(*parts)
+                query += " AND (term = ? OR substr(term, 1, ?) = ?)"
+                prefix = term + _SETTINGS
+                args += (term, len(prefix), prefix)
+        with self._lock:
+            return self._db.execute(query, args).rowcount
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self.invalidate()
+
+    def purge(self) -> int:
+        """Removes the expired entries.
+
+        Returns:
+            :obj:`int`: Number of removed entries.
+
+        """
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM resolutions WHERE expires <= ?", (time.time(),)
+            ).rowcount
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM resolutions").fetchone()
+        return int(count)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, ttl={self.ttl!r})"
@@ -0,0 +1,212 @@
+"""JSON encoding and decoding.
+
+`orjson <https://github.com/ijl/orjson>`_ or `msgspec
+<https://jcristharif.com/msgspec/>`_ are used when one of them is installed
+(``pip install lyricsgenius[fast]``), otherwise the standard library's
+:mod:`json` is.
+
+They decode JSON the same way, but their output differs in a few edge cases:
+
+* Floats may be written differently, e.g. ``1e+16`` and ``1.5e-07`` with
+  :mod:`json`, ``1.5e-7`` with orjson and ``1e16`` and ``1.5e-7``
+  with msgspec.
+* ``NaN`` and ``Infinity`` are written as ``null`` by orjson and msgspec.
+* orjson can't encode integers that don't fit in 64 bits.
+* With an indent of 0, msgspec writes everything on one line.
+
+Files (e.g. :meth:`Song.save_lyrics <lyricsgenius.types.Song.save_lyrics>`)
+are always written with :mod:`json`, so they don't depend on which
+packages are installed. The fast codecs are used to decode API responses and
+to encode compact JSON strings.
+
+Examples:
+    .. code:: python
+
+        from lyricsgenius.codec import get_codec
+
+        codec = get_codec()  # The fastest one available
+        print(codec.name)
+
+        # Use the standard library for API responses
+        genius = Genius(token, json_codec="json")
+
+"""
+
+import importlib.util
+import json
+import re
+import sys
+from typing import Any
+
+# json's C encoder can indent since Python 3.13, before that it falls back
+# to the much slower pure Python one
+_C_INDENT = sys.version_info >= (3, 13)
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape(match: re.Match[str]) -> str:
+    code = ord(match[0])
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 + (code >> 10):04x}\\u{0xDC00 + (code & 0x3FF):04x}"
+
+
+def _ensure_ascii(text: str) -> str:
+    """Escapes non-ASCII characters the way :func:`json.dumps` does."""
+    # Outside of strings JSON is ASCII, so every match is inside one
+    return text if text.isascii() else _NON_ASCII.sub(_escape, text)
+
+
+def _reindent(text: str, indent: int) -> str:
+    """Changes the indentation of JSON indented by 2 spaces."""
+    # Control characters are escaped in JSON strings, so there are no tabs
+    # and every newline is followed by indentation. Each level is turned into
+    # a tab first, so that deeper lines aren't matched again.
+    text = text.replace("\n  ", "\n\t")
+    while "\t  " in text:
+        text = text.replace("\t  ", "\t\t")
+    return text.replace("\t", " " * indent)
+
+
+class JSONCodec:
+    """Codec using the standard library's :mod:`json`.
+
+    Attributes:
+        name (:obj:`str`): Name of the codec.
+
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodes a JSON document.
+
+        Raises:
+            ValueError: If the document isn't valid JSON.
+
+        """
+        return json.loads(data)
+
+    def dumps(
+        self, obj: Any, indent: int | None = None, ensure_ascii: bool = True
+    ) -> str:
+        """Encodes an object as JSON.
+
+        Args:
+            obj: The object.
+            indent (:obj:`int`, optional): Indentation of the output. If `None`
+                (the default), the output is compact (no whitespace at all).
+            ensure_ascii (:obj:`bool`, optional): Escape non-ASCII characters.
+
+        Returns:
+            :obj:`str`: The JSON document.
+
+        """
+        if indent is None:
+            return json.dumps(obj, ensure_ascii=ensure_ascii, separators=(",", ":"))
+        return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(
+        self, obj: Any, indent: int | None = None, ensure_ascii: bool = True
+    ) -> str:
+        if indent not in (None, 2) and _C_INDENT:
+            # orjson can only indent by 2 spaces, changing it is slower
+            # than letting json do it
+            return super().dumps(obj, indent, ensure_ascii)
+        option = self._orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= self._orjson.OPT_INDENT_2
+        text = self._orjson.dumps(obj, option=option).decode("utf-8")
+        if indent is not None and indent != 2:
+            text = _reindent(text, indent)
+        return _ensure_ascii(text) if ensure_ascii else text
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec using msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._json = msgspec.json
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(
+        self, obj: Any, indent: int | None = None, ensure_ascii: bool = True
+    ) -> str:
+        data = self._encoder.encode(obj)
+        if indent is not None:
+            data = self._json.format(data, indent=indent)
+        text = data.decode("utf-8")
+        return _ensure_ascii(text) if ensure_ascii else text
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+_codecs: dict[str, JSONCodec] = {}
+
+
+def available_codecs() -> list[str]:
+    """Returns the names of the codecs that can be used, fastest first."""
+    return [
+        name
+        for name in CODECS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def get_codec(codec: "str | JSONCodec | None" = None) -> JSONCodec:
+    """Returns a JSON codec.
+
+    Args:
+        codec (:obj:`str` | :class:`JSONCodec`, optional): Name of the codec
+            (``orjson``, ``msgspec`` or ``json``), or a codec (which is
+            returned as is). Defaults to the fastest one available.
+
+    Returns:
+        :class:`JSONCodec`
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ImportError: If the package of the codec isn't installed.
+
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        codec = available_codecs()[0]
+    if codec not in CODECS:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, must be one of {', '.join(CODECS)}."
+        )
+    if codec not in _codecs:
+        _codecs[codec] = CODECS[codec]()
+    return _codecs[codec]
@@ -0,0 +1,224 @@
+"""Pools of access tokens.
+
+Each access token of the Genius API is rate limited on its own. A
+:class:`CredentialPool` spreads API requests over several tokens (e.g. the
+tokens of several registered apps), so their capacity adds up:
+
+* Each request uses the token that has made the fewest requests recently.
+* With a :obj:`quota`, a token isn't used for more than :obj:`quota` requests
+  per :obj:`window` seconds. When every token has reached it, requests wait
+  for the first one to be available again.
+* A token that gets a 429 response (too many requests) is cooled down for
+  the time given by the response's ``Retry-After`` header, and the request
+  is retried with another token.
+* A token that gets a 401 response (invalid or revoked token) is removed
+  from the pool, and the request is retried with another token.
+
+The :obj:`sleep_time` of :class:`Genius <lyricsgenius.Genius>` still applies
+after every request, whichever token it used.
+
+Examples:
+    .. code:: python
+
+        from lyricsgenius.credentials import CredentialPool
+
+        pool = CredentialPool([token_1, token_2, token_3], quota=100)
+        genius = Genius(pool)
+
+        # A list of tokens works too, without a quota
+        genius = Genius([token_1, token_2, token_3])
+
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from .errors import NoCredentialsError
+
+logger = logging.getLogger(__name__)
+
+#: Default cooldown (in seconds) of a token that got a 429 response without
+#: a ``Retry-After`` header.
+DEFAULT_COOLDOWN = 60.0
+
+
+class TokenUsage(NamedTuple):
+    """Usage of a token of a :class:`CredentialPool`."""
+
+    #: Last characters of the token
+    hint: str
+    #: Requests made with the token
+    requests: int
+    #: Requests made with the token in the current window
+    recent: int
+    #: 429 responses received with the token
+    throttled: int
+    #: Seconds before the token can be used again (0 if it can be used now)
+    cooldown: float
+    #: Whether the token was rejected (401) and removed from the pool
+    evicted: bool
+
+
+class _Credential:
+    __slots__ = ("token", "sent", "requests", "throttled", "until", "evicted")
+
+    def __init__(self, token: str) -> None:
+        self.token = token
+        self.sent: deque[float] = deque()
+        self.requests = 0
+        self.throttled = 0
+        self.until = 0.0
+        self.evicted = False
+
+
+class CredentialPool:
+    """Access tokens that API requests are spread over.
+
+    Args:
+        tokens (:obj:`Iterable`): The access tokens.
+        quota (:obj:`int`, optional): Maximum number of requests made with
+            each token per :obj:`window`. If `None`, tokens are only limited
+            by the 429 responses they get.
+        window (:obj:`float`, optional): Length (in seconds) of the window of
+            the quota.
+        cooldown (:obj:`float`, optional): Seconds a token isn't used for
+            after a 429 response without a ``Retry-After`` header.
+
+    Raises:
+        TypeError: If a token isn't a non-empty string.
+        ValueError: If there are no tokens.
+
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        quota: int | None = None,
+        window: float = 60.0,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        self._credentials: list[_Credential] = []
+        for token in tokens:
+            if not token or not isinstance(token, str):
+                raise TypeError("Invalid token")
+            if all(c.token != token for c in self._credentials):
+                self._credentials.append(_Credential(token))
+        if not self._credentials:
+            raise ValueError("A credential pool needs at least one token.")
+        if quota is not None and quota < 1:
+            raise ValueError("quota must be a positive integer")
+        self.quota = quota
+        self.window = window
+        self.cooldown = cooldown
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _available_at(self, credential: _Credential, now: float) -> float:
+        """Returns when a token can be used next (must hold the lock)."""
+        sent = credential.sent
+        while sent and sent[0] <= now - self.window:
+            sent.popleft()
+        at = credential.until
+        if self.quota is not None and len(sent) >= self.quota:
+            at = max(at, sent[-self.quota] + self.window)
+        return at
+
+    def acquire(self) -> str:
+        """Picks the token of the next request, waiting for one if needed.
+
+        Returns:
+            :obj:`str`: The token.
+
+        Raises:
+            NoCredentialsError: If every token was removed from the pool.
+
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                live = [c for c in self._credentials if not c.evicted]
+                if not live:
+                    raise NoCredentialsError("Every token of the pool was rejected.")
+                # Start after the last used token, so ties rotate
+                start = self._next % len(self._credentials)
+                order = self._credentials[start:] + self._credentials[:start]
+                ready = [
+                    c
+                    for c in order
+                    if not c.evicted and self._available_at(c, now) <= now
+                ]
+                if ready:
+                    credential = min(ready, key=lambda c: len(c.sent))
+                    credential.sent.append(now)
+                    credential.requests += 1
+                    self._next = self._credentials.index(credential) + 1
+                    return credential.token
+                wait = min(self._available_at(c, now) for c in live) - now
+            logger.debug("Every token is busy, waiting %.2fs", wait)
+            time.sleep(wait)
+
+    def report(
+        self, token: str, status_code: int, retry_after: str | float | None = None
+    ) -> None:
+        """Records the response to a request made with a token.
+
+        Args:
+            token (:obj:`str`): The token.
+            status_code (:obj:`int`): Status code of the response.
+            retry_after (:obj:`str` | :obj:`float`, optional): ``Retry-After``
+                header of the response, in seconds.
+
+        """
+        with self._lock:
+            credential = next(c for c in self._credentials if c.token == token)
+            if status_code == 401:
+                if not credential.evicted:
+                    logger.warning("Removing rejected token ...%s", token[-4:])
+                credential.evicted = True
+            elif status_code == 429:
+                try:
+                    delay = float(retry_after) if retry_after is not None else None
+                except ValueError:  # An HTTP date
+                    delay = None
+                if delay is None:
+                    delay = self.cooldown
+                credential.throttled += 1
+                credential.until = max(credential.until, time.monotonic() + delay)
+                logger.debug("Token ...%s throttled for %.0fs", token[-4:], delay)
+
+    def ready(self) -> bool:
+        """Returns whether a token can be used right away."""
+        with self._lock:
+            now = time.monotonic()
+            return any(
+                not c.evicted and self._available_at(c, now) <= now
+                for c in self._credentials
+            )
+
+    def usage(self) -> list[TokenUsage]:
+        """Returns the usage of each token, in the order they were given."""
+        with self._lock:
+            now = time.monotonic()
+            return [
+                TokenUsage(
+                    hint=c.token[-4:],
+                    requests=c.requests,
+                    recent=len(c.sent),
+                    throttled=c.throttled,
+                    cooldown=max(self._available_at(c, now) - now, 0.0),
+                    evicted=c.evicted,
+                )
+                for c in self._credentials
+            ]
+
+    def __len__(self) -> int:
+        """Number of tokens that weren't removed."""
+        with self._lock:
+            return sum(not c.evicted for c in self._credentials)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} tokens, quota={self.quota!r})"
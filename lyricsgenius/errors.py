@@ -1,2 +1,6 @@
 class InvalidStateError(Exception):
     """Exception for non-matching states."""
+
+
+class NoCredentialsError(Exception):
+    """Exception for credential pools whose tokens were all rejected."""
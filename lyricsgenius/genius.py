@@ -5,24 +5,52 @@
 """API documentation: https://docs.genius.com/"""
 
 import logging
+import os
 import re
-from typing import Any
-
-from bs4 import BeautifulSoup, NavigableString, Tag
-
-from .api import API, PublicAPI
-from .types import Album, Artist, Song
-from .types.types import ResponseFormatT, TextFormatT
-from .utils import clean_str, safe_unicode
+import threading
+import time
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from contextlib import closing
+from itertools import count, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from requests.exceptions import HTTPError, RequestException
+
+from .api import API, PublicAPI, TypedMethods
+from .codec import JSONCodec
+from .matching import DEFAULT_THRESHOLD, Query, SongMatch
+from .parsing import (
+    DEFAULT_PARSER,
+    _process_pool,
+    extract_fragment_lyrics,
+    extract_lyrics,
+    extract_structured_lyrics,
+    extract_tag_hits,
+)
+from .types import Album, Artist, Lyrics, Song
+from .types.types import LyricsSourceT, ResponseFormatT, TextFormatT
+from .utils import clean_str, prefetch, safe_unicode
+
+if TYPE_CHECKING:
+    from .archive import HTMLArchive
+    from .cache import ResolutionCache
+    from .credentials import CredentialPool
+    from .proxies import ProxyPool
+    from .transports import Transport
 
 logger = logging.getLogger(__name__)
 
 
-class Genius(API, PublicAPI):
+class Genius(API, PublicAPI, TypedMethods):
     """User-level interface with the Genius.com API and public API.
 
     Args:
-        access_token (:obj:`str`, optional): API key provided by Genius.
+        access_token (:obj:`str`, optional): API key provided by Genius. Several
+            keys (a :obj:`list` or a :class:`CredentialPool
+            <lyricsgenius.credentials.CredentialPool>`) can be given to spread
+            requests over them.
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
         sleep_time (:obj:`str`, optional): time to wait between requests.
@@ -41,6 +69,40 @@ class Genius(API, PublicAPI):
             errors with a >= 500 response code. By default, requests are only made once.
         user_agent (:obj:`str`, optional): User agent for the request header.
         proxy (:obj:`dict[str, str]`, optional): Proxy settings.
+        html_archive (:class:`HTMLArchive <lyricsgenius.archive.HTMLArchive>` \\|
+            :obj:`str`, optional): Archive (or its directory) where the raw HTML
+            of every scraped song page is saved, so lyrics can be re-extracted
+            later without downloading the pages again. Lyrics found in the
+            page data (see `lyrics_source`) have no song page to archive, so
+            they aren't saved.
+        json_codec (:obj:`str` | :class:`JSONCodec <lyricsgenius.codec.JSONCodec>`,
+            optional): Codec used to decode responses (``orjson``, ``msgspec``
+            or ``json``). Defaults to the fastest one installed.
+        resolution_cache (:class:`ResolutionCache <lyricsgenius.cache.ResolutionCache>`
+            \\| :obj:`str`, optional): Cache (or its database file) of the IDs
+            that searched songs, artists and albums resolved to. Cached names
+            aren't searched again.
+        match_threshold (:obj:`float`, optional): Search results for songs and
+            albums are ranked by their similarity to the searched title and
+            artist (see :mod:`lyricsgenius.matching`). This is the minimum
+            score (0-1) of the best one to be picked. If `None`, results
+            aren't ranked and only exact title matches are recognized.
+        lyrics_source (:obj:`str`, optional): Where lyrics are scraped from:
+            ``web`` (the song page, the default), ``page_data`` (the lyrics
+            fragment of :meth:`Genius.page_data`, which is much smaller, but
+            can't be found for every song) or ``auto`` (whichever has been
+            faster so far). The song page is used when the page data can't be
+            found. Only song pages are saved to the `html_archive`.
+        proxy_pool (:class:`ProxyPool <lyricsgenius.proxies.ProxyPool>`,
+            optional): Proxies that API requests are spread over.
+        web_proxy_pool (:class:`ProxyPool <lyricsgenius.proxies.ProxyPool>`,
+            optional): Proxies that scraped pages (e.g. lyrics) are spread
+            over, so that they aren't throttled by IP address.
+        transport (:obj:`str` | :class:`Transport
+            <lyricsgenius.transports.Transport>`, optional): How requests are
+            sent: ``requests`` (the default), ``http2`` (httpx with HTTP/2,
+            which multiplexes concurrent requests over one connection per
+            host) or ``httpx``.
 
     Attributes:
         remove_section_headers (:obj:`bool`, optional): If `True`, removes [Chorus],
@@ -53,6 +115,16 @@ class Genius(API, PublicAPI):
             excluded terms with user's.
         retries (:obj:`int`, optional): Number of retries in case of timeouts and
             errors with a >= 500 response code. By default, requests are only made once.
+        html_archive (:class:`HTMLArchive <lyricsgenius.archive.HTMLArchive>` \\|
+            :obj:`None`): Archive of scraped song pages.
+        resolution_cache (:class:`ResolutionCache
+            <lyricsgenius.cache.ResolutionCache>` \\| :obj:`None`): Cache of
+            resolved search terms.
+        match_threshold (:obj:`float` \\| :obj:`None`): Minimum score of
+            ranked search results.
+        lyrics_source (:obj:`str`): Where lyrics are scraped from.
+        lyrics_timings (:obj:`dict`): Average time (in seconds) taken to get
+            the lyrics of a song from each source.
 
     Returns:
         :class:`Genius`
@@ -87,9 +159,13 @@ class Genius(API, PublicAPI):
     )
     default_terms += ["(instrumental)", "[instrumental]"]
 
+    # In auto mode, the slower source is tried again every this many songs,
+    # in case it got faster
+    LYRICS_SOURCE_RETRY = 32
+
     def __init__(
         self,
-        access_token: str | None = None,
+        access_token: "str | Sequence[str] | CredentialPool | None" = None,
         response_format: ResponseFormatT = "plain",
         timeout: int = 5,
         sleep_time: float = 0.2,
@@ -101,6 +177,14 @@ class Genius(API, PublicAPI):
         user_agent: str = "",
         proxy: dict[str, str] | None = None,
         per_page: int = 5,
+        html_archive: "HTMLArchive | str | Path | None" = None,
+        json_codec: str | JSONCodec | None = None,
+        resolution_cache: "ResolutionCache | str | Path | None" = None,
+        match_threshold: float | None = DEFAULT_THRESHOLD,
+        lyrics_source: LyricsSourceT = "web",
+        proxy_pool: "ProxyPool | None" = None,
+        web_proxy_pool: "ProxyPool | None" = None,
+        transport: "str | Transport | None" = None,
     ) -> None:
         if not 1 <= per_page <= 5:
             raise ValueError(
@@ -117,11 +201,36 @@ class Genius(API, PublicAPI):
             retries=retries,
             user_agent=user_agent,
             proxy=proxy,
+            json_codec=json_codec,
+            proxy_pool=proxy_pool,
+            web_proxy_pool=web_proxy_pool,
+            transport=transport,
         )
 
         self.remove_section_headers = remove_section_headers
         self.skip_non_songs = skip_non_songs
         self.per_page = per_page
+        # The archive and the cache are only imported if they're used
+        if html_archive is not None:
+            from .archive import HTMLArchive
+
+            if not isinstance(html_archive, HTMLArchive):
+                html_archive = HTMLArchive(html_archive)
+        self.html_archive: HTMLArchive | None = html_archive
+        if resolution_cache is not None:
+            from .cache import ResolutionCache
+
+            if not isinstance(resolution_cache, ResolutionCache):
+                resolution_cache = ResolutionCache(resolution_cache)
+        self.resolution_cache: ResolutionCache | None = resolution_cache
+        self.match_threshold = match_threshold
+        if lyrics_source not in ("web", "page_data", "auto"):
+            raise ValueError("lyrics_source must be 'web', 'page_data' or 'auto'.")
+        self.lyrics_source = lyrics_source
+        self.lyrics_timings: dict[str, float] = {}
+        self._lyrics_fetches = 0
+        # Lyrics may be fetched by several threads (see Genius.match_songs)
+        self._lyrics_lock = threading.Lock()
 
         excluded_terms = excluded_terms if excluded_terms is not None else []
         if replace_default_terms:
@@ -163,54 +272,335 @@ class Genius(API, PublicAPI):
             :attr:`Genius.remove_section_headers` attribute.
 
         """
+        song_info = None
+        if not song_url and song_id:
+            song_info = self.song(song_id)["song"]
+        lyrics = self._get_lyrics(
+            self._song_path(song_id, song_url, song_info), song_info
+        )
+        if lyrics is None:
+            return None
+        if self.remove_section_headers or remove_section_headers:
+            return lyrics.headerless
+        return lyrics.text
+
+    def structured_lyrics(
+        self,
+        song_id: int | None = None,
+        song_url: str | None = None,
+    ) -> Lyrics | None:
+        """Gets the lyrics of a song split into lines and sections.
+
+        You must supply either `song_id` or `song_url`.
+
+        Args:
+            song_id (:obj:`int`, optional): Song ID.
+            song_url (:obj:`str`, optional): Song URL.
+
+        Returns:
+            :class:`Lyrics <types.Lyrics>` \\| :obj:`None`: The lyrics if they
+            can be found, otherwise `None`. Its :attr:`text` is what
+            :meth:`Genius.lyrics` returns, and :attr:`headerless` is the same
+            text without section headers.
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token)
+                lyrics = genius.structured_lyrics(song_id=4558484)
+                choruses = [
+                    lyrics.section_text(section)
+                    for section in lyrics.sections
+                    if section.header == "Chorus"
+                ]
+
+        """
+        song_info = None
+        if not song_url and song_id:
+            song_info = self.song(song_id)["song"]
+        return self._get_lyrics(
+            self._song_path(song_id, song_url, song_info), song_info
+        )
+
+    def _song_path(
+        self,
+        song_id: int | None,
+        song_url: str | None,
+        song_info: dict[str, Any] | None = None,
+    ) -> str:
+        """Returns the path of a song page from its URL or ID."""
         if song_url:
-            path = song_url.replace("https://genius.com/", "")
+            return song_url.replace("https://genius.com/", "")
+        elif song_info:
+            return str(song_info["path"][1:])
         elif song_id:
-            path = self.song(song_id)["song"]["path"][1:]
-        else:
-            raise ValueError("You must supply either `song_id` or `song_url`.")
+            return str(self.song(song_id)["song"]["path"][1:])
+        raise ValueError("You must supply either `song_id` or `song_url`.")
 
-        # Scrape the song lyrics from the HTML
-        soup = BeautifulSoup(self._make_request(path, web=True)["html"], "html.parser")
+    def _song_lyrics(self, song_info: dict[str, Any]) -> str | None:
+        """Gets the lyrics of a song from its API info.
 
-        # Remove LyricsHeader divs from the DOM
-        removes = soup.find_all("div", class_=re.compile("LyricsHeader"))
-        if removes:
-            for remove in removes:
-                remove.decompose()
+        Unlike :meth:`Genius.lyrics` with the song's URL, this can use the
+        page data of the song, if :attr:`lyrics_source` allows it.
+        """
+        if self.lyrics_source == "web":
+            return self.lyrics(song_url=song_info["url"])
+        lyrics = self._get_lyrics(self._song_path(None, song_info["url"]), song_info)
+        if lyrics is None:
+            return None
+        return lyrics.headerless if self.remove_section_headers else lyrics.text
 
-        # Find all lyrics containers
-        containers = soup.find_all("div", attrs={"data-lyrics-container": "true"})
-        if not containers:
-            logger.warning(
-                "Couldn't find the lyrics section. "
-                "Please report this if the song has lyrics.\n"
-                "Song URL: https://genius.com/%s",
-                path,
-            )
+    def _get_lyrics(
+        self, path: str, song_info: dict[str, Any] | None = None
+    ) -> Lyrics | None:
+        """Gets the lyrics of a song from the page data or the song page.
+
+        Page data needs the song's API info to be found. The time taken by
+        each source is recorded in :attr:`lyrics_timings`; a page data
+        lookup that fails counts the time of falling back to the song page.
+        """
+        start = time.perf_counter()
+        if self._lyrics_source_for(song_info) == "page_data":
+            assert song_info is not None
+            try:
+                lyrics = self._page_data_lyrics(song_info)
+            except (AssertionError, HTTPError, KeyError, TypeError) as e:
+                logger.debug("Couldn't get lyrics from page data: %s", e)
+                lyrics = None
+            if lyrics is not None:
+                self._record_lyrics_timing("page_data", start)
+                return lyrics
+            web_start = time.perf_counter()
+            lyrics = extract_structured_lyrics(self._song_page(path))
+            self._record_lyrics_timing("web", web_start)
+            self._record_lyrics_timing("page_data", start)
+        else:
+            lyrics = extract_structured_lyrics(self._song_page(path))
+            self._record_lyrics_timing("web", start)
+        if lyrics is None:
+            self._warn_no_lyrics(path)
+        return lyrics
+
+    @staticmethod
+    def _page_data_args(song_info: dict[str, Any]) -> dict[str, str] | None:
+        """Returns the arguments of :meth:`Genius.page_data` for a song.
+
+        The page data path is inferred from the song's path and the slug of
+        its primary artist, so it's `None` if the path doesn't start with it.
+        """
+        path = song_info.get("path") or ""
+        artist_url = (song_info.get("primary_artist") or {}).get("url") or ""
+        slug = artist_url.rstrip("/").rpartition("/")[2]
+        if not slug or not path.startswith(f"/{slug}-") or not path.endswith("-lyrics"):
             return None
+        return {"artist": slug, "song": path}
+
+    def _page_data_lyrics(self, song_info: dict[str, Any]) -> Lyrics | None:
+        args = self._page_data_args(song_info)
+        assert args is not None
+        page_data = self.page_data(**args)["page_data"]
+        return extract_fragment_lyrics(page_data["lyrics_data"]["body"]["html"])
+
+    def _lyrics_source_for(self, song_info: dict[str, Any] | None) -> str:
+        """Picks where to get the lyrics of a song from."""
+        if (
+            self.lyrics_source == "web"
+            or song_info is None
+            or self._page_data_args(song_info) is None
+        ):
+            return "web"
+        if self.lyrics_source == "page_data":
+            return "page_data"
+        with self._lyrics_lock:
+            self._lyrics_fetches += 1
+            fetches = self._lyrics_fetches
+            timings = self.lyrics_timings.copy()
+        for source in ("page_data", "web"):
+            if source not in timings:
+                return source
+        fastest, slowest = sorted(timings, key=timings.__getitem__)
+        return slowest if fetches % self.LYRICS_SOURCE_RETRY == 0 else fastest
+
+    def _record_lyrics_timing(self, source: str, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        with self._lyrics_lock:
+            previous = self.lyrics_timings.get(source)
+            # Moving average, so that the choice follows changes in latency
+            self.lyrics_timings[source] = (
+                elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+            )
 
-        # Extract and join the lyrics
-        lyrics = ""
-        for container in containers:
-            assert isinstance(container, Tag)
-            if not container.contents:
-                lyrics += "\n"
-                continue
-            for element in container.contents:
-                assert isinstance(element, (Tag, NavigableString))
-                if element.name == "br":
-                    lyrics += "\n"
-                elif isinstance(element, NavigableString):
-                    lyrics += str(element)
-                elif element.get("data-exclude-from-selection") != "true":
-                    lyrics += element.get_text(separator="\n")
-
-        # Remove [Verse], [Bridge], etc.
-        if self.remove_section_headers or remove_section_headers:
-            lyrics = re.sub(r"(\[.*?\])*", "", lyrics)
-            lyrics = re.sub("\n{2}", "\n", lyrics)  # Gaps between verses
-        return lyrics.strip("\n")
+    def _song_page(self, path: str) -> str:
+        """Downloads the HTML of a song page, saving it to the archive."""
+        html: str = self._make_request(path, web=True)["html"]
+        if self.html_archive is not None:
+            self.html_archive.put(path, html)
+        return html
+
+    @staticmethod
+    def _warn_no_lyrics(path: str) -> None:
+        logger.warning(
+            "Couldn't find the lyrics section. "
+            "Please report this if the song has lyrics.\n"
+            "Song URL: https://genius.com/%s",
+            path,
+        )
+
+    def iter_lyrics(
+        self,
+        song_urls: Iterable[str],
+        fetch_workers: int = 4,
+        parse_workers: int | None = None,
+        remove_section_headers: bool = False,
+        parser: str = DEFAULT_PARSER,
+    ) -> Generator[str | None, None, None]:
+        """Downloads and parses the lyrics of many songs in parallel.
+
+        Song pages are downloaded by a pool of threads, and their HTML
+        is handed to a pool of processes that extracts the lyrics, so
+        parsing isn't limited to a single core. The lyrics are yielded
+        in the same order as :obj:`song_urls`.
+
+        Args:
+            song_urls (:obj:`list`): URLs of the songs.
+            fetch_workers (:obj:`int`, optional): Number of threads downloading
+                pages.
+            parse_workers (:obj:`int`, optional): Number of processes parsing
+                pages. Defaults to the number of CPUs. If ``0``, pages are
+                parsed by the downloading threads instead.
+            remove_section_headers (:obj:`bool`, optional):
+                If `True`, removes [Chorus], [Bridge], etc. headers from lyrics.
+            parser (:obj:`str`, optional): Parser used by BeautifulSoup.
+
+        Yields:
+            :obj:`str` \\| :obj:`None`: The lyrics of each song, or `None`
+            if they couldn't be found.
+
+        Note:
+            Each download thread waits :attr:`sleep_time` seconds after
+            every request, so up to :obj:`fetch_workers` requests are made
+            at the same time.
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token)
+                artist = genius.search_artist("Andy Shauf", max_songs=0)
+                songs = genius.artist_songs(artist.id, per_page=50)["songs"]
+                urls = [song["url"] for song in songs]
+                for url, lyrics in zip(urls, genius.iter_lyrics(urls)):
+                    print(url, len(lyrics or ""))
+
+        """
+        remove_section_headers = self.remove_section_headers or remove_section_headers
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+        # Bound the number of pages held in memory at any time
+        window = 2 * (fetch_workers + parse_workers)
+
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        fetchers = ThreadPoolExecutor(fetch_workers)
+        parsers = _process_pool(parse_workers) if parse_workers else None
+
+        def fetch_and_parse(path: str) -> str | None:
+            html = self._song_page(path)
+            return extract_lyrics(html, remove_section_headers, parser)
+
+        def parse_elsewhere(path: str) -> "Future[str | None]":
+            # Chains the download (in a thread) to the parsing (in a process)
+            assert parsers is not None
+            out: Future[str | None] = Future()
+
+            def forward(f: "Future[Any]") -> bool:
+                """Passes a failure on to `out`, returns True if there was one."""
+                if f.cancelled():
+                    out.cancel()
+                elif (error := f.exception()) is not None:
+                    out.set_exception(error)
+                else:
+                    return False
+                return True
+
+            def parsed(f: "Future[str | None]") -> None:
+                if not forward(f):
+                    out.set_result(f.result())
+
+            def fetched(f: "Future[str]") -> None:
+                if forward(f):
+                    return
+                try:
+                    parsers.submit(
+                        extract_lyrics, f.result(), remove_section_headers, parser
+                    ).add_done_callback(parsed)
+                except RuntimeError as e:  # The pool was shut down
+                    out.set_exception(e)
+
+            fetchers.submit(self._song_page, path).add_done_callback(fetched)
+            return out
+
+        pending: deque[tuple[str, Future[str | None]]] = deque()
+        urls = iter(song_urls)
+        try:
+            while True:
+                for url in islice(urls, window - len(pending)):
+                    path = url.replace("https://genius.com/", "")
+                    if parsers is None:
+                        pending.append((path, fetchers.submit(fetch_and_parse, path)))
+                    else:
+                        pending.append((path, parse_elsewhere(path)))
+                if not pending:
+                    break
+                path, future = pending.popleft()
+                lyrics = future.result()
+                if lyrics is None:
+                    self._warn_no_lyrics(path)
+                yield lyrics
+        finally:
+            fetchers.shutdown(cancel_futures=True)
+            if parsers is not None:
+                parsers.shutdown(cancel_futures=True)
+
+    def parse_lyrics_html(
+        self,
+        html: str,
+        remove_section_headers: bool = False,
+        parser: str = DEFAULT_PARSER,
+    ) -> str | None:
+        """Extracts the lyrics from the HTML of a Genius song page.
+
+        This is the parsing step of :meth:`Genius.lyrics`, without the
+        request. Use it on pages you've already downloaded.
+
+        Args:
+            html (:obj:`str`): HTML of the song page.
+            remove_section_headers (:obj:`bool`, optional):
+                If `True`, removes [Chorus], [Bridge], etc. headers from lyrics.
+            parser (:obj:`str`, optional): Parser used by BeautifulSoup
+                (e.g. ``html.parser``, ``lxml`` or ``html5lib``).
+
+        Returns:
+            :obj:`str` \\| :obj:`None`:
+                :obj:`str` If it can find the lyrics, otherwise `None`
+
+        Note:
+            This method removes the song headers based on the value of the
+            :attr:`Genius.remove_section_headers` attribute.
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token)
+                with open("saved_page.html") as f:
+                    lyrics = genius.parse_lyrics_html(f.read())
+
+        """
+        return extract_lyrics(
+            html,
+            remove_section_headers=self.remove_section_headers
+            or remove_section_headers,
+            parser=parser,
+        )
 
     def _result_is_lyrics(self, song: dict[str, Any]) -> bool:
         """Returns False if result from Genius is not actually song lyrics.
@@ -244,14 +634,88 @@ class Genius(API, PublicAPI):
         regex = "|".join(re.escape(term) for term in self.excluded_terms)
         return not re.search(regex, song["title"], flags=re.IGNORECASE)
 
+    @staticmethod
+    def _search_hits(response: dict[str, Any], type_: str) -> Iterator[dict[str, Any]]:
+        """Yields the results of a type from a :meth:`Genius.search_all` response.
+
+        Top hits of the type come first, then the hits of the type's own
+        section. Hits of the type in other sections (e.g. songs in the
+        lyrics section) come last, so they're only reached if nothing
+        before them matched.
+        """
+        sections = response["sections"]
+        for hit in sections[0]["hits"]:
+            if hit["index"] == type_:
+                yield hit["result"]
+        for section in sections[1:]:
+            if section["type"] == type_:
+                for hit in section["hits"]:
+                    yield hit["result"]
+        for section in sections[1:]:
+            if section["type"] != type_:
+                for hit in section["hits"]:
+                    if hit["index"] == type_:
+                        yield hit["result"]
+
+    def _match_search_response(
+        self,
+        response: dict[str, Any],
+        term: str,
+        type_: str,
+        result_type: str,
+        query: Query | None = None,
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Finds the item matching an already cleaned search term.
+
+        If there's a :obj:`query`, returns the best ranked hit that reaches
+        its threshold. Otherwise (or if none does), stops at the first exact
+        match, or returns the first hit (or the first one with lyrics, for
+        songs when :attr:`skip_non_songs` is set).
+
+        Returns:
+            :obj:`tuple`: The item (or `None` if there are no hits), and
+            whether it's a confident match: it matched the search term, or
+            its score reached the threshold of the :obj:`query`.
+
+        """
+        want_lyrics = type_ == "song" and self.skip_non_songs
+        hits: Iterable[dict[str, Any]] = self._search_hits(response, type_)
+        if query is not None:
+            hits = list(hits)
+            for match in query.rank(hits):
+                if match.score < query.threshold:
+                    logger.debug("No hit is a confident match for %r.", query)
+                    break
+                exact = clean_str(match.result[result_type]) == term
+                if exact or not want_lyrics or self._result_is_lyrics(match.result):
+                    return match.result, True
+
+        fallback = None
+        first = None
+        for item in hits:
+            if clean_str(item[result_type]) == term:
+                return item, True
+            if first is None:
+                first = item
+            if want_lyrics and fallback is None and self._result_is_lyrics(item):
+                fallback = item
+        return fallback or first, False
+
     def _get_item_from_search_response(
-        self, response: dict[str, Any], search_term: str, type_: str, result_type: str
+        self,
+        response: dict[str, Any],
+        search_term: str,
+        type_: str,
+        result_type: str,
+        artist: str = "",
     ) -> dict[str, Any] | None:
         """Gets the desired item from the search results.
 
         This method tries to match the `hits` of the :obj:`response` to
         the :obj:`response_term`, and if it finds no match, returns the first
-        appropriate hit if there are any.
+        appropriate hit if there are any. Songs and albums are ranked by
+        their similarity to the search term and the :obj:`artist` first,
+        unless :attr:`match_threshold` is `None`.
 
         Args:
             response (:obj:`dict`): A response from
@@ -260,45 +724,71 @@ class Genius(API, PublicAPI):
             type_ (:obj:`str`): Type of the hit we're looking for (e.g. song, artist).
             result_type (:obj:`str`): The part of the hit we want to match
                 (e.g. song title, artist's name).
+            artist (:obj:`str`, optional): The searched artist.
 
         Returns:
             :obj:`str` \\| :obj:`None`:
             - `None` if there is no hit in the :obj:`response`.
+            - The best ranked result, if it's a confident match.
             - The matched result if matching succeeds.
             - The first hit if the matching fails.
 
         """
+        item, _ = self._find_search_item(
+            response, search_term, type_, result_type, artist
+        )
+        return item
 
-        # Convert list to dictionary
-        top_hits = response["sections"][0]["hits"]
-
-        # Check rest of results if top hit wasn't the search type
-        sections = sorted(response["sections"], key=lambda sect: sect["type"] == type_)
-
-        hits: list[dict[str, Any]] = [hit for hit in top_hits if hit["index"] == type_]
-        hits.extend(
-            [
-                hit
-                for section in sections
-                for hit in section["hits"]
-                if hit["index"] == type_
-            ]
+    def _find_search_item(
+        self,
+        response: dict[str, Any],
+        search_term: str,
+        type_: str,
+        result_type: str,
+        artist: str = "",
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Like :meth:`_get_item_from_search_response`, but also returns
+        whether the item is a confident match (see
+        :meth:`_match_search_response`)."""
+        query = None
+        if self.match_threshold is not None and type_ in ("song", "album"):
+            query = Query(search_term, artist, self.match_threshold)
+        return self._match_search_response(
+            response, clean_str(search_term), type_, result_type, query
         )
 
-        for hit in hits:
-            item = hit["result"]
-            if clean_str(item[result_type]) == clean_str(search_term):
-                return item
+    def _cache_settings(self, kind: str) -> str:
+        """Identifies the settings that change what a search resolves to.
 
-        # If the desired type is song lyrics and none of the results matched,
-        # return the first result that has lyrics
-        if type_ == "song" and self.skip_non_songs:
-            for hit in hits:
-                song: dict[str, Any] = hit["result"]
-                if self._result_is_lyrics(song):
-                    return song
-
-        return hits[0]["result"] if hits else None
+        They're part of the keys of the :attr:`resolution_cache`, so clients
+        with different settings don't use each other's resolutions.
+        """
+        if kind == "artist":
+            return ""
+        settings: tuple[Any, ...] = (self.match_threshold,)
+        if kind == "song":
+            terms = tuple(self.excluded_terms) if self.skip_non_songs else ()
+            settings += (self.skip_non_songs, terms)
+        import hashlib
+
+        return hashlib.sha256(repr(settings).encode()).hexdigest()[:16]
+
+    def _search_pages(
+        self, search_term: str, max_pages: int, workers: int = 1
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yields pages of :meth:`Genius.search_all` results, in order.
+
+        With more than one worker, the next pages are requested while
+        earlier ones are being checked. Pages that were requested but not
+        needed when the caller stops are discarded.
+        """
+        yield from prefetch(
+            lambda page: self.search_all(
+                search_term, per_page=self.per_page, page=page
+            ),
+            range(1, max_pages + 1),
+            workers,
+        )
 
     def _result_is_match(
         self, result: dict[str, Any], title: str, artist: str | None = None
@@ -331,18 +821,94 @@ class Genius(API, PublicAPI):
             access to fragments (annotated text) and the corresponding
             annotations (Some fragments may have more than one annotation,
             because sometimes both artists and Genius users annotate them).
+            Every page of referents is requested, so songs with many
+            annotations take several requests.
 
         """
-        referents = self.referents(song_id=song_id, text_format=text_format)
+        return list(self.iter_song_annotations(song_id, text_format))
+
+    def iter_song_annotations(
+        self,
+        song_id: int,
+        text_format: TextFormatT | None = None,
+        page_workers: int = 1,
+        per_page: int = 50,
+    ) -> Generator[tuple[str, list[list[str]]], None, None]:
+        """Yields a song's fragments and annotations, a page at a time.
 
-        all_annotations: list[tuple[str, list[list[str]]]] = []
-        for r in referents["referents"]:
-            fragment = r["fragment"]
-            annotations = []
-            for a in r["annotations"]:
-                annotations.append([x for x in a["body"].values()])
-            all_annotations.append((fragment, annotations))
-        return all_annotations
+        This is the streaming version of :meth:`song_annotations`: the
+        first fragments are yielded as soon as their page is downloaded.
+
+        Args:
+            song_id (:obj:`int`): song ID
+            text_format (:obj:`str`, optional): Text format of the results
+                ('dom', 'html', 'markdown' or 'plain').
+            page_workers (:obj:`int`, optional): Number of pages requested
+                at once. With more than one, the next pages are downloaded
+                while earlier ones are consumed, which may request a page
+                past the last one.
+            per_page (:obj:`int`, optional): Referents per request
+                (50 at most).
+
+        Yields:
+            :obj:`tuple`: (fragment, [annotations])
+
+        """
+        pages = prefetch(
+            lambda page: self.referents(
+                song_id=song_id,
+                per_page=per_page,
+                page=page,
+                text_format=text_format,
+            )["referents"],
+            count(1),
+            page_workers,
+        )
+        with closing(pages):
+            for referents in pages:
+                for r in referents:
+                    annotations = [list(a["body"].values()) for a in r["annotations"]]
+                    yield r["fragment"], annotations
+                if len(referents) < per_page:
+                    return
+
+    def iter_annotations(
+        self,
+        song_ids: Iterable[int],
+        text_format: TextFormatT | None = None,
+        workers: int = 4,
+    ) -> Generator[tuple[int, list[tuple[str, list[list[str]]]]], None, None]:
+        """Yields the annotations of many songs, harvested concurrently.
+
+        Each song's referents are paginated like in :meth:`song_annotations`,
+        and several songs are harvested at once. Results are yielded in the
+        order of :obj:`song_ids`.
+
+        Args:
+            song_ids (:obj:`Iterable`): Song IDs. They're consumed lazily,
+                so this can be a generator.
+            text_format (:obj:`str`, optional): Text format of the results
+                ('dom', 'html', 'markdown' or 'plain').
+            workers (:obj:`int`, optional): Number of songs harvested at once.
+
+        Yields:
+            :obj:`tuple`: (song ID, list of tuples(fragment, [annotations]))
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token)
+                hits = genius.search_songs("Andy Shauf")["hits"]
+                song_ids = [hit["result"]["id"] for hit in hits]
+                for song_id, annotations in genius.iter_annotations(song_ids):
+                    print(song_id, len(annotations))
+
+        """
+        yield from prefetch(
+            lambda song_id: (song_id, self.song_annotations(song_id, text_format)),
+            song_ids,
+            workers,
+        )
 
     def search_album(
         self,
@@ -394,6 +960,11 @@ class Genius(API, PublicAPI):
             else:
                 logger.info('Searching for "%s"...', name)
 
+        cache = self.resolution_cache
+        settings = self._cache_settings("album")
+        if not album_id and name and cache is not None:
+            album_id = cache.get("album", name, artist, settings=settings)
+
         if album_id:
             album_info = self.album(album_id, text_format)["album"]
         elif name:
@@ -402,9 +973,12 @@ class Genius(API, PublicAPI):
             else:
                 search_term = "{s}".format(s=name).strip()
             response = self.search_all(search_term)
-            album_info = self._get_item_from_search_response(
-                response, name, type_="album", result_type="name"
+            album_info, confident = self._find_search_item(
+                response, name, type_="album", result_type="name", artist=artist
             )
+            # Guesses aren't cached, so they're searched again next time
+            if album_info is not None and confident and cache is not None:
+                cache.set("album", album_info["id"], name, artist, settings=settings)
         else:
             album_info = None
 
@@ -440,7 +1014,7 @@ class Genius(API, PublicAPI):
                     and song_info["lyrics_state"] == "complete"
                     and not song_info.get("instrumental")
                 ):
-                    song_lyrics = self.lyrics(song_url=song_info["url"])
+                    song_lyrics = self._song_lyrics(song_info)
 
                 if song_lyrics is None:
                     song_lyrics = ""
@@ -495,6 +1069,11 @@ class Genius(API, PublicAPI):
             else:
                 logger.info('Searching for "%s"...', title)
 
+        cache = self.resolution_cache
+        settings = self._cache_settings("song")
+        if not song_id and title and cache is not None:
+            song_id = cache.get("song", title, artist, settings=settings)
+
         if song_id:
             song_info = self.song(song_id)["song"]
         elif title:
@@ -505,8 +1084,8 @@ class Genius(API, PublicAPI):
 
             # Try search/multi first (the comprehensive search)
             search_response = self.search_all(search_term)
-            song_info = self._get_item_from_search_response(
-                search_response, title, type_="song", result_type="title"
+            song_info, confident = self._find_search_item(
+                search_response, title, type_="song", result_type="title", artist=artist
             )
 
             # If search/multi returns no results, fallback to regular /search
@@ -516,12 +1095,22 @@ class Genius(API, PublicAPI):
                 search_response = self.search(search_term)
 
                 if "hits" in search_response and search_response["hits"]:
-                    # Try to find an exact match first
+                    # Try the best ranked hit first, then an exact match
+                    if self.match_threshold is not None:
+                        query = Query(title, artist, self.match_threshold)
+                        best = query.best(
+                            hit["result"] for hit in search_response["hits"]
+                        )
+                        if best is not None:
+                            song_info, confident = best.result, True
+
+                    term = clean_str(title)
                     for hit in search_response["hits"]:
-                        result = hit["result"]
-                        if clean_str(result.get("title", "")) == clean_str(title):
-                            song_info = result
+                        if song_info is not None:
                             break
+                        result = hit["result"]
+                        if clean_str(result.get("title", "")) == term:
+                            song_info, confident = result, True
 
                     # If no exact match and we have hits, use the first one
                     if song_info is None:
@@ -533,6 +1122,10 @@ class Genius(API, PublicAPI):
                                 song_info = result
                                 break
 
+            # Guesses aren't cached, so they're searched again next time
+            if song_info is not None and confident and cache is not None:
+                cache.set("song", song_info["id"], title, artist, settings=settings)
+
         # Exit search if there were no results returned from API
         # Otherwise, move forward with processing the search results
         if song_info is None:
@@ -558,7 +1151,7 @@ class Genius(API, PublicAPI):
         if song_info["lyrics_state"] == "complete" and not song_info.get(
             "instrumental"
         ):
-            lyrics = self.lyrics(song_url=song_info["url"])
+            lyrics = self._song_lyrics(song_info)
         else:
             lyrics = ""
 
@@ -572,6 +1165,131 @@ class Genius(API, PublicAPI):
         logger.info("Done.")
         return song
 
+    def match_songs(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        fetch_lyrics: bool = False,
+        workers: int = 4,
+    ) -> list[SongMatch]:
+        """Matches many (title, artist) pairs to songs.
+
+        Pairs that are the same once cleaned (see :func:`clean_str
+        <lyricsgenius.utils.clean_str>`) are only searched once, and so are
+        pairs in the :attr:`resolution_cache`. Each search is a single
+        request to :meth:`Genius.search_all` (or :meth:`Genius.search`
+        if that has no songs), whose hits are ranked with
+        :class:`Query <lyricsgenius.matching.Query>`.
+
+        Args:
+            pairs (:obj:`list`): Titles and artists of the songs.
+            fetch_lyrics (:obj:`bool`, optional): Scrape the lyrics of the
+                matched songs. Defaults to `False`.
+            workers (:obj:`int`, optional): Number of threads making requests.
+
+        Returns:
+            :obj:`list`: A :class:`SongMatch <lyricsgenius.matching.SongMatch>`
+            for each pair, in the same order. If the requests of a pair
+            failed (e.g. a timeout or an error response), its match has no
+            song, a score of 0 and the error, and the other pairs are still
+            matched.
+
+        Note:
+            Songs are matched if their score reaches :attr:`match_threshold`
+            (or the default threshold, if it's `None`).
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token, resolution_cache="resolved.sqlite")
+                pairs = [("The Magician", "Andy Shauf"), ("Creep", "Radiohead")]
+                for match in genius.match_songs(pairs, workers=8):
+                    if match.song is not None:
+                        print(match.title, match.song.url, match.score)
+
+        """
+        from .cache import ResolutionCache
+
+        pairs = list(pairs)
+        queries: dict[str, tuple[str, str]] = {}
+        for title, artist in pairs:
+            queries.setdefault(ResolutionCache.key(title, artist), (title, artist))
+        logger.info(
+            "Matching %d songs (%d distinct searches)...", len(pairs), len(queries)
+        )
+
+        def match(
+            query: tuple[str, str],
+        ) -> tuple[Song | None, float, Exception | None]:
+            try:
+                return (*self._match_song(*query, fetch_lyrics), None)
+            except (AssertionError, RequestException, KeyError, TypeError) as e:
+                logger.warning("Couldn't match %r by %r: %s", *query, e)
+                return None, 0.0, e
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(workers) as pool:
+            results = pool.map(match, queries.values())
+            found = dict(zip(queries, results, strict=True))
+
+        matches = []
+        for title, artist in pairs:
+            song, score, error = found[ResolutionCache.key(title, artist)]
+            matches.append(SongMatch(title, artist, song, score, error))
+        logger.info(
+            "Done. Matched %d songs, %d failed.",
+            sum(m.song is not None for m in matches),
+            sum(m.error is not None for m in matches),
+        )
+        return matches
+
+    def _match_song(
+        self, title: str, artist: str, fetch_lyrics: bool
+    ) -> tuple[Song | None, float]:
+        """Finds the song best matching a title and artist, and its score."""
+        threshold = self.match_threshold
+        query = Query(
+            title, artist, DEFAULT_THRESHOLD if threshold is None else threshold
+        )
+        cache = self.resolution_cache
+        settings = self._cache_settings("song")
+        song_id = None
+        if cache is not None:
+            song_id = cache.get("song", title, artist, settings=settings)
+
+        if song_id is not None:
+            song_info = self.song(song_id)["song"]
+            score = query.score_result(song_info)
+            if score < query.threshold:
+                # It may have been found without ranking (e.g. by search_song
+                # with an exact title), search it again next time
+                assert cache is not None
+                cache.invalidate("song", title, artist)
+                return None, score
+        else:
+            search_term = f"{title} {artist}".strip()
+            hits = list(self._search_hits(self.search_all(search_term), "song"))
+            if not hits:
+                hits = [hit["result"] for hit in self.search(search_term)["hits"]]
+            song_info, score = None, 0.0
+            for i, (hit_score, result) in enumerate(query.rank(hits)):
+                if i == 0:
+                    score = hit_score
+                if hit_score < query.threshold:
+                    break
+                if not self.skip_non_songs or self._result_is_lyrics(result):
+                    song_info, score = result, hit_score
+                    break
+            if song_info is None:
+                return None, score
+            if cache is not None:
+                cache.set("song", song_info["id"], title, artist, settings=settings)
+
+        lyrics = None
+        if fetch_lyrics and song_info["lyrics_state"] == "complete":
+            lyrics = self._song_lyrics(song_info)
+        return Song(lyrics=lyrics or "", body=song_info), score
+
     def search_artist(
         self,
         artist_name: str,
@@ -583,6 +1301,7 @@ class Genius(API, PublicAPI):
         artist_id: int | None = None,
         include_features: bool = False,
         max_pages: int = 10,
+        search_workers: int = 1,
     ) -> Artist | None:
         """Searches for a specific artist and gets their songs.
 
@@ -606,6 +1325,10 @@ class Genius(API, PublicAPI):
                 featuring the artist.
             max_pages (:obj:`int`, optional): Maximum number of search-result pages
                 to check when looking for an exact artist name match. Defaults to 10.
+            search_workers (:obj:`int`, optional): Number of search-result pages
+                requested at the same time while looking for the artist. Pages
+                after the one with the match may be requested for nothing,
+                so this is only worth it for ambiguous names. Defaults to 1.
 
         Returns:
             :class:`Artist <types.Artist>`: Artist object containing
@@ -631,49 +1354,53 @@ class Genius(API, PublicAPI):
             """
             logger.info("Searching for songs by %s...", search_term)
 
+            cache = self.resolution_cache
+            if cache is not None:
+                cached_id = cache.get("artist", search_term)
+                if cached_id is not None:
+                    return cached_id
+
             # Perform a Genius API search for the artist
+            term = clean_str(search_term)
             found_artist = None
             best_candidate = (
                 None  # Best fallback: first non-null result (most relevant)
             )
-            page = 1
-            while not found_artist and page <= max_pages:
-                response = self.search_all(
-                    search_term, per_page=self.per_page, page=page
-                )
-
-                # Check artist-section hits specifically to avoid false positives
-                # from other sections (songs, albums, etc.) keeping has_more_pages True
-                artist_section = next(
-                    (s for s in response["sections"] if s["type"] == "artist"),
-                    None,
-                )
-                artist_hit_count = len(artist_section["hits"]) if artist_section else 0
-
-                if artist_hit_count == 0:
-                    break  # No artist results on this page; stop paginating
+            pages = self._search_pages(search_term, max_pages, search_workers)
+            with closing(pages):
+                for response in pages:
+                    # Check artist-section hits specifically to avoid false positives
+                    # from other sections (songs, albums, etc.) keeping has_more_pages True
+                    artist_section = next(
+                        (s for s in response["sections"] if s["type"] == "artist"),
+                        None,
+                    )
+                    artist_hit_count = (
+                        len(artist_section["hits"]) if artist_section else 0
+                    )
 
-                # Try to find a match on this page
-                candidate = self._get_item_from_search_response(
-                    response, search_term, type_="artist", result_type="name"
-                )
+                    if artist_hit_count == 0:
+                        break  # No artist results on this page; stop paginating
 
-                # Track the first non-null result as fallback (page 1 = most relevant)
-                if candidate and best_candidate is None:
-                    best_candidate = candidate
+                    # Try to find a match on this page
+                    candidate, exact = self._match_search_response(
+                        response, term, type_="artist", result_type="name"
+                    )
 
-                # Check if we got an exact match (not just a fallback)
-                if candidate and clean_str(candidate["name"]) == clean_str(search_term):
-                    found_artist = candidate
-                    break
+                    # Track the first non-null result as fallback (page 1 = most relevant)
+                    if candidate and best_candidate is None:
+                        best_candidate = candidate
 
-                # Only continue to next page if the artist section was full
-                if artist_hit_count < self.per_page:
-                    break  # Last page reached; no exact match found
+                    if exact:
+                        found_artist = candidate
+                        break
 
-                page += 1
+                    # Only continue to next page if the artist section was full
+                    if artist_hit_count < self.per_page:
+                        break  # Last page reached; no exact match found
 
             # Fall back to the most relevant candidate (from page 1) if no exact match
+            exact = found_artist is not None
             if not found_artist:
                 found_artist = best_candidate
 
@@ -681,7 +1408,10 @@ class Genius(API, PublicAPI):
             if not found_artist:
                 logger.warning("No results found for '%s'.", search_term)
                 return None
-            # Assume the top search result is the intended artist
+            # Assume the top search result is the intended artist, but only
+            # cache exact matches so that guesses are searched again next time
+            if cache is not None and exact:
+                cache.set("artist", found_artist["id"], search_term)
             return found_artist["id"]
 
         # Get the artist ID (or use the one supplied)
@@ -726,7 +1456,7 @@ class Genius(API, PublicAPI):
 
                 # Create the Song object from lyrics and metadata
                 if song_info["lyrics_state"] == "complete":
-                    lyrics = self.lyrics(song_url=song_info["url"])
+                    lyrics = self._song_lyrics(song_info)
                 else:
                     lyrics = ""
                 if get_full_info:
@@ -806,38 +1536,10 @@ class Genius(API, PublicAPI):
             )
             return None
 
-        soup = BeautifulSoup(html, "html.parser")
-        hits = []
-
-        ul = soup.find("ul", class_="song_list")
-        if ul is None:
+        hits = extract_tag_hits(html)
+        if hits is None:
             logger.warning("Couldn't find the song list for tag '%s'.", name)
             return {"hits": [], "next_page": None}
-        assert isinstance(ul, Tag)
-        for li in ul.find_all("li"):
-            assert isinstance(li, Tag)
-            a = li.a
-            assert isinstance(a, Tag)
-            url = a.attrs["href"]
-            # Genius uses \xa0 in the HTML to add spaces
-            span = a.span
-            assert isinstance(span, Tag)
-            song = [x.replace("\xa0", " ") for x in span.stripped_strings]
-            title = song[0]
-            artists = song[2].split(" & ")
-            featured_artists = [name for name in song[4:-1] if len(name) > 1]
-            element = a.find("span", class_="title_with_artists")
-            assert isinstance(element, Tag)
-            title_with_artists = element.get_text().strip().replace("\xa0", " ")
-
-            hit = {
-                "url": url,
-                "title_with_artists": title_with_artists,
-                "title": title,
-                "artists": artists,
-                "featured_artists": featured_artists,
-            }
-            hits.append(hit)
 
         res: dict[str, list[dict[str, Any]] | int | None] = {"hits": hits}
         page = page if page is not None else 1
@@ -845,3 +1547,83 @@ class Genius(API, PublicAPI):
         # Full pages contain 20 items
         res["next_page"] = page + 1 if len(hits) == 20 else None
         return res
+
+    def iter_tag(
+        self,
+        name: str,
+        fetch_lyrics: bool = False,
+        fetch_workers: int = 4,
+        page_workers: int = 2,
+        parse_workers: int | None = None,
+        max_pages: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yields every song of a tag, with their lyrics if asked to.
+
+        Tag pages are downloaded ahead of time by a pool of threads, and
+        lyrics are fetched in parallel with :meth:`Genius.iter_lyrics`,
+        but the songs are yielded in the same order as on the tag pages.
+
+        Args:
+            name (:obj:`str`): Name of the tag e.g. ``pop`` or ``r-b``
+                (see :meth:`Genius.tag`).
+            fetch_lyrics (:obj:`bool`, optional): Adds the ``lyrics`` of each
+                song to its dictionary (`None` if they couldn't be found).
+            fetch_workers (:obj:`int`, optional): Number of threads downloading
+                song pages.
+            page_workers (:obj:`int`, optional): Number of tag pages
+                downloaded at the same time.
+            parse_workers (:obj:`int`, optional): Number of processes parsing
+                song pages (see :meth:`Genius.iter_lyrics`).
+            max_pages (:obj:`int`, optional): Maximum number of tag pages.
+
+        Yields:
+            :obj:`dict`: The songs, like the ``hits`` of :meth:`Genius.tag`.
+
+        Note:
+            The number of pages isn't known in advance, so up to
+            :obj:`page_workers` - 1 pages past the last one may be requested.
+
+        Examples:
+            .. code:: python
+
+                genius = Genius(token)
+                for song in genius.iter_tag("pop", fetch_lyrics=True, max_pages=5):
+                    print(song["title_with_artists"], len(song["lyrics"] or ""))
+
+        """
+        hits = self._iter_tag_hits(name, page_workers, max_pages)
+        if not fetch_lyrics:
+            yield from hits
+            return
+
+        pending: deque[dict[str, Any]] = deque()
+
+        def urls() -> Iterator[str]:
+            for hit in hits:
+                pending.append(hit)
+                yield hit["url"]
+
+        lyrics = self.iter_lyrics(
+            urls(), fetch_workers=fetch_workers, parse_workers=parse_workers
+        )
+        with closing(lyrics):
+            for song_lyrics in lyrics:
+                hit = pending.popleft()
+                hit["lyrics"] = song_lyrics
+                yield hit
+
+    def _iter_tag_hits(
+        self, name: str, workers: int, max_pages: int | None
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yields the hits of every page of a tag, downloading pages ahead."""
+        numbers = count(1) if max_pages is None else range(1, max_pages + 1)
+        pages = prefetch(lambda page: self.tag(name, page), numbers, workers)
+        with closing(pages):
+            for response in pages:
+                if response is None:
+                    return
+                hits = response["hits"]
+                assert isinstance(hits, list)
+                yield from hits
+                if response["next_page"] is None:
+                    return
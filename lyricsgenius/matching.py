@@ -0,0 +1,265 @@
+"""Ranking of search results by similarity to a searched title and artist.
+
+Genius often returns the right song without its title matching the searched
+one exactly (e.g. ``"Creep - Remastered"`` or ``"Walk on Water (Ft. Beyoncé)"``),
+and exact matching then falls back to whatever hit came first.
+:class:`Query` scores every hit of a search instead:
+
+* Titles are compared by their words, ignoring their order and the featured
+  artists (``feat.``, ``ft.``, ``with``).
+* Versions (live, remix, acoustic, remastered...) are compared separately:
+  searching for ``"Creep"`` prefers the original over ``"Creep (Acoustic)"``,
+  and searching for ``"Creep (Acoustic)"`` prefers the acoustic version.
+* The artist is compared with the primary and the featured artists.
+
+Scores range from 0 to 1. Hits scoring less than the threshold
+(:data:`DEFAULT_THRESHOLD` by default) aren't considered matches.
+
+Examples:
+    .. code:: python
+
+        from lyricsgenius.matching import Query
+
+        query = Query("Walk on Water", "Eminem")
+        hits = genius.search_all("walk on water eminem")["sections"][1]["hits"]
+        best = query.best([hit["result"] for hit in hits])
+        if best is not None:
+            print(best.score, best.result["full_title"])
+
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from .types import Song
+from .utils import clean_str
+
+#: Minimum score of a match.
+DEFAULT_THRESHOLD = 0.8
+
+# Words marking a different version of a song
+VERSION_WORDS = frozenset(
+    {
+        "acoustic",
+        "demo",
+        "edit",
+        "extended",
+        "instrumental",
+        "live",
+        "mix",
+        "remaster",
+        "remastered",
+        "remix",
+        "remixed",
+        "reprise",
+        "session",
+        "unplugged",
+        "version",
+    }
+)
+
+# Version words with the same meaning
+_VERSION_ALIASES = {"remastered": "remaster", "remixed": "remix"}
+
+# "(feat. X)", "[Ft. X]" or a trailing "featuring X"
+_FEATURING = re.compile(
+    r"[(\[]\s*(?:feat\.?|ft\.?|featuring|with)\s[^)\]]*[)\]]"
+    r"|\s(?:feat\.?|ft\.?|featuring)\s.*$",
+    re.IGNORECASE,
+)
+# "(Live at X)", "[Remix]" or " - 2011 Remaster"
+_SUFFIX = re.compile(r"[(\[][^)\]]*[)\]]|\s-\s.*$")
+_ARTIST_SEPARATORS = re.compile(
+    r"\s*(?:,|&|\+|\band\b|\bx\b|\bfeat\.?|\bft\.?|\bfeaturing\b|\bwith\b)\s*",
+    re.IGNORECASE,
+)
+
+# Share of the title score that depends on the artist, when one was searched:
+# the right title by the wrong artist scores 1 - ARTIST_WEIGHT
+ARTIST_WEIGHT = 0.5
+# Factor applied to the title score of a different version
+VERSION_PENALTY = 0.85
+
+
+class Match(NamedTuple):
+    """A search result and its score."""
+
+    score: float
+    result: dict[str, Any]
+
+
+class SongMatch(NamedTuple):
+    """Result of matching a searched title and artist to a song.
+
+    Returned by :meth:`Genius.match_songs <lyricsgenius.Genius.match_songs>`.
+    """
+
+    title: str
+    artist: str
+    #: The song, or `None` if no result reached the threshold
+    song: "Song | None"
+    #: Score of the best result (0 if there were none)
+    score: float
+    #: The error the search failed with, if it did
+    error: Exception | None = None
+
+
+class _Title(NamedTuple):
+    words: str
+    versions: frozenset[str]
+
+
+@lru_cache(maxsize=4096)
+def _parse_title(title: str) -> _Title:
+    """Splits a title into its words and the version words of its suffixes."""
+    title = _FEATURING.sub(" ", title)
+    versions: set[str] = set()
+    for suffix in _SUFFIX.findall(title):
+        found = VERSION_WORDS.intersection(clean_str(suffix).split())
+        if found:
+            versions |= found
+            title = title.replace(suffix, " ")
+    words = clean_str(title).split()
+    # Unbracketed version words, e.g. "Creep Live"
+    versions |= VERSION_WORDS.intersection(words[1:])
+    return _Title(
+        " ".join(w for w in words if w not in versions),
+        frozenset(_VERSION_ALIASES.get(v, v) for v in versions),
+    )
+
+
+def _ratio(a: str, b: str) -> float:
+    # difflib is only needed once songs are ranked
+    from difflib import SequenceMatcher
+
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+def similarity(a: str, b: str) -> float:
+    """Returns the similarity (0-1) of two cleaned strings.
+
+    This is the average of their token-set ratio (which is 1 if the words of
+    one string are a subset of the other's) and token-sort ratio (which
+    penalizes extra words), so that ``"radiohead"`` is closer to itself than
+    to ``"radiohead tribute"``.
+
+    Args:
+        a (:obj:`str`): A string cleaned by :func:`clean_str
+            <lyricsgenius.utils.clean_str>`.
+        b (:obj:`str`): Another one.
+
+    Returns:
+        :obj:`float`
+
+    """
+    if a == b:
+        return 1.0
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    common = " ".join(sorted(tokens_a & tokens_b))
+    only_a = " ".join(sorted(tokens_a - tokens_b))
+    only_b = " ".join(sorted(tokens_b - tokens_a))
+    sorted_a = f"{common} {only_a}".strip()
+    sorted_b = f"{common} {only_b}".strip()
+    token_set = max(
+        _ratio(common, sorted_a) if common else 0.0,
+        _ratio(common, sorted_b) if common else 0.0,
+        _ratio(sorted_a, sorted_b),
+    )
+    return (token_set + _ratio(sorted_a, sorted_b)) / 2
+
+
+def split_artists(artist: str) -> list[str]:
+    """Splits credits such as ``"A & B feat. C"`` into cleaned names."""
+    names = [clean_str(name) for name in _ARTIST_SEPARATORS.split(artist)]
+    return [name for name in names if name]
+
+
+class Query:
+    """A searched song (or album), to score search results with.
+
+    The title and the artist are parsed once, so scoring all the hits of
+    a response only has to parse the hits.
+
+    Args:
+        title (:obj:`str`): Searched title (or album name).
+        artist (:obj:`str`, optional): Searched artist.
+        threshold (:obj:`float`, optional): Minimum score of a match.
+
+    """
+
+    def __init__(
+        self, title: str, artist: str = "", threshold: float = DEFAULT_THRESHOLD
+    ) -> None:
+        self.title = title
+        self.artist = artist
+        self.threshold = threshold
+        self._title = _parse_title(title)
+        self._artist = clean_str(artist)
+        self._artists = split_artists(artist)
+
+    def score_title(self, title: str) -> float:
+        """Returns how similar a title is to the searched one (0-1)."""
+        other = _parse_title(title)
+        score = similarity(self._title.words, other.words)
+        if other.versions != self._title.versions:
+            score *= VERSION_PENALTY
+        return score
+
+    def score_artist(self, artists: Sequence[str]) -> float:
+        """Returns how similar credited artists are to the searched one (0-1).
+
+        Args:
+            artists (:obj:`list`): Names of the artists, primary first.
+
+        """
+        if not self._artist:
+            return 1.0
+        names = [clean_str(name) for name in artists if name]
+        if not names:
+            return 0.0
+        best = similarity(self._artist, " ".join(names))
+        for name in names:
+            best = max(best, similarity(self._artist, name))
+            for searched in self._artists:
+                best = max(best, similarity(searched, name))
+        return best
+
+    def score(self, title: str, artists: Sequence[str] = ()) -> float:
+        """Returns how well a title and its artists match the query (0-1)."""
+        title_score = self.score_title(title)
+        if not self._artist:
+            return title_score
+        artist_score = self.score_artist(artists)
+        return title_score * (1 - ARTIST_WEIGHT + ARTIST_WEIGHT * artist_score)
+
+    def score_result(self, result: dict[str, Any]) -> float:
+        """Scores a song or album from the Genius API."""
+        if "title" in result:
+            title = result["title"]
+            artists = [(result.get("primary_artist") or {}).get("name", "")]
+            artists.extend(a["name"] for a in result.get("featured_artists") or ())
+        else:
+            title = result["name"]
+            artists = [(result.get("artist") or {}).get("name", "")]
+        return self.score(title, artists)
+
+    def rank(self, results: Iterable[dict[str, Any]]) -> list[Match]:
+        """Scores results and sorts them, best first.
+
+        Results with the same score keep their order.
+        """
+        matches = [Match(self.score_result(result), result) for result in results]
+        matches.sort(key=lambda match: match.score, reverse=True)
+        return matches
+
+    def best(self, results: Iterable[dict[str, Any]]) -> Match | None:
+        """Returns the best result, or `None` if none reach the threshold."""
+        matches = self.rank(results)
+        if matches and matches[0].score >= self.threshold:
+            return matches[0]
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.title!r}, {self.artist!r})"
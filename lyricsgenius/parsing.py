@@ -0,0 +1,256 @@
+"""Extraction of lyrics from Genius song pages.
+
+These functions don't make any requests, so they can be used on pages
+that were downloaded earlier, or run in other processes.
+"""
+
+import re
+from html import unescape
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Any
+
+from .types.lyrics import Lyrics, LyricsBuilder
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_PARSER = "html.parser"
+
+
+def _process_pool(workers: int) -> "ProcessPoolExecutor":
+    """Returns a pool of processes for parsing pages.
+
+    Workers are not forked from the current process, which may be running
+    threads (forking those can deadlock the children).
+    """
+    # multiprocessing is slow to import, and most uses don't need it
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+    return ProcessPoolExecutor(workers, mp_context=context)
+
+
+def extract_lyrics(
+    html: str, remove_section_headers: bool = False, parser: str = DEFAULT_PARSER
+) -> str | None:
+    """Extracts the lyrics from the HTML of a Genius song page.
+
+    Args:
+        html (:obj:`str`): HTML of the song page.
+        remove_section_headers (:obj:`bool`, optional):
+            If `True`, removes [Chorus], [Bridge], etc. headers from lyrics.
+        parser (:obj:`str`, optional): Parser used by BeautifulSoup
+            (e.g. ``html.parser``, ``lxml`` or ``html5lib``).
+
+    Returns:
+        :obj:`str` \\| :obj:`None`: The lyrics, or `None` if the page
+        has no lyrics section.
+
+    """
+    lyrics = extract_structured_lyrics(html, parser)
+    if lyrics is None:
+        return None
+    return lyrics.headerless if remove_section_headers else lyrics.text
+
+
+def extract_structured_lyrics(html: str, parser: str = DEFAULT_PARSER) -> Lyrics | None:
+    """Extracts the lyrics from a Genius song page, split into sections.
+
+    Args:
+        html (:obj:`str`): HTML of the song page.
+        parser (:obj:`str`, optional): Parser used by BeautifulSoup.
+
+    Returns:
+        :class:`Lyrics <lyricsgenius.types.Lyrics>` \\| :obj:`None`: The
+        lyrics, or `None` if the page has no lyrics section.
+
+    """
+    # bs4 is slow to import, and only needed here
+    from bs4 import BeautifulSoup, NavigableString, Tag
+
+    soup = BeautifulSoup(html, parser)
+
+    # Remove LyricsHeader divs from the DOM
+    removes = soup.find_all("div", class_=re.compile("LyricsHeader"))
+    if removes:
+        for remove in removes:
+            remove.decompose()
+
+    # Find all lyrics containers
+    containers = soup.find_all("div", attrs={"data-lyrics-container": "true"})
+    if not containers:
+        return None
+
+    # Extract and join the lyrics
+    lyrics = LyricsBuilder()
+    for container in containers:
+        assert isinstance(container, Tag)
+        if not container.contents:
+            lyrics.add("\n")
+            continue
+        for element in container.contents:
+            assert isinstance(element, (Tag, NavigableString))
+            if element.name == "br":
+                lyrics.add("\n")
+            elif isinstance(element, NavigableString):
+                lyrics.add(str(element))
+            elif element.get("data-exclude-from-selection") != "true":
+                lyrics.add(element.get_text(separator="\n"))
+    return lyrics.build()
+
+
+# A line break, and the newline that may follow it in the markup
+_BREAK_RE = re.compile(r"<br\s*/?>\n?", re.IGNORECASE)
+# The end of a paragraph, which is a blank line in the lyrics
+_PARAGRAPH_END_RE = re.compile(r"</p>\s*", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def extract_fragment_lyrics(html: str) -> Lyrics | None:
+    """Extracts the lyrics from the HTML fragment in a song's page data.
+
+    This is the ``lyrics_data.body.html`` of :meth:`Genius.page_data
+    <lyricsgenius.Genius.page_data>`, which only holds the lyrics (with
+    links to their annotations), so it's much smaller than the song page
+    and its tags can just be dropped instead of being parsed.
+
+    Args:
+        html (:obj:`str`): The lyrics fragment.
+
+    Returns:
+        :class:`Lyrics <lyricsgenius.types.Lyrics>` \\| :obj:`None`: The
+        lyrics, or `None` if the fragment is empty.
+
+    """
+    html = _PARAGRAPH_END_RE.sub("\n\n", _BREAK_RE.sub("\n", html))
+    lyrics = LyricsBuilder()
+    lyrics.add(unescape(_TAG_RE.sub("", html)).strip())
+    built = lyrics.build()
+    return built if built.text else None
+
+
+class _TagPageParser(HTMLParser):
+    """Collects the songs of a tag page's song list in one pass.
+
+    Only the first ``ul.song_list`` is read. In each of its items, the text
+    of the first ``span`` of the link is kept as separate strings, like
+    BeautifulSoup's ``stripped_strings``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.hits: list[dict[str, Any]] | None = None
+        self.done = False
+        self._ul_depth = 0
+        self._url: str | None = None
+        self._in_link = False
+        self._span_depth = 0
+        self._texts: list[str] = []
+        self._strings: list[str] | None = None
+        self._text: list[str] = []
+
+    def _flush(self) -> None:
+        # Text nodes end at tags. With convert_charrefs, a node can still
+        # arrive in more than one piece.
+        if self._text:
+            text = "".join(self._text)
+            self._texts.append(text)
+            if self._strings is not None and (stripped := text.strip()):
+                self._strings.append(stripped.replace("\xa0", " "))
+            self._text = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush()
+        if tag == "ul":
+            if self._ul_depth:
+                self._ul_depth += 1
+            elif self.hits is None:
+                classes = (dict(attrs).get("class") or "").split()
+                if "song_list" in classes:
+                    self.hits = []
+                    self._ul_depth = 1
+        elif not self._ul_depth:
+            return
+        elif tag == "li":
+            self._url = None
+            self._strings = None
+        elif tag == "a" and self._url is None:
+            self._url = dict(attrs).get("href") or ""
+            self._in_link = True
+        elif tag == "span" and self._in_link:
+            if self._span_depth:
+                self._span_depth += 1
+            elif self._strings is None:
+                self._span_depth = 1
+                self._strings = []
+                self._texts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if not self._ul_depth:
+            return
+        if tag == "ul":
+            self._ul_depth -= 1
+            self.done = not self._ul_depth
+        elif tag == "span" and self._span_depth:
+            self._span_depth -= 1
+            if not self._span_depth:
+                self._add_hit()
+        elif tag == "a":
+            self._in_link = False
+
+    def handle_data(self, data: str) -> None:
+        if self._span_depth:
+            self._text.append(data)
+
+    def _add_hit(self) -> None:
+        assert self.hits is not None and self._strings is not None
+        song = self._strings
+        self.hits.append(
+            {
+                "url": self._url,
+                "title_with_artists": "".join(self._texts).strip().replace("\xa0", " "),
+                "title": song[0],
+                "artists": song[2].split(" & "),
+                "featured_artists": [name for name in song[4:-1] if len(name) > 1],
+            }
+        )
+
+
+# The opening tag of the song list
+_SONG_LIST_RE = re.compile(r"<ul\s[^>]*class=[\"'][^\"']*\bsong_list\b")
+# Tag pages are fed to the parser in chunks, so the rest of the page isn't
+# parsed once the song list has been read
+_CHUNK_SIZE = 16 * 1024
+
+
+def extract_tag_hits(html: str) -> list[dict[str, Any]] | None:
+    """Extracts the songs listed on a tag page (e.g. https://genius.com/tags/pop/all).
+
+    The page is read with a streaming parser that skips everything before
+    the song list, and stops after it, so no document tree is built.
+
+    Args:
+        html (:obj:`str`): HTML of the tag page.
+
+    Returns:
+        :obj:`list` \\| :obj:`None`: A dictionary for each song, with its
+        ``url``, ``title_with_artists``, ``title``, ``artists`` and
+        ``featured_artists``, or `None` if the page has no song list.
+
+    """
+    match = _SONG_LIST_RE.search(html)
+    if match is None:
+        return None
+    parser = _TagPageParser()
+    for start in range(match.start(), len(html), _CHUNK_SIZE):
+        parser.feed(html[start : start + _CHUNK_SIZE])
+        if parser.done:
+            break
+    else:
+        parser.close()
+    return parser.hits
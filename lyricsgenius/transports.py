@@ -0,0 +1,448 @@
+"""HTTP transports.
+
+:class:`Sender <lyricsgenius.api.base.Sender>` sends its requests through a
+transport:
+
+* :class:`RequestsTransport` (the default) uses `requests
+  <https://requests.readthedocs.io/>`_. It speaks HTTP/1.1, so concurrent
+  requests to a host each need their own connection (and TLS handshake).
+* :class:`HTTPXTransport` uses `httpx <https://www.python-httpx.org/>`_.
+  With HTTP/2 (``pip install lyricsgenius[http2]``), concurrent requests
+  to a host are multiplexed over a single connection, which saves
+  handshakes when pages are fetched by many threads (e.g. by
+  :meth:`Genius.iter_lyrics <lyricsgenius.Genius.iter_lyrics>`).
+
+Both raise the exceptions of :mod:`requests` (e.g.
+:class:`requests.exceptions.Timeout`), so retries work the same way.
+
+Two more transports help testing and profiling without touching Genius:
+:class:`RecordingTransport` saves the responses of another transport to a
+directory, and :class:`ReplayTransport` serves them again, offline and
+optionally with a simulated latency.
+
+Examples:
+    .. code:: python
+
+        genius = Genius(token, transport="http2")
+
+        # Or configure the transport yourself
+        from lyricsgenius.transports import HTTPXTransport
+
+        genius = Genius(token, transport=HTTPXTransport(max_connections=4))
+
+        # Record a run, then replay it offline
+        from lyricsgenius.transports import RecordingTransport, ReplayTransport
+
+        genius = Genius(token, transport=RecordingTransport("recorded"))
+        genius.search_artist("Andy Shauf", max_songs=3)
+
+        genius = Genius(token, transport=ReplayTransport("recorded"))
+        genius.search_artist("Andy Shauf", max_songs=3)  # No requests
+
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Protocol
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class Response(Protocol):
+    """What transports return: the parts of a response that are used."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def text(self) -> str: ...
+
+
+class Transport(Protocol):
+    """Sends HTTP requests."""
+
+    #: Name of the transport
+    name: str
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        proxies: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Sends a request.
+
+        Args:
+            method (:obj:`str`): HTTP method.
+            url (:obj:`str`): URL of the request.
+            params (:obj:`dict` | :obj:`list`, optional): Query parameters.
+            headers (:obj:`dict`, optional): Every header of the request.
+            timeout (:obj:`float`, optional): Seconds before giving up.
+            proxies (:obj:`dict`, optional): Proxy of each scheme
+                (``http`` and ``https``).
+            **kwargs: Body of the request (``data`` or ``json``).
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out.
+            requests.exceptions.ConnectionError: If the connection failed.
+
+        """
+        ...
+
+    def close(self) -> None:
+        """Closes the connections of the transport."""
+        ...
+
+
+class RequestsTransport:
+    """Transport using a :class:`requests.Session`.
+
+    Args:
+        session (:class:`requests.Session`, optional): The session.
+            By default, a new one without default headers, so that only
+            the headers given by :class:`Sender
+            <lyricsgenius.api.base.Sender>` are sent.
+
+    """
+
+    name = "requests"
+
+    def __init__(self, session: requests.Session | None = None) -> None:
+        if session is None:
+            session = requests.Session()
+            session.headers.clear()
+        self.session = session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        proxies: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        return self.session.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            proxies=dict(proxies) if proxies else None,
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class HTTPXTransport:
+    """Transport using :class:`httpx.Client`.
+
+    A client (and its connections) is kept for each proxy.
+
+    Args:
+        http2 (:obj:`bool`, optional): Use HTTP/2 with the hosts that support
+            it. Requires the ``h2`` package.
+        max_connections (:obj:`int`, optional): Maximum number of connections
+            of each client. With HTTP/2, a single connection per host is
+            enough for any number of concurrent requests.
+
+    Raises:
+        ImportError: If httpx (or h2, for HTTP/2) isn't installed.
+
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 10) -> None:
+        import httpx
+
+        self._httpx = httpx
+        self.http2 = http2
+        self.name = "http2" if http2 else "httpx"
+        self._limits = httpx.Limits(max_connections=max_connections)
+        self._clients: dict[str | None, Any] = {}
+        self._lock = threading.Lock()
+        # Fails early if h2 is missing
+        self._client(None)
+
+    def _client(self, proxy: str | None) -> Any:
+        with self._lock:
+            client = self._clients.get(proxy)
+            if client is None:
+                client = self._httpx.Client(
+                    http2=self.http2,
+                    limits=self._limits,
+                    proxy=proxy,
+                    follow_redirects=True,
+                )
+                self._clients[proxy] = client
+            return client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        proxies: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        proxy = None
+        if proxies:
+            proxy = proxies.get(url.partition(":")[0])
+        try:
+            return self._client(proxy).request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout,
+                **kwargs,
+            )
+        except self._httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(http2={self.http2!r})"
+
+
+def request_key(method: str, url: str, params: Any = None, **kwargs: Any) -> str:
+    """Returns the name of the recording of a request.
+
+    Headers aren't part of it, so responses don't depend on the access
+    token (which isn't saved either). Parameters that are `None` are
+    ignored, like :mod:`requests` does.
+    """
+    items = params.items() if isinstance(params, Mapping) else params or ()
+    query = sorted((str(k), str(v)) for k, v in items if v is not None)
+    body = kwargs.get("json", kwargs.get("data"))
+    text = json.dumps([method.upper(), url, query, body], sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class RecordedResponse:
+    """A response served by :class:`ReplayTransport`."""
+
+    def __init__(
+        self, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> None:
+        self.status_code = status_code
+        self.headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.status_code}]>"
+
+
+class RecordingTransport:
+    """Transport saving every response of another transport to a directory.
+
+    Each response is saved in a JSON file named after :func:`request_key`,
+    so recording a request again replaces its previous response.
+
+    Args:
+        directory (:obj:`str` | :obj:`Path`): Directory of the recordings.
+            It is created if it doesn't exist.
+        transport (:class:`Transport`, optional): The transport that sends
+            the requests. Defaults to a :class:`RequestsTransport`.
+
+    """
+
+    def __init__(
+        self, directory: str | Path, transport: "str | Transport | None" = None
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.transport = get_transport(transport)
+        self.name = f"recording ({self.transport.name})"
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        proxies: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        response = self.transport.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            proxies=proxies,
+            **kwargs,
+        )
+        recording = {
+            "method": method.upper(),
+            "url": url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        path = self.directory / f"{request_key(method, url, params, **kwargs)}.json"
+        # Write the whole file at once, other threads may be replaying it
+        temp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        temp.write_text(json.dumps(recording), encoding="utf-8")
+        temp.replace(path)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.directory)!r})"
+
+
+class ReplayTransport:
+    """Transport serving responses saved by :class:`RecordingTransport`.
+
+    No request is sent. Recordings are read once and kept in memory, so
+    replays run as fast as the client can go, unless a latency is given.
+
+    Args:
+        directory (:obj:`str` | :obj:`Path`): Directory of the recordings.
+        latency (:obj:`float`, optional): Seconds each response takes, to
+            simulate the network.
+
+    Raises:
+        FileNotFoundError: If the directory doesn't exist.
+
+    """
+
+    name = "replay"
+
+    def __init__(self, directory: str | Path, latency: float = 0.0) -> None:
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"No recordings in {str(self.directory)!r}.")
+        self.latency = latency
+        self.requests = 0
+        self._responses: dict[str, RecordedResponse] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> RecordedResponse | None:
+        with self._lock:
+            self.requests += 1
+            response = self._responses.get(key)
+        if response is None:
+            path = self.directory / f"{key}.json"
+            if not path.is_file():
+                return None
+            recording = json.loads(path.read_text(encoding="utf-8"))
+            response = RecordedResponse(
+                recording["status_code"],
+                recording["headers"],
+                base64.b64decode(recording["content"]),
+            )
+            with self._lock:
+                self._responses[key] = response
+        return response
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        proxies: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> RecordedResponse:
+        """Returns the recorded response of a request.
+
+        Raises:
+            requests.exceptions.ConnectionError: If the request wasn't
+                recorded.
+
+        """
+        response = self._load(request_key(method, url, params, **kwargs))
+        if self.latency:
+            time.sleep(self.latency)
+        if response is None:
+            raise requests.exceptions.ConnectionError(
+                f"No recorded response for {method.upper()} {url} ({params})."
+            )
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            self._responses.clear()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.directory)!r})"
+
+
+TRANSPORTS: dict[str, Any] = {
+    "requests": RequestsTransport,
+    "http2": lambda: HTTPXTransport(http2=True),
+    "httpx": lambda: HTTPXTransport(http2=False),
+}
+
+
+def get_transport(transport: "str | Transport | None" = None) -> Transport:
+    """Returns a transport.
+
+    Args:
+        transport (:obj:`str` | :class:`Transport`, optional): Name of the
+            transport (``requests``, ``http2`` or ``httpx``), or a transport
+            (which is returned as is). Defaults to ``requests``.
+
+    Returns:
+        :class:`Transport`
+
+    Raises:
+        ValueError: If the transport is unknown.
+        ImportError: If the packages of the transport aren't installed.
+
+    """
+    if transport is None:
+        transport = "requests"
+    if not isinstance(transport, str):
+        return transport
+    if transport not in TRANSPORTS:
+        raise ValueError(
+            f"Unknown transport {transport!r}, must be one of {', '.join(TRANSPORTS)}."
+        )
+    result: Transport = TRANSPORTS[transport]()
+    return result
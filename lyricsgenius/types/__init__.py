@@ -1,3 +1,5 @@
 from .album import Album
 from .artist import Artist
+from .base import save_many
+from .lyrics import Lyrics, Section
 from .song import Song
@@ -1,8 +1,13 @@
+from collections.abc import Hashable
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
 from typing import Any
 
 from ..utils import convert_to_datetime, format_filename
 from .base import BaseEntity
 from .song import Song
+from .types import IfExistsT
 
 
 class Album(BaseEntity):
@@ -17,17 +22,8 @@ class Album(BaseEntity):
             tracks (list[Song]): A list of Song objects for the album tracks.
         """
         self._body = body
+        self._songs = tracks
         self.artist: dict[str, Any] = body["artist"]
-
-        # Store tracks as a list of tuples: (inferred_track_number, Song_object)
-        self.tracks: list[tuple[int, Song]] = []
-        for i, track in enumerate(tracks):
-            # Infer track number from the order in the list (1-based index)
-            self.tracks.append((i + 1, track))
-
-        self.release_date_components = convert_to_datetime(
-            body.get("release_date_components")
-        )
         self.api_path: str = body["api_path"]
         self.cover_art_thumbnail_url: str = body["cover_art_thumbnail_url"]
         self.cover_art_url: str = body["cover_art_url"]
@@ -36,6 +32,23 @@ class Album(BaseEntity):
         self.name_with_artist: str = body["name_with_artist"]
         self.url: str = body["url"]
 
+    @cached_property
+    def tracks(self) -> list[tuple[int, Song]]:
+        """The tracks as ``(track_number, song)`` pairs.
+
+        Track numbers are inferred from the order of the songs (starting at 1).
+        """
+        return list(enumerate(self._songs, start=1))
+
+    @cached_property
+    def release_date_components(self) -> datetime | None:
+        """Release date of the album, parsed the first time it's accessed."""
+        return convert_to_datetime(self._body.get("release_date_components"))
+
+    def _content_key(self) -> tuple[Hashable, ...]:
+        tracks = tuple((number, song.key) for number, song in self.tracks)
+        return (self.name, self.artist.get("id"), tracks)
+
     @property
     def _text_data(self) -> str:
         return "\n\n".join(
@@ -43,42 +56,43 @@ class Album(BaseEntity):
             for track_num, track in self.tracks
         ).strip()
 
+    def _json_fields(self) -> dict[str, Any]:
+        release_date = self.release_date_components
+        return {
+            "artist": self.artist["name"],
+            "tracks": [
+                {"number": track_num, "song": track} for track_num, track in self.tracks
+            ],
+            "release_date": (
+                release_date.strftime("%Y-%m-%d") if release_date else None
+            ),
+        }
+
     def to_dict(self) -> dict[str, Any]:
-        body = super().to_dict()
-        body["artist"] = self.artist["name"]
-
-        # Serialize tracks: create a list of dictionaries, each representing a track
-        # with its number and the song data.
-        serialized_tracks = []
-        for track_num, track in self.tracks:
-            serialized_tracks.append(
-                {
-                    "number": track_num,
-                    "song": track.to_dict(),
-                }
-            )
-        body["tracks"] = serialized_tracks
-
-        # Add release date string if components exist
-        if self.release_date_components:
-            body["release_date"] = self.release_date_components.strftime("%Y-%m-%d")
-        else:
-            body["release_date"] = None
-        return body
+        return super().to_dict()
 
     def to_json(
         self,
         filename: str | None = None,
         sanitize: bool = True,
         ensure_ascii: bool = True,
+        compact: bool = False,
+        stream: bool = False,
     ) -> str | None:
         return super().to_json(
-            filename=filename, sanitize=sanitize, ensure_ascii=ensure_ascii
+            filename=filename,
+            sanitize=sanitize,
+            ensure_ascii=ensure_ascii,
+            compact=compact,
+            stream=stream,
         )
 
     def to_text(self, filename: str | None = None, sanitize: bool = True) -> str | None:
         return super().to_text(filename=filename, sanitize=sanitize)
 
+    def _default_filename(self) -> str:
+        return format_filename(f"saved_album_lyrics_{self.artist['name']}_{self.name}")
+
     def save_lyrics(
         self,
         filename: str | None = None,
@@ -86,11 +100,12 @@ class Album(BaseEntity):
         overwrite: bool = False,
         ensure_ascii: bool = True,
         sanitize: bool = True,
-    ) -> None:
+        compact: bool = False,
+        if_exists: IfExistsT | None = None,
+        stream: bool = False,
+    ) -> Path | None:
         if filename is None:
-            filename = format_filename(
-                f"saved_album_lyrics_{self.artist['name']}_{self.name}"
-            )
+            filename = self._default_filename()
 
         return super().save_lyrics(
             filename=filename,
@@ -98,6 +113,9 @@ class Album(BaseEntity):
             overwrite=overwrite,
             ensure_ascii=ensure_ascii,
             sanitize=sanitize,
+            compact=compact,
+            if_exists=if_exists,
+            stream=stream,
         )
 
     def __str__(self) -> str:
@@ -107,16 +125,3 @@ class Album(BaseEntity):
     def __repr__(self) -> str:
         """Return a string representation of the Album object."""
         return f"Album(name='{self.name}', artist='{self.artist['name']}')"
-
-    def __eq__(self, other: object) -> bool:
-        """Check if two Album objects are equal."""
-        if not isinstance(other, Album):
-            return False
-        if self._body.get("id", 1) == other._body.get("id", -1):
-            return True
-
-        return (
-            self.name == other.name
-            and self.artist["id"] == other.artist["id"]
-            and self.tracks == other.tracks
-        )
@@ -4,21 +4,123 @@
 
 
 import logging
-from typing import Any
+from collections.abc import Hashable, Iterable
+from pathlib import Path
+from typing import Any, Self, SupportsIndex
 
-from ..utils import format_filename, safe_unicode
+from ..utils import clean_str, format_filename, safe_unicode
 from .base import BaseEntity
 from .song import Song
+from .types import IfExistsT
 
 logger = logging.getLogger(__name__)
 
 
+class SongList(list[Song]):
+    """List of an artist's songs, indexed by song ID and title.
+
+    The indexes are built the first time they're needed. Appending keeps
+    them up to date, other changes to the list make them get rebuilt on
+    the next lookup.
+    """
+
+    def __init__(self, songs: Iterable[Song] = ()) -> None:
+        super().__init__(songs)
+        self._ids: dict[Any, Song] | None = None
+        self._titles: dict[str, list[Song]] | None = None
+
+    def _index(self) -> tuple[dict[Any, Song], dict[str, list[Song]]]:
+        if self._ids is None or self._titles is None:
+            self._ids, self._titles = {}, {}
+            for song in self:
+                self._add_to_index(song)
+        return self._ids, self._titles
+
+    def _add_to_index(self, song: Song) -> None:
+        assert self._ids is not None and self._titles is not None
+        if song._body.get("id") is not None:
+            self._ids.setdefault(song._body["id"], song)
+        self._titles.setdefault(clean_str(song.title), []).append(song)
+
+    def _invalidate(self) -> None:
+        self._ids = self._titles = None
+
+    def by_id(self, song_id: Any) -> Song | None:
+        """Returns the song with the given ID, if there is one."""
+        return self._index()[0].get(song_id)
+
+    def by_title(self, title: str) -> list[Song]:
+        """Returns the songs whose title matches once cleaned (see :func:`clean_str`)."""
+        return self._index()[1].get(clean_str(title), [])
+
+    def find(self, song: Song) -> Song | None:
+        """Returns the song in the list that's equal to ``song``, if any.
+
+        Songs with an ID are looked up by it. Songs without one are only
+        compared with the songs that have the same title.
+        """
+        if song._body.get("id") is not None:
+            return self.by_id(song._body["id"])
+        for candidate in self.by_title(song.title):
+            if candidate == song:
+                return candidate
+        return None
+
+    def __contains__(self, song: object) -> bool:
+        if isinstance(song, Song):
+            return self.find(song) is not None
+        return super().__contains__(song)
+
+    def append(self, song: Song) -> None:
+        super().append(song)
+        if self._ids is not None:
+            self._add_to_index(song)
+
+    # Anything else that changes the list drops the indexes
+
+    def extend(self, songs: Iterable[Song]) -> None:
+        super().extend(songs)
+        self._invalidate()
+
+    def insert(self, index: Any, song: Song) -> None:
+        super().insert(index, song)
+        self._invalidate()
+
+    def pop(self, *args: Any) -> Song:
+        self._invalidate()
+        return super().pop(*args)
+
+    def remove(self, song: Song) -> None:
+        self._invalidate()
+        super().remove(song)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def __setitem__(self, *args: Any) -> None:
+        self._invalidate()
+        super().__setitem__(*args)
+
+    def __delitem__(self, *args: Any) -> None:
+        self._invalidate()
+        super().__delitem__(*args)
+
+    def __iadd__(self, songs: Iterable[Song]) -> Self:  # type: ignore[override,misc]
+        self._invalidate()
+        return super().__iadd__(songs)
+
+    def __imul__(self, n: SupportsIndex) -> Self:
+        self._invalidate()
+        return super().__imul__(n)
+
+
 class Artist(BaseEntity):
     """An artist with songs from Genius."""
 
     def __init__(self, body: dict[str, Any]) -> None:
         self._body = body
-        self.songs: list[Song] = []
+        self._songs = SongList()
 
         self.api_path: str = body["api_path"]
         self.header_image_url: str = body["header_image_url"]
@@ -28,6 +130,19 @@ class Artist(BaseEntity):
         self.name: str = body["name"]
         self.url: str = body["url"]
 
+    @property
+    def songs(self) -> SongList:
+        """The artist's songs.
+
+        A :obj:`list` that also keeps the songs indexed by ID and title for
+        :meth:`get_song` and :meth:`add_song`.
+        """
+        return self._songs
+
+    @songs.setter
+    def songs(self, songs: Iterable[Song]) -> None:
+        self._songs = SongList(songs)
+
     def __len__(self) -> int:
         return len(self.songs)
 
@@ -64,7 +179,7 @@ class Artist(BaseEntity):
                 song = genius.search_song('To You', artist.name)
                 artist.add_song(song)
         """
-        if new_song in self.songs:
+        if self.songs.find(new_song) is not None:
             logger.debug(
                 "%s already in %s, not adding song.",
                 safe_unicode(new_song.title),
@@ -73,7 +188,7 @@ class Artist(BaseEntity):
             return None
         if new_song.artist == self.name or (
             include_features
-            and self.name in [artist["name"] for artist in new_song.featured_artists]
+            and any(artist["name"] == self.name for artist in new_song.featured_artists)
         ):
             self.songs.append(new_song)
             return new_song
@@ -84,25 +199,34 @@ class Artist(BaseEntity):
         )
         return None
 
-    def get_song(self, song_id: int | None = None) -> Song | None:
-        title: str | None = None
-        """Returns a song by title or ID.
+    def get_song(
+        self, song_id: int | None = None, title: str | None = None
+    ) -> Song | None:
+        """Returns a song by ID or title.
+
+        Titles are compared after cleaning them with :func:`clean_str
+        <lyricsgenius.utils.clean_str>`, so case and punctuation don't
+        matter. If several songs have the same title, the first one
+        added is returned.
+
         Args:
             song_id (:obj:`int`, optional): ID of the song.
             title (:obj:`str`, optional): Title of the song.
+
         Returns:
             :obj:`Song`: Returns the song object if found, otherwise None.
+
         """
         if song_id is not None:
-            for song in self.songs:
-                if song._body["id"] == song_id:
-                    return song
+            return self.songs.by_id(song_id)
         elif title is not None:
-            for song in self.songs:
-                if song.title == title:
-                    return song
+            songs = self.songs.by_title(title)
+            return songs[0] if songs else None
         return None
 
+    def _content_key(self) -> tuple[Hashable, ...]:
+        return (self.name, frozenset(song.key for song in self.songs))
+
     @property
     def _text_data(self) -> str:
         """Returns the text data for the artist."""
@@ -111,24 +235,36 @@ class Artist(BaseEntity):
             for n, song in enumerate(self.songs, start=1)
         ).strip()
 
+    def _json_fields(self) -> dict[str, Any]:
+        return {"songs": self.songs}
+
     def to_dict(self) -> dict[str, Any]:
-        body = super().to_dict()
-        body["songs"] = [song.to_dict() for song in self.songs]
-        return body
+        return super().to_dict()
 
     def to_json(
         self,
         filename: str | None = None,
         sanitize: bool = True,
         ensure_ascii: bool = True,
+        compact: bool = False,
+        stream: bool = False,
     ) -> str | None:
         return super().to_json(
-            filename=filename, sanitize=sanitize, ensure_ascii=ensure_ascii
+            filename=filename,
+            sanitize=sanitize,
+            ensure_ascii=ensure_ascii,
+            compact=compact,
+            stream=stream,
         )
 
     def to_text(self, filename: str | None = None, sanitize: bool = True) -> str | None:
         return super().to_text(filename=filename, sanitize=sanitize)
 
+    def _default_filename(self) -> str:
+        return format_filename(
+            f"saved_artist_lyrics_{self.name}_{self.num_songs}_songs"
+        )
+
     def save_lyrics(
         self,
         filename: str | None = None,
@@ -136,11 +272,12 @@ class Artist(BaseEntity):
         overwrite: bool = False,
         ensure_ascii: bool = True,
         sanitize: bool = True,
-    ) -> None:
+        compact: bool = False,
+        if_exists: IfExistsT | None = None,
+        stream: bool = False,
+    ) -> Path | None:
         if filename is None:
-            filename = format_filename(
-                f"saved_artist_lyrics_{self.name}_{self.num_songs}_songs"
-            )
+            filename = self._default_filename()
 
         return super().save_lyrics(
             filename=filename,
@@ -148,6 +285,9 @@ class Artist(BaseEntity):
             overwrite=overwrite,
             ensure_ascii=ensure_ascii,
             sanitize=sanitize,
+            compact=compact,
+            if_exists=if_exists,
+            stream=stream,
         )
 
     def __str__(self) -> str:
@@ -159,15 +299,3 @@ class Artist(BaseEntity):
     def __repr__(self) -> str:
         """Return a string representation of the Artist object."""
         return f"Artist(name={self.name}, num_songs={self.num_songs})"
-
-    def __eq__(self, other: object) -> bool:
-        """Check if two Artist objects are equal."""
-        if not isinstance(other, Artist):
-            return False
-        if self._body.get("id", 1) == other._body.get("id", -1):
-            return True
-        if self.name != other.name or len(self.songs) != len(other.songs):
-            return False
-        return sorted(self.songs, key=lambda s: s.title) == sorted(
-            other.songs, key=lambda s: s.title
-        )
@@ -1,16 +1,59 @@
-import json
 import logging
+import os
+import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import count
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, get_args
 
-from ..utils import safe_unicode, sanitize_filename
+from ..codec import JSONCodec, get_codec
+from ..utils import prefetch, safe_unicode, sanitize_filename
+from .types import IfExistsT
 
 logger = logging.getLogger(__name__)
 
 
 class BaseEntity(ABC):
-    """Base class for Genius data types (e.g. Song, Artist, album)."""
+    """Base class for Genius data types (e.g. Song, Artist, album).
+
+    Entities are equal if they have the same Genius ID. Entities without
+    an ID (e.g. built from partial data) are compared by content instead.
+    Either way they can be hashed, so they can be put in sets and used as
+    dictionary keys.
+    """
+
+    _body: dict[str, Any]
+
+    @property
+    def key(self) -> tuple[Hashable, ...]:
+        """Identity of the entity, used for equality and hashing.
+
+        ``("id", id)`` if the entity has a Genius ID, otherwise ``"content"``
+        followed by the values that identify it (e.g. a song's title, artist
+        and a digest of its lyrics).
+        """
+        song_id = self._body.get("id")
+        if song_id is not None:
+            return ("id", song_id)
+        return ("content", *self._content_key())
+
+    @abstractmethod
+    def _content_key(self) -> tuple[Hashable, ...]:
+        """Values that identify the entity when it has no ID."""
+
+    @abstractmethod
+    def _default_filename(self) -> str:
+        """Name of the file of :meth:`save_lyrics`, without its extension."""
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return False
+        assert isinstance(other, BaseEntity)
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self.key))
 
     @abstractmethod
     def save_lyrics(
@@ -20,12 +63,18 @@ class BaseEntity(ABC):
         overwrite: bool = False,
         ensure_ascii: bool = True,
         sanitize: bool = True,
-    ) -> None:
+        compact: bool = False,
+        if_exists: IfExistsT | None = None,
+        stream: bool = False,
+    ) -> Path | None:
         """Save Song(s) lyrics and metadata to a JSON or TXT file.
 
         If the extension is 'json' (the default), the lyrics will be saved
         alongside the song's information. Take a look at the example below.
 
+        The file is written to a temporary file first, then renamed, so it
+        is never left half-written (e.g. if the process is killed).
+
         Args:
             filename (:obj:`str`, optional): Output filename, a string.
                 May include a full or relative directory path (e.g.
@@ -33,12 +82,32 @@ class BaseEntity(ABC):
                 automatically if it does not exist.
                 If not specified, a default name is used.
             extension (:obj:`str`, optional): Format of the file (`json` or `txt`).
-            overwrite (:obj:`bool`, optional): Overwrites preexisting file if `True`.
-                Otherwise prompts user for input.
+            overwrite (:obj:`bool`, optional): Shorthand for
+                ``if_exists="overwrite"`` if `True`, and ``if_exists="prompt"``
+                if `False`. Ignored if :obj:`if_exists` is given.
             ensure_ascii (:obj:`bool`, optional): If ensure_ascii is true
                 (the default), the output is guaranteed to have all incoming
                 non-ASCII characters escaped.
             sanitize (:obj:`bool`, optional): Sanitizes the filename if `True`.
+            compact (:obj:`bool`, optional): If `True`, JSON files are saved
+                without indentation or spaces, which makes them smaller and
+                faster to write.
+            if_exists (:obj:`str`, optional): What to do if the file already
+                exists: ``prompt`` the user, ``skip`` it, ``overwrite`` it,
+                save a new ``version`` of it (``name_1.json``, ``name_2.json``
+                and so on) or ``fail``. Only ``prompt`` is interactive. If
+                `None`, it depends on :obj:`overwrite`.
+            stream (:obj:`bool`, optional): If `True`, the JSON is written
+                as it's encoded (see :meth:`write_json`), which uses less
+                memory but more CPU time. Useful for very large artists.
+
+        Returns:
+            :obj:`Path` \\| :obj:`None`: The saved file, or `None` if it
+            was skipped.
+
+        Raises:
+            FileExistsError: If the file exists and :obj:`if_exists` is
+                ``fail``.
 
         Warning:
             If you set :obj:`sanitize` to `False`, the file name may contain
@@ -48,6 +117,12 @@ class BaseEntity(ABC):
         extension = extension.lstrip(".").lower()
         msg = "extension must be JSON or TXT"
         assert (extension == "json") or (extension == "txt"), msg
+        if if_exists is None:
+            if_exists = "overwrite" if overwrite else "prompt"
+        if if_exists not in get_args(IfExistsT):
+            raise ValueError(
+                f"if_exists must be one of {', '.join(get_args(IfExistsT))}."
+            )
 
         # Separate parent directory from stem so we sanitize only the filename
         # portion, then reconstruct the full path.
@@ -58,36 +133,87 @@ class BaseEntity(ABC):
         # Create parent directory if needed (no-op when parent is cwd)
         p.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if file already exists
-        write_file = False
-        if overwrite or not p.is_file():
-            write_file = True
-        else:
+        # Check if file already exists, before spending time on serializing
+        if if_exists == "prompt":
             msg = f"{p} already exists. Overwrite?\n(y/n): "
-            if input(msg).lower() == "y":
-                write_file = True
-
-        # Exit if we won't be saving a file
-        if not write_file:
+            if p.is_file() and input(msg).lower() != "y":
+                logger.debug("Skipping file save.")
+                return None
+            if_exists = "overwrite"
+        elif if_exists == "skip" and p.exists():
             logger.debug("Skipping file save.")
             return None
+        elif if_exists == "fail" and p.exists():
+            raise FileExistsError(f"{p} already exists.")
 
         # Save the lyrics to a file
         if extension == "json":
-            self.to_json(str(p), ensure_ascii=ensure_ascii, sanitize=False)
+
+            def write(f: TextIO) -> None:
+                self._dump_json(f, ensure_ascii, None if compact else 4, stream)
+
         else:
-            self.to_text(str(p), sanitize=False)
 
-        logger.debug("Wrote %s.", safe_unicode(str(p)))
+            def write(f: TextIO) -> None:
+                f.write(self._text_data)
 
-        return None
+        saved = _write_file(p, write, if_exists)
+        if saved is None:
+            logger.debug("Skipping file save.")
+        else:
+            logger.debug("Wrote %s.", safe_unicode(str(saved)))
+        return saved
+
+    def _json_fields(self) -> dict[str, Any]:
+        """Values added to (or replaced in) the body when serializing.
+
+        They may contain other entities (e.g. an artist's songs).
+        """
+        return {}
 
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
-        """Converts the object to a dictionary."""
-        if hasattr(self, "_body"):
-            return self._body.copy()
-        return {}
+        """Converts the object to a dictionary.
+
+        The values of the body are shared with the object, not copied, so
+        they shouldn't be modified.
+        """
+        if not hasattr(self, "_body"):
+            return {}
+        fields = self._json_fields()
+        if not fields:
+            return dict(self._body)
+        return {**self._body, **{k: _to_plain(v) for k, v in fields.items()}}
+
+    def write_json(
+        self,
+        fp: TextIO,
+        ensure_ascii: bool = True,
+        indent: int | None = 4,
+        codec: str | JSONCodec | None = None,
+    ) -> None:
+        """Writes the object as JSON to a file object.
+
+        The output is the same as ``json.dumps(self.to_dict(), indent=indent)``,
+        but nested songs and tracks are written as they're reached instead of
+        being gathered into one big dictionary first. This keeps the memory
+        use low, at the cost of more CPU time than encoding :meth:`to_dict`
+        in one go.
+
+        Args:
+            fp (:obj:`TextIO`): File object opened for writing text.
+            ensure_ascii (:obj:`bool`, optional): If ensure_ascii is true
+                (the default), the output is guaranteed to have all incoming
+                non-ASCII characters escaped.
+            indent (:obj:`int`, optional): Indentation of the output. If `None`,
+                the output is compact.
+            codec (:obj:`str` | :class:`JSONCodec <lyricsgenius.codec.JSONCodec>`,
+                optional): JSON codec. Defaults to :mod:`json`, whose output
+                doesn't depend on the packages that are installed.
+
+        """
+        codec = get_codec(codec or "json")
+        _JSONWriter(fp, codec, indent, ensure_ascii).write(self, 0)
 
     @abstractmethod
     def to_json(
@@ -95,6 +221,8 @@ class BaseEntity(ABC):
         filename: str | None = None,
         sanitize: bool = True,
         ensure_ascii: bool = True,
+        compact: bool = False,
+        stream: bool = False,
     ) -> str | None:
         """Converts the object to a json string.
 
@@ -105,6 +233,11 @@ class BaseEntity(ABC):
             ensure_ascii (:obj:`bool`, optional): If ensure_ascii is true
               (the default), the output is guaranteed to have all incoming
               non-ASCII characters escaped.
+            compact (:obj:`bool`, optional): If `True`, the JSON has no
+              indentation or spaces.
+            stream (:obj:`bool`, optional): If `True`, the file is written
+              as it's encoded (see :meth:`write_json`), which uses less
+              memory but more CPU time.
 
         Returns:
             :obj:`str` \\|‌ :obj:`None`: If :obj:`filename` is `None`,
@@ -115,19 +248,29 @@ class BaseEntity(ABC):
             invalid characters, and therefore cause the saving to fail.
 
         """
-        data = self.to_dict()
-
         # Return the json string if no output path was specified
         if not filename:
-            return json.dumps(data, indent=1, ensure_ascii=ensure_ascii)
+            # Compact strings use the fastest codec, see lyricsgenius.codec
+            codec = get_codec() if compact else get_codec("json")
+            return codec.dumps(
+                self.to_dict(), indent=None if compact else 1, ensure_ascii=ensure_ascii
+            )
 
         # Save Song object to a json file
         p = Path(sanitize_filename(filename) if sanitize else filename)
-        p.write_text(
-            json.dumps(data, indent=4, ensure_ascii=ensure_ascii), encoding="utf-8"
-        )
+        indent = None if compact else 4
+        _write_file(p, lambda f: self._dump_json(f, ensure_ascii, indent, stream))
         return None
 
+    def _dump_json(
+        self, fp: TextIO, ensure_ascii: bool, indent: int | None, stream: bool
+    ) -> None:
+        """Writes the object as JSON to a file, streamed or in one go."""
+        if stream:
+            self.write_json(fp, ensure_ascii=ensure_ascii, indent=indent)
+        else:
+            fp.write(get_codec("json").dumps(self.to_dict(), indent, ensure_ascii))
+
     @property
     def _text_data(self) -> str:
         """
@@ -164,7 +307,7 @@ class BaseEntity(ABC):
 
         # Save song lyrics to a text file
         p = Path(sanitize_filename(filename) if sanitize else filename)
-        p.write_text(self._text_data, encoding="utf-8")
+        _write_file(p, lambda f: f.write(self._text_data))
         return None
 
     def __repr__(self) -> str:
@@ -173,3 +316,258 @@ class BaseEntity(ABC):
             [x for x in list(self.__dict__.keys()) if not x.startswith("_")][:2]
         )
         return f"{name}({attrs}, ...)"
+
+
+def _write_file(
+    path: Path, write: Callable[[TextIO], Any], if_exists: IfExistsT = "overwrite"
+) -> Path | None:
+    """Writes a file atomically: it's complete or it doesn't exist.
+
+    The content is written to a temporary file in the same directory, which
+    is then renamed (``overwrite``) or hard-linked to the path, which fails
+    if the path exists, even if another thread or process just created it
+    (``skip``, ``version`` and ``fail``).
+
+    Returns:
+        :obj:`Path` \\| :obj:`None`: The written file, or `None` if it was
+        skipped.
+
+    """
+    temp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:12]}.tmp")
+    try:
+        with temp.open("x", encoding="utf-8") as f:
+            write(f)
+        if if_exists == "overwrite":
+            os.replace(temp, path)
+            return path
+
+        targets: Iterator[Path] = iter([path])
+        if if_exists == "version":
+            targets = (
+                path if n == 0 else path.with_name(f"{path.stem}_{n}{path.suffix}")
+                for n in count()
+            )
+        for target in targets:
+            try:
+                os.link(temp, target)
+                return target
+            except FileExistsError:
+                continue
+            except OSError:
+                # No hard links on this file system
+                if target.exists():
+                    continue
+                os.replace(temp, target)
+                return target
+        if if_exists == "fail":
+            raise FileExistsError(f"{path} already exists.")
+        return None
+    finally:
+        temp.unlink(missing_ok=True)
+
+
+def save_many(
+    entities: Iterable["BaseEntity"],
+    directory: str | Path,
+    workers: int = 4,
+    extension: str = "json",
+    if_exists: IfExistsT = "skip",
+    filename: Callable[[Any], str] | None = None,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+) -> list[Path | None]:
+    """Saves the lyrics of many songs, artists or albums to a directory.
+
+    Files are written by a pool of threads, each one atomically (see
+    :meth:`BaseEntity.save_lyrics`).
+
+    Args:
+        entities (:obj:`Iterable`): Songs, artists or albums. They're
+            consumed lazily, so this can be a generator.
+        directory (:obj:`str` | :obj:`Path`): Output directory. It is
+            created if it doesn't exist.
+        workers (:obj:`int`, optional): Number of files written at once.
+        extension (:obj:`str`, optional): Format of the files (`json` or `txt`).
+        if_exists (:obj:`str`, optional): What to do with files that already
+            exist: ``skip`` (the default), ``overwrite``, ``version`` or
+            ``fail`` (see :meth:`BaseEntity.save_lyrics`). Skipping lets an
+            interrupted export be run again to write the missing files.
+        filename (:obj:`Callable`, optional): Returns the name of the file
+            of an entity (without its extension). Defaults to the name used
+            by :meth:`save_lyrics`, e.g. ``saved_song_lyrics_{artist}_{title}``.
+        ensure_ascii (:obj:`bool`, optional): Escape non-ASCII characters.
+        compact (:obj:`bool`, optional): Save JSON files without indentation.
+
+    Returns:
+        :obj:`list`: The saved files, in the order of :obj:`entities`
+        (`None` for skipped ones).
+
+    Raises:
+        FileExistsError: If a file exists and :obj:`if_exists` is ``fail``.
+            It stops the export: files that weren't written yet aren't
+            written.
+
+    Examples:
+        .. code:: python
+
+            from lyricsgenius.types import save_many
+
+            artist = genius.search_artist("Andy Shauf", max_songs=50)
+            save_many(artist.songs, "lyrics", workers=8)
+
+    """
+    if if_exists == "prompt":
+        raise ValueError("save_many can't prompt, use another if_exists policy.")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    def save(entity: BaseEntity) -> Path | None:
+        name = filename(entity) if filename else entity._default_filename()
+        return entity.save_lyrics(
+            str(directory / name),
+            extension=extension,
+            ensure_ascii=ensure_ascii,
+            compact=compact,
+            if_exists=if_exists,
+        )
+
+    saved = prefetch(save, entities, workers)
+    try:
+        paths = list(saved)
+    finally:
+        saved.close()
+    skipped = paths.count(None)
+    logger.info("Saved %d files, skipped %d.", len(paths) - skipped, skipped)
+    return paths
+
+
+def _to_plain(value: Any) -> Any:
+    """Converts the entities in a value to dictionaries."""
+    if isinstance(value, BaseEntity):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+class _JSONWriter:
+    """Writes values that may contain entities the way :func:`json.dump` would.
+
+    Values from an entity's body are plain JSON, so runs of them are encoded
+    in one go. Only the fields added to the body are walked to find nested
+    entities, and lists of songs are encoded a batch at a time.
+    """
+
+    # Number of plain values in a list that are encoded together
+    BATCH_SIZE = 256
+
+    def __init__(
+        self, fp: TextIO, codec: JSONCodec, indent: int | None, ensure_ascii: bool
+    ) -> None:
+        self.fp = fp
+        self.codec = codec
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+        self.key_separator = ":" if indent is None else ": "
+
+    def newline(self, level: int) -> str:
+        return "" if self.indent is None else "\n" + " " * (self.indent * level)
+
+    def dumps(self, value: Any, level: int) -> str:
+        text = self.codec.dumps(value, self.indent, self.ensure_ascii)
+        # Newlines in strings are escaped, so these only come from the indentation
+        if level and self.indent is not None and "\n" in text:
+            text = text.replace("\n", self.newline(level))
+        return text
+
+    def members(self, value: dict[Any, Any] | list[Any], level: int) -> str:
+        """Returns the members of an object or array, without the brackets."""
+        return self.dumps(value, level)[1 : -len(self.newline(level)) - 1]
+
+    def write(self, value: Any, level: int) -> None:
+        if isinstance(value, (list, tuple)):
+            self.write_array(value, level)
+            return
+        if isinstance(value, BaseEntity):
+            items = _entity_items(value)
+        elif isinstance(value, dict):
+            items = [(k, v, True) for k, v in value.items()]
+        else:
+            self.fp.write(self.dumps(value, level))
+            return
+
+        if not items:
+            self.fp.write("{}")
+            return
+        pad = self.newline(level + 1)
+        sep = "{"
+        plain: dict[Any, Any] = {}
+        for k, v, nested in items:
+            if not nested:
+                plain[k] = v
+                continue
+            if plain:
+                self.fp.write(sep + self.members(plain, level))
+                sep, plain = ",", {}
+            key = self.codec.dumps(str(k), ensure_ascii=self.ensure_ascii)
+            self.fp.write(sep + pad + key + self.key_separator)
+            self.write(v, level + 1)
+            sep = ","
+        if plain:
+            self.fp.write(sep + self.members(plain, level))
+        self.fp.write(self.newline(level) + "}")
+
+    def write_array(self, values: list[Any] | tuple[Any, ...], level: int) -> None:
+        if not values:
+            self.fp.write("[]")
+            return
+        pad = self.newline(level + 1)
+        sep = "["
+        batch: list[Any] = []
+        for v in values:
+            plain = _plain(v)
+            if plain is not _NESTED:
+                batch.append(plain)
+                if len(batch) < self.BATCH_SIZE:
+                    continue
+            if batch:
+                self.fp.write(sep + self.members(batch, level))
+                sep, batch = ",", []
+            if plain is _NESTED:
+                self.fp.write(sep + pad)
+                self.write(v, level + 1)
+                sep = ","
+        if batch:
+            self.fp.write(sep + self.members(batch, level))
+        self.fp.write(self.newline(level) + "]")
+
+
+_NESTED = object()
+
+
+def _entity_items(entity: BaseEntity) -> list[tuple[Any, Any, bool]]:
+    """Returns the items of an entity, and whether they may contain entities."""
+    fields = entity._json_fields()
+    items = [
+        (k, fields.pop(k), True) if k in fields else (k, v, False)
+        for k, v in entity._body.items()
+    ]
+    items.extend((k, v, True) for k, v in fields.items())
+    # Scalar fields can be encoded along with the body
+    return [(k, v, nested and not _is_scalar(v)) for k, v, nested in items]
+
+
+def _plain(value: Any) -> Any:
+    """Returns a value as plain JSON, or ``_NESTED`` if it may contain entities."""
+    if isinstance(value, BaseEntity):
+        items = _entity_items(value)
+        if any(nested for _, _, nested in items):
+            return _NESTED
+        return {k: v for k, v, _ in items}
+    return value if _is_scalar(value) else _NESTED
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float))
@@ -0,0 +1,233 @@
+# LyricsGenius
+# copyright 2026 John W. R. Miller
+# See LICENSE for details.
+
+import re
+from array import array
+from typing import NamedTuple
+
+# A line such as "[Chorus]" or "[Verse 1: Andy Shauf]"
+HEADER_RE = re.compile(
+    r"\[\s*(?P<header>[^\]:]*?)\s*(?::\s*(?P<performer>[^\]]*?)\s*)?\]"
+)
+# Brackets removed along with the headers (e.g. "[?]" in a line)
+_BRACKETS_RE = re.compile(r"(\[.*?\])*")
+
+
+class Section(NamedTuple):
+    """A section of the lyrics (e.g. a verse or the chorus).
+
+    :attr:`start` and :attr:`end` are line numbers in the :class:`Lyrics`,
+    so ``lyrics.lines()[section.start:section.end]`` are the lines of the
+    section. The header line itself, if there is one, is ``start - 1``.
+    """
+
+    header: str | None
+    performer: str | None
+    start: int
+    end: int
+
+
+class Lyrics:
+    """Lyrics of a song, split into lines and sections.
+
+    The lyrics are kept in a single string (:attr:`text`, identical to what
+    :meth:`Genius.lyrics <lyricsgenius.Genius.lyrics>` returns) along with
+    the offset of every line in it, so lines and sections are sliced out of
+    that string without scanning it again.
+
+    Attributes:
+        text (:obj:`str`): The lyrics.
+        sections (:obj:`tuple` of :class:`Section`): The sections of the
+            lyrics, in order. Lines before the first header make up a section
+            without a header.
+
+    Examples:
+        .. code:: python
+
+            lyrics = genius.structured_lyrics(song_url=url)
+            for section in lyrics.sections:
+                print(section.header, section.performer)
+                print(lyrics.section_text(section))
+
+    """
+
+    __slots__ = ("text", "sections", "_starts", "_headerless", "_brackets")
+
+    def __init__(
+        self,
+        text: str,
+        line_starts: "array[int]",
+        sections: tuple[Section, ...],
+        brackets: bool = True,
+    ) -> None:
+        self.text = text
+        self.sections = sections
+        self._starts = line_starts
+        self._headerless: str | None = None
+        # Whether there are brackets outside of the header lines (or around
+        # them, like spaces)
+        self._brackets = brackets
+
+    @classmethod
+    def from_text(cls, text: str) -> "Lyrics":
+        """Builds the lines and sections of lyrics you already have as a string."""
+        builder = LyricsBuilder()
+        builder.add(text)
+        return builder.build()
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"Lyrics(lines={len(self)}, sections={len(self.sections)})"
+
+    def __len__(self) -> int:
+        """Returns the number of lines."""
+        return len(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Lyrics):
+            return self.text == other.text
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def _span(self, start: int, end: int) -> tuple[int, int]:
+        """Returns the offsets in :attr:`text` of lines ``start`` to ``end``.
+
+        Empty ranges and empty lines are returned as ``(0, 0)``.
+        """
+        if start >= end:
+            return 0, 0
+        stop = self._starts[end] - 1 if end < len(self._starts) else len(self.text)
+        begin = self._starts[start]
+        return (begin, stop) if begin < stop else (0, 0)
+
+    def line(self, n: int) -> str:
+        """Returns line number ``n`` (starting at 0)."""
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError("line number out of range")
+        start, stop = self._span(n, n + 1)
+        return self.text[start:stop]
+
+    def lines(self) -> list[str]:
+        """Returns all the lines."""
+        return [self.line(n) for n in range(len(self))]
+
+    def section_text(self, section: Section) -> str:
+        """Returns the lines of a section (without its header) as one string."""
+        start, stop = self._span(section.start, section.end)
+        return self.text[start:stop]
+
+    @property
+    def headerless(self) -> str:
+        """The lyrics without [Chorus], [Bridge], etc. headers.
+
+        Same as the lyrics returned by :meth:`Genius.lyrics
+        <lyricsgenius.Genius.lyrics>` when `remove_section_headers` is `True`.
+        It's computed the first time it's accessed.
+        """
+        if self._headerless is None:
+            if self._brackets:
+                # Brackets elsewhere (e.g. "[?]") are removed too
+                text = _BRACKETS_RE.sub("", self.text)
+            else:
+                # Cut out the header lines, leaving their newlines
+                parts = []
+                pos = 0
+                for section in self.sections:
+                    if section.header is not None:
+                        begin, stop = self._span(section.start - 1, section.start)
+                        parts.append(self.text[pos:begin])
+                        pos = stop
+                parts.append(self.text[pos:])
+                text = "".join(parts)
+            text = text.replace("\n\n", "\n")  # Gaps between verses
+            self._headerless = text.strip("\n")
+        return self._headerless
+
+
+class LyricsBuilder:
+    """Collects the text of the lyrics while a page is parsed.
+
+    The offset of every line is recorded as text is added, and each line is
+    checked for a section header once it's complete, so building the
+    :class:`Lyrics` doesn't need another pass to find the lines or sections.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._size = 0
+        self._starts = array("I", [0])
+        # Text of the line being added
+        self._line: list[str] = []
+        self._sections: list[Section] = []
+        self._header: str | None = None
+        self._performer: str | None = None
+        self._start = 0
+        # Line after the last non-blank line of the current section
+        self._end = 0
+        self._brackets = False
+
+    def add(self, text: str) -> None:
+        if not text:
+            return
+        self._chunks.append(text)
+        line_start = 0
+        i = text.find("\n")
+        while i != -1:
+            self._line.append(text[line_start:i])
+            self._end_line()
+            self._starts.append(self._size + i + 1)
+            line_start = i + 1
+            i = text.find("\n", line_start)
+        if line_start < len(text):
+            self._line.append(text[line_start:])
+        self._size += len(text)
+
+    def _end_line(self) -> None:
+        line = self._line[0] if len(self._line) == 1 else "".join(self._line)
+        self._line.clear()
+        if not line:
+            return
+        n = len(self._starts) - 1
+        if "[" in line:
+            stripped = line.strip()
+            match = HEADER_RE.fullmatch(stripped) if stripped[:1] == "[" else None
+            if match is None or stripped != line:
+                self._brackets = True
+            if match is not None:
+                self._close()
+                self._header = match["header"]
+                self._performer = match["performer"] or None
+                self._start = n + 1
+        self._end = n + 1
+
+    def _close(self) -> None:
+        # The blank lines between sections are left out
+        if self._header is not None or self._end > self._start:
+            self._sections.append(
+                Section(self._header, self._performer, self._start, self._end)
+            )
+
+    def build(self) -> Lyrics:
+        """Returns the lyrics, without leading and trailing blank lines."""
+        if self._line:
+            self._end_line()
+        self._close()
+        raw = "".join(self._chunks)
+        text = raw.strip("\n")
+        lead = len(raw) - len(raw.lstrip("\n"))
+        end = lead + len(text)
+        starts = array("I", [0])
+        starts.extend(o - lead for o in self._starts if lead < o <= end)
+        # Each leading newline is a blank line that was removed
+        sections = tuple(
+            s._replace(start=max(s.start - lead, 0), end=s.end - lead)
+            for s in self._sections
+        )
+        return Lyrics(text, starts, sections, self._brackets)
@@ -2,11 +2,15 @@
 # copyright 2026 John W. R. Miller
 # See LICENSE for details.
 
+import hashlib
+from collections.abc import Hashable
+from pathlib import Path
 from typing import Any
 
 from lyricsgenius.utils import format_filename
 
 from .base import BaseEntity
+from .types import IfExistsT
 
 
 class Song(BaseEntity):
@@ -20,6 +24,7 @@ class Song(BaseEntity):
             lyrics (str): The lyrics of the song.
             body (dict[str, Any]): A dictionary containing song metadata.
         """
+        self._lyrics_digest: bytes | None = None
         self.lyrics = lyrics
         self._body = body
 
@@ -49,31 +54,65 @@ class Song(BaseEntity):
         self.writer_artists: list[dict[str, Any]] = body.get("writer_artists", [])
         self.producer_artists: list[dict[str, Any]] = body.get("producer_artists", [])
 
+    @property
+    def lyrics(self) -> str:
+        """The lyrics of the song."""
+        return self._lyrics
+
+    @lyrics.setter
+    def lyrics(self, lyrics: str) -> None:
+        self._lyrics = lyrics
+        self._lyrics_digest = None
+
+    @property
+    def lyrics_digest(self) -> bytes:
+        """A 128-bit BLAKE2 digest of the lyrics.
+
+        It's computed once, and again only if the lyrics are changed.
+        """
+        if self._lyrics_digest is None:
+            self._lyrics_digest = hashlib.blake2b(
+                self._lyrics.encode("utf-8"), digest_size=16
+            ).digest()
+        return self._lyrics_digest
+
+    def _content_key(self) -> tuple[Hashable, ...]:
+        return (self.title, self.artist, self.lyrics_digest)
+
     @property
     def _text_data(self) -> str:
         """Returns the text data for the song."""
         return self.lyrics
 
+    def _json_fields(self) -> dict[str, Any]:
+        return {"artist": self.artist, "lyrics": self.lyrics}
+
     def to_dict(self) -> dict[str, Any]:
         """Converts the Song object to a dictionary."""
-        body = super().to_dict()
-        body["artist"] = self.artist
-        body["lyrics"] = self.lyrics
-        return body
+        return super().to_dict()
 
     def to_json(
         self,
         filename: str | None = None,
         sanitize: bool = True,
         ensure_ascii: bool = True,
+        compact: bool = False,
+        stream: bool = False,
     ) -> str | None:
         return super().to_json(
-            filename=filename, sanitize=sanitize, ensure_ascii=ensure_ascii
+            filename=filename,
+            sanitize=sanitize,
+            ensure_ascii=ensure_ascii,
+            compact=compact,
+            stream=stream,
         )
 
     def to_text(self, filename: str | None = None, sanitize: bool = True) -> str | None:
         return super().to_text(filename=filename, sanitize=sanitize)
 
+    def _default_filename(self) -> str:
+        return format_filename(f"saved_song_lyrics_{self.artist}_{self.title}")
+
     def save_lyrics(
         self,
         filename: str | None = None,
@@ -81,16 +120,22 @@ class Song(BaseEntity):
         overwrite: bool = False,
         ensure_ascii: bool = True,
         sanitize: bool = True,
-    ) -> None:
+        compact: bool = False,
+        if_exists: IfExistsT | None = None,
+        stream: bool = False,
+    ) -> Path | None:
         if filename is None:
-            filename = format_filename(f"saved_song_lyrics_{self.artist}_{self.title}")
+            filename = self._default_filename()
 
-        super().save_lyrics(
+        return super().save_lyrics(
             filename=filename,
             extension=extension,
             overwrite=overwrite,
             ensure_ascii=ensure_ascii,
             sanitize=sanitize,
+            compact=compact,
+            if_exists=if_exists,
+            stream=stream,
         )
 
     def __str__(self) -> str:
@@ -106,17 +151,3 @@ class Song(BaseEntity):
     def __repr__(self) -> str:
         """Return a string representation of the Song object."""
         return f"Song(title={self.title}, artist={self.artist})"
-
-    def __eq__(self, other: object) -> bool:
-        """Check if two Song objects are equal."""
-        if not isinstance(other, Song):
-            return False
-        if self._body.get("id", 1) == other._body.get("id", -1):
-            return True
-
-        # Fallback to attribute comparison if IDs are not definitive
-        return (
-            self.title == other.title
-            and self.artist == other.artist
-            and self.lyrics == other.lyrics
-        )
@@ -0,0 +1,293 @@
+# LyricsGenius
+# copyright 2026 John W. R. Miller
+# See LICENSE for details.
+
+"""Typed versions of common Genius API payloads.
+
+The API methods return plain dictionaries. The structs in this module hold
+the most used fields of songs, artists, albums, search hits and referents
+instead, and are returned by the ``*_data`` methods of :class:`Genius
+<lyricsgenius.Genius>` (e.g. :meth:`Genius.song_data
+<lyricsgenius.Genius.song_data>`). Fields that aren't listed are ignored.
+
+If `msgspec <https://jcristharif.com/msgspec/>`_ is installed, responses are
+decoded straight into the structs, without building dictionaries first, and
+the structs are :class:`msgspec.Struct` types, which are smaller than regular
+objects. Otherwise they're slotted dataclasses built from the decoded
+dictionaries.
+"""
+
+import dataclasses
+import types
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from ..codec import JSONCodec
+
+T = TypeVar("T")
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+if TYPE_CHECKING or not HAS_MSGSPEC:
+
+    class _Struct:
+        __slots__ = ()
+
+    _struct = dataclasses.dataclass(slots=True, kw_only=True)
+    field = dataclasses.field
+else:
+
+    class _Struct(msgspec.Struct, kw_only=True, gc=False):
+        pass
+
+    def _struct(cls: type[T]) -> type[T]:
+        return cls
+
+    field = msgspec.field
+
+
+@_struct
+class ArtistData(_Struct):
+    """An artist."""
+
+    id: int
+    name: str
+    url: str | None = None
+    api_path: str | None = None
+    image_url: str | None = None
+    header_image_url: str | None = None
+    is_verified: bool = False
+    is_meme_verified: bool = False
+
+
+@_struct
+class DateComponents(_Struct):
+    """A date that may only have a year, or a year and a month."""
+
+    year: int | None = None
+    month: int | None = None
+    day: int | None = None
+
+
+@_struct
+class AlbumData(_Struct):
+    """An album (without its tracks)."""
+
+    id: int
+    name: str
+    full_title: str | None = None
+    name_with_artist: str | None = None
+    url: str | None = None
+    api_path: str | None = None
+    cover_art_url: str | None = None
+    cover_art_thumbnail_url: str | None = None
+    release_date_components: DateComponents | None = None
+    artist: ArtistData | None = None
+
+
+@_struct
+class SongData(_Struct):
+    """A song (without its lyrics)."""
+
+    id: int
+    title: str
+    full_title: str | None = None
+    title_with_featured: str | None = None
+    url: str | None = None
+    path: str | None = None
+    api_path: str | None = None
+    lyrics_state: str | None = None
+    annotation_count: int | None = None
+    pyongs_count: int | None = None
+    header_image_url: str | None = None
+    song_art_image_url: str | None = None
+    release_date: str | None = None
+    primary_artist: ArtistData | None = None
+    featured_artists: list[ArtistData] = field(default_factory=list)
+    album: AlbumData | None = None
+
+
+@_struct
+class SearchHitData(_Struct):
+    """A song in search results."""
+
+    result: SongData
+    type: str = "song"
+    index: str = "song"
+    highlights: list[dict[str, Any]] = field(default_factory=list)
+
+
+@_struct
+class AnnotationData(_Struct):
+    """An annotation of a referent.
+
+    :attr:`body` has the text of the annotation in the requested
+    text format (e.g. ``{"plain": "..."}``).
+    """
+
+    id: int
+    body: dict[str, Any] = field(default_factory=dict)
+    url: str | None = None
+    state: str | None = None
+    votes_total: int = 0
+    verified: bool = False
+
+
+@_struct
+class ReferentData(_Struct):
+    """A fragment of a song (or web page) and its annotations."""
+
+    id: int
+    fragment: str | None = None
+    classification: str | None = None
+    url: str | None = None
+    api_path: str | None = None
+    song_id: int | None = None
+    annotator_id: int | None = None
+    annotations: list[AnnotationData] = field(default_factory=list)
+
+
+# Contents of the responses of each endpoint
+
+
+@_struct
+class SongResponse(_Struct):
+    song: SongData
+
+
+@_struct
+class ArtistResponse(_Struct):
+    artist: ArtistData
+
+
+@_struct
+class AlbumResponse(_Struct):
+    album: AlbumData
+
+
+@_struct
+class SearchResponse(_Struct):
+    hits: list[SearchHitData] = field(default_factory=list)
+
+
+@_struct
+class ReferentsResponse(_Struct):
+    referents: list[ReferentData] = field(default_factory=list)
+
+
+@_struct
+class Envelope(_Struct, Generic[T]):
+    """Body of every API response."""
+
+    response: T
+
+
+def decode(data: bytes, type_: Any, codec: JSONCodec) -> Any:
+    """Decodes JSON into a struct type (or a generic alias of one).
+
+    Args:
+        data (:obj:`bytes`): The JSON document.
+        type_: The type to decode, e.g. ``Envelope[SongResponse]``.
+        codec (:class:`JSONCodec <lyricsgenius.codec.JSONCodec>`): Codec used
+            to decode the document when msgspec isn't installed.
+
+    Raises:
+        ValueError: If the document doesn't match the type.
+
+    """
+    if HAS_MSGSPEC:
+        return _decoder(type_).decode(data)
+    return from_dict(type_, codec.loads(data))
+
+
+@lru_cache
+def _decoder(type_: Any) -> Any:
+    return msgspec.json.Decoder(type_)
+
+
+def from_dict(type_: Any, data: Any) -> Any:
+    """Builds a struct from decoded JSON.
+
+    Args:
+        type_: The struct type (or a generic alias of one).
+        data: The decoded JSON.
+
+    Raises:
+        ValueError: If the data doesn't match the type.
+
+    """
+    if HAS_MSGSPEC:
+        return msgspec.convert(data, type_)
+    return _convert(type_, data, {})
+
+
+def _convert(type_: Any, value: Any, typevars: dict[Any, Any]) -> Any:
+    type_ = typevars.get(type_, type_)
+    origin = get_origin(type_)
+    if origin is Union or origin is types.UnionType:
+        if value is None:
+            return None
+        options = [t for t in get_args(type_) if t is not type(None)]
+        return _convert(options[0], value, typevars)
+    if origin is list:
+        if not isinstance(value, list):
+            raise ValueError(f"Expected a list, got {type(value).__name__}.")
+        (item,) = get_args(type_)
+        return [_convert(item, v, typevars) for v in value]
+    if origin is dict:
+        if not isinstance(value, dict):
+            raise ValueError(f"Expected an object, got {type(value).__name__}.")
+        return value
+    if type_ in _SCALARS:
+        return _convert_scalar(type_, value)
+
+    cls = origin or type_
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+        return value
+    if not isinstance(value, dict):
+        raise ValueError(f"Expected an object for {cls.__name__}.")
+    if origin is not None:
+        params = getattr(cls, "__parameters__", ())
+        typevars = {**typevars, **dict(zip(params, get_args(type_), strict=True))}
+    hints = _hints(cls)
+    kwargs = {
+        f.name: _convert(hints[f.name], value[f.name], typevars)
+        for f in dataclasses.fields(cls)
+        if f.name in value
+    }
+    try:
+        return cls(**kwargs)
+    except TypeError as e:
+        raise ValueError(f"Invalid {cls.__name__}: {e}") from e
+
+
+_SCALARS = (int, float, str, bool)
+
+
+def _convert_scalar(type_: type, value: Any) -> Any:
+    """Checks a scalar the way msgspec does: booleans aren't integers, and
+    integers are converted to floats."""
+    if type_ is float and type(value) is int:
+        return float(value)
+    if (type_ is int and isinstance(value, bool)) or not isinstance(value, type_):
+        raise ValueError(f"Expected {type_.__name__}, got {type(value).__name__}.")
+    return value
+
+
+@lru_cache
+def _hints(cls: type) -> dict[str, Any]:
+    return get_type_hints(cls)
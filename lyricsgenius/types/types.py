@@ -4,3 +4,5 @@ ResponseFormatT = Literal["dom", "plain", "html"]
 ScopeOptionT = Literal["me", "create_annotation", "manage_annotation", "vote"]
 ScopeT = tuple[ScopeOptionT, ...] | Literal["all"]
 TextFormatT = Literal["dom", "html", "markdown", "plain"]
+LyricsSourceT = Literal["web", "page_data", "auto"]
+IfExistsT = Literal["prompt", "skip", "overwrite", "version", "fail"]
@@ -4,10 +4,21 @@ import os
 import re
 import sys
 import unicodedata
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from string import punctuation
+from typing import TYPE_CHECKING, TypeVar
 from urllib.parse import parse_qs, urlparse
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def auth_from_environment() -> tuple[str | None, str | None, str | None]:
     """Gets credentials from environment variables.
@@ -67,6 +78,12 @@ def convert_to_datetime(f: str | dict[str, int] | None) -> datetime | None:
     return datetime.strptime(f, date_format)
 
 
+# Characters removed by clean_str
+_PUNCTUATION = str.maketrans("", "", punctuation + "\u200b")
+_ASCII_PUNCTUATION = punctuation.encode("ascii")
+
+
+@lru_cache(maxsize=2**16)
 def clean_str(s: str) -> str:
     """Cleans a string to help with string comparison.
 
@@ -79,9 +96,16 @@ def clean_str(s: str) -> str:
     Returns:
         :obj:`str`: Cleaned string.
 
+    Note:
+        Results are memoized (up to 65536 strings), since the same names
+        and titles are compared over and over. ASCII strings skip the
+        normalization, which doesn't change them.
+
     """
-    punctuation_ = punctuation + "'" + "\u200b"
-    string = s.translate(str.maketrans("", "", punctuation_)).strip().lower()
+    if s.isascii():
+        data = s.encode("ascii").translate(None, _ASCII_PUNCTUATION)
+        return data.decode("ascii").strip().lower()
+    string = s.translate(_PUNCTUATION).strip().lower()
     return unicodedata.normalize("NFKC", string)
 
 
@@ -156,3 +180,45 @@ def sanitize_filename(f: str) -> str:
         for c in f
         if c not in invalid and unicodedata.category(c)[0] != "C"  # drop control chars
     )
+
+
+def prefetch(
+    func: Callable[[T], R], items: Iterable[T], workers: int
+) -> Generator[R, None, None]:
+    """Maps a function over items in a thread pool, yielding results in order.
+
+    At most :obj:`workers` calls run ahead of the consumer, so
+    :obj:`items` may be endless (e.g. page numbers). Calls that haven't
+    started when the generator is closed are cancelled.
+
+    Args:
+        func (:obj:`Callable`): The function (e.g. a request).
+        items (:obj:`Iterable`): Its arguments.
+        workers (:obj:`int`): Number of threads. With one (or fewer),
+            the calls are made one by one, when results are needed.
+
+    Yields:
+        The results of :obj:`func`.
+
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    # concurrent.futures is slow to import, and most uses don't need it
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = iter(items)
+    pending: deque[Future[R]] = deque()
+    with ThreadPoolExecutor(workers) as pool:
+        try:
+            while True:
+                for item in islice(items, workers - len(pending)):
+                    pending.append(pool.submit(func, item))
+                if not pending:
+                    return
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,12 @@
+from collections.abc import Iterator
+
+import pytest
+
+from benchmarks.mock_server import Catalogue, MockGeniusServer
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[MockGeniusServer]:
+    """A local mock of the Genius APIs, shared by the tests of a module."""
+    with MockGeniusServer(Catalogue(num_artists=3, songs_per_artist=6)) as server:
+        yield server
@@ -1,3 +1,4 @@
+import io
 import json
 import os
 from pathlib import Path
@@ -322,3 +323,45 @@ def test_fetch_lyrics_false_skips_lyrics(
     assert mock_lyrics.call_count == 0
     for _, track in result.tracks:
         assert track.lyrics == ""
+
+
+def test_album_equality_and_hash(
+    album_object: Album,
+    mock_album_data: dict[str, Any],
+    mock_track_objects: list[Song],
+) -> None:
+    """Test that albums are compared and hashed by ID, or by content without one."""
+    assert album_object == Album(mock_album_data, [])
+    assert {album_object: 1}[Album(mock_album_data, [])] == 1
+
+    body = {k: v for k, v in mock_album_data.items() if k != "id"}
+    first = Album(body, mock_track_objects)
+    assert first == Album(dict(body), mock_track_objects)
+    assert hash(first) == hash(Album(dict(body), mock_track_objects))
+    assert first != Album(body, mock_track_objects[:1])
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_write_json_matches_to_dict(album_object: Album, ensure_ascii: bool) -> None:
+    """Test that streamed JSON is the same as dumping to_dict()."""
+    album_object.tracks[0][1].lyrics = 'Unicodé lyrics\nwith a "quote"'
+    buffer = io.StringIO()
+    album_object.write_json(buffer, ensure_ascii=ensure_ascii)
+    assert buffer.getvalue() == json.dumps(
+        album_object.to_dict(), indent=4, ensure_ascii=ensure_ascii
+    )
+    assert album_object.to_json(ensure_ascii=ensure_ascii) == json.dumps(
+        album_object.to_dict(), indent=1, ensure_ascii=ensure_ascii
+    )
+
+
+def test_release_date_is_parsed_lazily(mock_album_data: dict[str, Any]) -> None:
+    """Test that the release date is only parsed when it's used."""
+    with mock.patch(
+        "lyricsgenius.types.album.convert_to_datetime", return_value=None
+    ) as convert:
+        album = Album(mock_album_data, [])
+        convert.assert_not_called()
+        assert album.to_dict()["release_date"] is None
+        assert album.release_date_components is None
+        convert.assert_called_once()
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from lyricsgenius import Genius
+from lyricsgenius.archive import HTMLArchive, reextract_lyrics
+
+PAGE = '<div data-lyrics-container="true">[Verse 1]<br/>Archived line<br/></div>'
+URL = "https://genius.com/Archived-song-lyrics"
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> HTMLArchive:
+    return HTMLArchive(tmp_path / "pages")
+
+
+def test_put_and_get(archive: HTMLArchive) -> None:
+    digest = archive.put(URL, PAGE)
+    assert archive.path(digest).is_file()
+    assert archive.get(URL) == PAGE
+    assert archive.get("Archived-song-lyrics") == PAGE
+    assert URL in archive
+    assert archive.get("https://genius.com/Missing-lyrics") is None
+
+
+def test_identical_pages_are_stored_once(archive: HTMLArchive) -> None:
+    first = archive.put(URL, PAGE)
+    second = archive.put("https://genius.com/Duplicate-lyrics", PAGE)
+    assert first == second
+    assert len(list(archive.directory.glob("*/*.html.gz"))) == 1
+    assert len(archive) == 2
+
+
+def test_index_is_reloaded(archive: HTMLArchive) -> None:
+    archive.put(URL, "<p>old</p>")
+    archive.put(URL, PAGE)
+    assert HTMLArchive(archive.directory).get(URL) == PAGE
+
+
+def test_lyrics_saves_pages(
+    archive: HTMLArchive, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    genius = Genius("dummy_token_for_testing", html_archive=archive)
+    monkeypatch.setattr(genius, "_make_request", lambda *a, **kw: {"html": PAGE})
+    assert genius.lyrics(song_url=URL) == "[Verse 1]\nArchived line"
+    assert archive.get(URL) == PAGE
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reextract_lyrics(archive: HTMLArchive, tmp_path: Path, workers: int) -> None:
+    archive.put(URL, PAGE)
+    song = {"title": "Archived Song", "url": URL, "lyrics": "[Verse 1]\nOld"}
+    missing = {"title": "Missing", "url": "https://genius.com/M-lyrics", "lyrics": "x"}
+    saved = tmp_path / "artist.json"
+    saved.write_text(json.dumps({"name": "A", "songs": [song, missing]}))
+
+    updated = reextract_lyrics(
+        archive, [saved], remove_section_headers=True, workers=workers
+    )
+
+    assert updated == 1
+    songs = json.loads(saved.read_text())["songs"]
+    assert songs[0]["lyrics"] == "Archived line"
+    assert songs[1]["lyrics"] == "x"
+    # Written atomically with json, whatever codec read it
+    data = json.loads(saved.read_text())
+    assert saved.read_text() == json.dumps(data, indent=4)
+    assert [p.name for p in tmp_path.glob(".*.tmp")] == []
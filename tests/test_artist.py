@@ -1,3 +1,4 @@
+import io
 import json
 import os
 from pathlib import Path
@@ -473,3 +474,69 @@ def test_saving_txt_file(artist_object: Artist, tmp_path: Path) -> None:
     )
     # Restore original lyrics
     artist_object.songs[0].lyrics = original_lyrics
+
+
+def test_get_song_by_title(
+    artist_object: Artist, primary_artist_songs: list[Song]
+) -> None:
+    """Test retrieving songs by title, ignoring case and punctuation."""
+    assert (
+        artist_object.get_song(title="Assert Equals Blues") == (primary_artist_songs[0])
+    )
+    assert (
+        artist_object.get_song(title="patch decorator funk!")
+        == (primary_artist_songs[1])
+    )
+    assert artist_object.get_song(title="Missing Song") is None
+
+
+def test_add_song_skips_duplicates(
+    artist_object: Artist, song_to_add_object: Song, song_to_add_data: dict[str, Any]
+) -> None:
+    """Test that a song isn't added twice, even after the list changes."""
+    assert artist_object.add_song(song_to_add_object) is song_to_add_object
+    assert artist_object.add_song(Song("Other lyrics", song_to_add_data)) is None
+
+    # Songs without an ID are compared by title, artist and lyrics
+    body = {k: v for k, v in song_to_add_data.items() if k != "id"}
+    song_without_id = Song(song_to_add_object.lyrics, body)
+    assert artist_object.add_song(song_without_id) is song_without_id
+    assert artist_object.add_song(Song(song_to_add_object.lyrics, body)) is None
+    artist_object.songs.remove(song_without_id)
+
+    artist_object.songs.pop()
+    assert song_to_add_object not in artist_object.songs
+    assert artist_object.get_song(song_to_add_data["id"]) is None
+    assert artist_object.add_song(song_to_add_object) is song_to_add_object
+
+    artist_object.songs = []
+    assert artist_object.get_song(song_to_add_data["id"]) is None
+    assert artist_object.add_song(song_to_add_object) is song_to_add_object
+    assert artist_object.get_song(song_to_add_data["id"]) is song_to_add_object
+
+
+def test_write_json_matches_to_dict(artist_object: Artist) -> None:
+    """Test that streamed JSON is the same as dumping to_dict()."""
+    buffer = io.StringIO()
+    artist_object.write_json(buffer)
+    assert buffer.getvalue() == json.dumps(artist_object.to_dict(), indent=4)
+
+    artist_object.songs = []
+    assert artist_object.to_json() == json.dumps(artist_object.to_dict(), indent=1)
+
+
+def test_streamed_file(artist_object: Artist, tmp_path: Path) -> None:
+    """Test that streaming a file is opt-in and writes the same JSON."""
+    one_shot = tmp_path / "one_shot.json"
+    streamed = tmp_path / "streamed.json"
+    with mock.patch.object(Artist, "write_json") as write_json:
+        artist_object.save_lyrics(str(one_shot), overwrite=True)
+        write_json.assert_not_called()
+    artist_object.save_lyrics(str(streamed), overwrite=True, stream=True)
+    assert streamed.read_text() == one_shot.read_text()
+
+    # Values of the bodies are shared, not copied
+    song = artist_object.songs[0]
+    data = artist_object.to_dict()
+    assert data["songs"][0]["primary_artist"] is song._body["primary_artist"]
+    assert data["songs"][0] is not song._body
@@ -223,3 +223,62 @@ class TestArtistSearchPagination:
             g.search_artist("Radiohead", max_songs=0)
 
         assert call_count == 10, "Should stop after max_pages=10 pages (default)"
+
+    def test_concurrent_pages(self, g: Genius) -> None:
+        """With search_workers, later pages are requested ahead of time."""
+        pages = {
+            1: [_artist_hit(i, f"Radiohead Tribute {i}") for i in range(1, 6)],
+            2: [_artist_hit(99, "Radiohead")],
+        }
+        requested: list[int] = []
+
+        def mock_search_all(
+            term: str, per_page: int = 5, page: int = 1
+        ) -> dict[str, Any]:
+            requested.append(page)
+            return _search_response(pages.get(page, []))
+
+        with (
+            mock.patch.object(g, "search_all", side_effect=mock_search_all),
+            mock.patch.object(g, "artist", return_value=_artist_info(99, "Radiohead")),
+            mock.patch.object(
+                g, "artist_songs", return_value={"songs": [], "next_page": None}
+            ),
+        ):
+            result = g.search_artist("Radiohead", max_songs=0, search_workers=3)
+
+        assert result is not None
+        assert result.name == "Radiohead"
+        # Page 3 was requested ahead, unless it was cancelled before it started
+        assert sorted(requested) in ([1, 2], [1, 2, 3])
+
+
+class TestSearchResponseMatching:
+    def test_prefers_type_section(self, g: Genius) -> None:
+        """Hits in the section of the type are checked before other sections."""
+        lyric_hit = {"index": "song", "result": {"id": 1, "title": "Creep"}}
+        song_hit = {"index": "song", "result": {"id": 2, "title": "Creep"}}
+        response = {
+            "sections": [
+                {"type": "top_hit", "hits": []},
+                {"type": "lyric", "hits": [lyric_hit]},
+                {"type": "song", "hits": [song_hit]},
+            ]
+        }
+        item = g._get_item_from_search_response(response, "creep", "song", "title")
+        assert item is not None
+        assert item["id"] == 2
+
+    def test_falls_back_to_other_sections(self, g: Genius) -> None:
+        g.skip_non_songs = False
+        lyric_hit = {"index": "song", "result": {"id": 1, "title": "Creep"}}
+        response = {
+            "sections": [
+                {"type": "top_hit", "hits": []},
+                {"type": "song", "hits": []},
+                {"type": "lyric", "hits": [lyric_hit]},
+            ]
+        }
+        item = g._get_item_from_search_response(response, "Creep", "song", "title")
+        assert item is not None
+        assert item["id"] == 1
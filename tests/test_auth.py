@@ -123,7 +123,7 @@ class TestOAuth2(unittest.TestCase):
 
         input_ = MagicMock(return_value="http://example.com?code=some_code")
         with (
-            patch(current_module + ".webbrowser", MagicMock()),
+            patch("webbrowser.open", MagicMock()),
             patch(current_module + ".input", input_),
             patch(current_module + ".print", MagicMock()),
             patch("requests.Session.request", side_effect=mocked_requests_post),
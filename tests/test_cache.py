@@ -0,0 +1,103 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from benchmarks.mock_server import MockGeniusServer
+from lyricsgenius import Genius
+from lyricsgenius.cache import ResolutionCache
+
+
+@pytest.fixture
+def genius(server: MockGeniusServer) -> Genius:
+    return server.client(resolution_cache=ResolutionCache())
+
+
+def test_normalized_terms() -> None:
+    cache = ResolutionCache()
+    cache.set("artist", 1, "Andy Shauf")
+    assert cache.get("artist", "andy shauf!") == 1
+    assert cache.get("album", "Andy Shauf") is None
+    with pytest.raises(ValueError):
+        cache.get("lyrics", "Andy Shauf")
+
+
+def test_ttl() -> None:
+    cache = ResolutionCache(ttl=60)
+    cache.set("song", 2, "The Magician", "Andy Shauf")
+    with mock.patch("time.time", return_value=10**11):
+        assert cache.get("song", "The Magician", "Andy Shauf") is None
+        assert cache.purge() == 1
+    assert len(cache) == 0
+
+
+def test_invalidate() -> None:
+    cache = ResolutionCache(ttl=None)
+    cache.set("song", 1, "A", "X")
+    cache.set("song", 2, "B", "X")
+    cache.set("artist", 3, "X")
+    assert cache.invalidate("song", "A", "X") == 1
+    assert cache.get("song", "B", "X") == 2
+    assert cache.invalidate("song") == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_persistence(tmp_path: Path) -> None:
+    path = tmp_path / "resolved.sqlite"
+    cache = ResolutionCache(path)
+    cache.set("album", 100, "The Party", "Andy Shauf")
+    cache.close()
+    assert ResolutionCache(path).get("album", "the party", "andy shauf") == 100
+
+
+def test_search_artist(genius: Genius) -> None:
+    with mock.patch.object(genius, "search_all", wraps=genius.search_all) as search:
+        first = genius.search_artist("Mock Artist 2", max_songs=1)
+        second = genius.search_artist("mock artist 2", max_songs=1)
+    assert search.call_count == 1
+    assert first is not None and second is not None
+    assert first.key == second.key == ("id", 2)
+
+
+def test_search_song(genius: Genius) -> None:
+    with mock.patch.object(genius, "search_all", wraps=genius.search_all) as search:
+        first = genius.search_song("Mock Song 3", "Mock Artist 1")
+        second = genius.search_song("Mock Song 3", "Mock Artist 1")
+    assert search.call_count == 1
+    assert first is not None and second is not None
+    assert first.key == second.key
+    assert first.lyrics == second.lyrics
+
+
+def test_search_album(genius: Genius) -> None:
+    with mock.patch.object(genius, "search_all", wraps=genius.search_all) as search:
+        genius.search_album("Mock Album 1", "Mock Artist 1", fetch_lyrics=False)
+        album = genius.search_album("Mock Album 1", "Mock Artist 1", fetch_lyrics=False)
+    assert search.call_count == 1
+    assert album is not None
+    assert album.key == ("id", 100)
+
+
+def test_guesses_not_cached(server: MockGeniusServer) -> None:
+    # Without ranking, neither search matches a name exactly, so the first
+    # hit is a guess
+    genius = server.client(resolution_cache=ResolutionCache(), match_threshold=None)
+    assert genius.search_song("Mock Song", get_full_info=False) is not None
+    assert genius.search_artist("Mock Artist", max_songs=0) is not None
+    assert len(genius.resolution_cache) == 0
+
+
+def test_settings(server: MockGeniusServer) -> None:
+    cache = ResolutionCache()
+    genius = server.client(resolution_cache=cache)
+    assert genius.search_song("Mock Song 3", "Mock Artist 1") is not None
+    assert len(cache) == 1
+
+    # A client with other settings doesn't use the entry
+    other = server.client(resolution_cache=cache, skip_non_songs=False)
+    with mock.patch.object(other, "search_all", wraps=other.search_all) as search:
+        other.search_song("Mock Song 3", "Mock Artist 1")
+    assert search.call_count == 1
+    assert len(cache) == 2
+    assert cache.invalidate("song", "Mock Song 3", "Mock Artist 1") == 2
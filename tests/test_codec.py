@@ -0,0 +1,91 @@
+import io
+import json
+from typing import Any
+
+import pytest
+
+from lyricsgenius.codec import JSONCodec, available_codecs, get_codec
+from lyricsgenius.types import Song
+
+DATA = {
+    "title": "Café 😀",
+    "lyrics": '[Verse 1]\nA "quoted" line\n',
+    "nested": {"list": [1, 2.5, None, True], "empty": {}, "none": []},
+}
+
+
+@pytest.fixture(params=available_codecs())
+def codec(request: pytest.FixtureRequest) -> JSONCodec:
+    return get_codec(request.param)
+
+
+@pytest.mark.parametrize("indent", [None, 1, 2, 4])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_dumps_matches_stdlib(
+    codec: JSONCodec, indent: int | None, ensure_ascii: bool
+) -> None:
+    expected = get_codec("json").dumps(DATA, indent, ensure_ascii)
+    assert codec.dumps(DATA, indent, ensure_ascii) == expected
+    assert codec.loads(expected.encode("utf-8")) == DATA
+
+
+def test_compact_output() -> None:
+    assert get_codec("json").dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+
+def test_get_codec() -> None:
+    assert get_codec().name == available_codecs()[0]
+    assert get_codec("json") is get_codec("json")
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_song_json(codec: JSONCodec, tmp_path: Any) -> None:
+    body = {"id": 1, "title": DATA["title"], "primary_artist": {"name": "É"}}
+    song = Song(DATA["lyrics"], body)
+
+    buffer = io.StringIO()
+    song.write_json(buffer, indent=None, codec=codec)
+    assert buffer.getvalue() == json.dumps(song.to_dict(), separators=(",", ":"))
+
+    path = tmp_path / "song.json"
+    song.save_lyrics(str(path), compact=True, overwrite=True)
+    assert path.read_text() == song.to_json(compact=True)
+    assert json.loads(path.read_text()) == song.to_dict()
+
+
+@pytest.mark.parametrize("indent", [1, 4])
+def test_orjson_reindent(monkeypatch: pytest.MonkeyPatch, indent: int) -> None:
+    pytest.importorskip("orjson")
+    monkeypatch.setattr("lyricsgenius.codec._C_INDENT", False)
+    expected = get_codec("json").dumps(DATA, indent)
+    assert get_codec("orjson").dumps(DATA, indent) == expected
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("orjson", "[1e+16,1.5e-7,null,null]"),
+        ("msgspec", "[1e16,1.5e-7,null,null]"),
+    ],
+)
+def test_codec_differences(name: str, expected: str) -> None:
+    pytest.importorskip(name)
+    values = [1e16, 1.5e-7, float("nan"), float("inf")]
+    assert get_codec("json").dumps(values) == "[1e+16,1.5e-07,NaN,Infinity]"
+    assert get_codec(name).dumps(values) == expected
+
+
+def test_files_use_json(tmp_path: Any) -> None:
+    body = {"id": 1, "title": "T", "primary_artist": {"name": "A"}}
+    body["stats"] = {"ratio": 1.5e-7, "nan": float("nan"), "big": 2**70}
+    song = Song("", body)
+    expected = json.dumps(song.to_dict(), indent=4)
+
+    path = tmp_path / "song.json"
+    for stream in (False, True):
+        song.save_lyrics(str(path), overwrite=True, stream=stream)
+        assert path.read_text() == expected
+    assert song.to_json() == json.dumps(song.to_dict(), indent=1)
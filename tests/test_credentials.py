@@ -0,0 +1,65 @@
+import pytest
+
+from benchmarks.mock_server import Catalogue, MockGeniusServer
+from lyricsgenius.credentials import CredentialPool
+from lyricsgenius.errors import NoCredentialsError
+
+SONG_ID = 10001
+
+
+def test_rotation() -> None:
+    with MockGeniusServer(Catalogue(num_artists=1, songs_per_artist=2)) as server:
+        genius = server.client(access_token=["token-a", "token-b", "token-c"])
+        for _ in range(9):
+            genius.song(SONG_ID)
+        assert server.tokens == {"token-a": 3, "token-b": 3, "token-c": 3}
+        assert [u.requests for u in genius.credentials.usage()] == [3, 3, 3]
+
+
+def test_quota() -> None:
+    pool = CredentialPool(["token-a", "token-b"], quota=2, window=3600)
+    tokens = [pool.acquire() for _ in range(4)]
+    assert sorted(tokens) == ["token-a", "token-a", "token-b", "token-b"]
+    assert not pool.ready()
+    assert all(u.recent == 2 and u.cooldown > 3000 for u in pool.usage())
+
+
+def test_throttled_tokens() -> None:
+    catalogue = Catalogue(num_artists=1, songs_per_artist=2)
+    with MockGeniusServer(catalogue, token_quota=2) as server:
+        genius = server.client(access_token=["token-a", "token-b", "token-c"])
+        for _ in range(6):
+            genius.song(SONG_ID)
+
+        # Every token gets a 429, then the last response is returned
+        with pytest.raises(AssertionError, match="429"):
+            genius.song(SONG_ID)
+        usage = genius.credentials.usage()
+        assert [u.throttled for u in usage] == [1, 1, 1]
+        assert all(55 < u.cooldown <= 60 for u in usage)
+        assert not genius.credentials.ready()
+
+
+def test_revoked_tokens() -> None:
+    catalogue = Catalogue(num_artists=1, songs_per_artist=2)
+    with MockGeniusServer(catalogue, revoked_tokens={"revoked"}) as server:
+        genius = server.client(access_token=["revoked", "valid"])
+        for _ in range(3):
+            assert genius.song(SONG_ID)["song"]["id"] == SONG_ID
+        assert server.tokens == {"revoked": 1, "valid": 3}
+        assert len(genius.credentials) == 1
+        assert genius.credentials.usage()[0].evicted
+
+        genius = server.client(access_token=CredentialPool(["revoked"]))
+        with pytest.raises(AssertionError, match="401"):
+            genius.song(SONG_ID)
+        with pytest.raises(NoCredentialsError):
+            genius.song(SONG_ID)
+
+
+def test_invalid_pools() -> None:
+    with pytest.raises(ValueError):
+        CredentialPool([])
+    with pytest.raises(TypeError):
+        CredentialPool(["token", ""])
+    assert len(CredentialPool(["token", "token"])) == 1
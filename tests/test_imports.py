@@ -0,0 +1,26 @@
+import pytest
+
+import lyricsgenius
+from benchmarks.imports import DEFERRED_MODULES, HEAVY_MODULES, loaded_modules
+
+
+def test_lazy_package() -> None:
+    assert not loaded_modules("import lyricsgenius").intersection(HEAVY_MODULES)
+
+
+def test_genius_without_parsers() -> None:
+    modules = loaded_modules("from lyricsgenius import Genius")
+    assert "lyricsgenius.genius" in modules
+    assert not modules.intersection(DEFERRED_MODULES)
+    # Nor does making a client without an archive or a cache
+    modules = loaded_modules("from lyricsgenius import Genius; Genius('token')")
+    assert not modules.intersection(DEFERRED_MODULES)
+
+
+def test_lazy_attributes() -> None:
+    from lyricsgenius.genius import Genius
+
+    assert lyricsgenius.Genius is Genius
+    assert {"API", "Genius", "OAuth2"} <= set(dir(lyricsgenius))
+    with pytest.raises(AttributeError):
+        lyricsgenius.Client  # noqa: B018
@@ -0,0 +1,122 @@
+import time
+from typing import Any
+
+import pytest
+from bs4 import BeautifulSoup, Tag
+
+from benchmarks.mock_server import Catalogue
+from lyricsgenius import Genius
+from lyricsgenius.parsing import extract_fragment_lyrics, extract_tag_hits
+
+PAGE = (
+    "<html><body>"
+    '<div class="LyricsHeader__Container-sc-1">Song Lyrics</div>'
+    '<div data-lyrics-container="true">'
+    "[Verse 1]<br/>First <i>line</i><br/>Second line<br/>"
+    '<span data-exclude-from-selection="true">Embed</span>'
+    "</div>"
+    '<div data-lyrics-container="true"></div>'
+    '<div data-lyrics-container="true">[Chorus]<br/>Sing it<br/></div>'
+    "</body></html>"
+)
+
+
+@pytest.fixture
+def genius() -> Genius:
+    return Genius("dummy_token_for_testing")
+
+
+def test_parse_lyrics_html(genius: Genius) -> None:
+    lyrics = genius.parse_lyrics_html(PAGE)
+    assert lyrics == "[Verse 1]\nFirst line\nSecond line\n\n[Chorus]\nSing it"
+
+
+def test_parse_lyrics_html_remove_section_headers(genius: Genius) -> None:
+    lyrics = genius.parse_lyrics_html(PAGE, remove_section_headers=True)
+    assert lyrics == "First line\nSecond line\n\nSing it"
+
+    genius.remove_section_headers = True
+    assert genius.parse_lyrics_html(PAGE) == lyrics
+
+
+def test_parse_lyrics_html_without_lyrics(genius: Genius) -> None:
+    assert genius.parse_lyrics_html("<html><body>Nothing</body></html>") is None
+
+
+def test_lyrics_uses_parser(genius: Genius, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(genius, "_make_request", lambda *a, **kw: {"html": PAGE})
+    assert genius.lyrics(song_url="https://genius.com/x-lyrics") == (
+        genius.parse_lyrics_html(PAGE)
+    )
+
+
+def test_extract_fragment_lyrics() -> None:
+    fragment = (
+        "<p>[Verse 1]<br>\n"
+        '<a href="/1" data-id="1">First <i>line</i></a><br>Rock &amp; roll</p>'
+        "\n\n<p>[Chorus]<br/>Sing it</p>"
+    )
+    lyrics = extract_fragment_lyrics(fragment)
+    assert lyrics is not None
+    assert lyrics.text == "[Verse 1]\nFirst line\nRock & roll\n\n[Chorus]\nSing it"
+    assert [s.header for s in lyrics.sections] == ["Verse 1", "Chorus"]
+    assert extract_fragment_lyrics("<p></p>") is None
+
+
+def _soup_tag_hits(html: str) -> list[dict[str, Any]]:
+    """How tag pages were parsed with BeautifulSoup."""
+    ul = BeautifulSoup(html, "html.parser").find("ul", class_="song_list")
+    assert isinstance(ul, Tag)
+    hits = []
+    for li in ul.find_all("li"):
+        a = li.a
+        song = [x.replace("\xa0", " ") for x in a.span.stripped_strings]
+        element = a.find("span", class_="title_with_artists")
+        hits.append(
+            {
+                "url": a.attrs["href"],
+                "title_with_artists": element.get_text().strip().replace("\xa0", " "),
+                "title": song[0],
+                "artists": song[2].split(" & "),
+                "featured_artists": [name for name in song[4:-1] if len(name) > 1],
+            }
+        )
+    return hits
+
+
+def test_extract_tag_hits() -> None:
+    html = Catalogue(num_artists=3, songs_per_artist=8).tag_html()
+    html = html.replace("Mock Song 1<", "Rock &amp; Roll<")
+    html = html.replace("Mock\xa0Artist\xa03", "Mock\xa0Artist\xa03 &amp; Guest")
+    # Lists elsewhere on the page are ignored
+    html = html.replace(
+        "<body>", '<body><ul class="nav"><li><a href="/">x</a></li></ul>'
+    )
+    hits = extract_tag_hits(html)
+    assert hits == _soup_tag_hits(html)
+    assert hits is not None and len(hits) == 20
+    assert hits[0]["title"] == "Rock & Roll"
+    assert hits[-1]["artists"] == ["Mock Artist 3", "Guest"]
+    assert any(hit["featured_artists"] for hit in hits)
+    assert extract_tag_hits("<html><body><ul></ul></body></html>") is None
+
+
+@pytest.mark.parametrize("parse_workers", [0, 2])
+def test_iter_lyrics_keeps_order(
+    genius: Genius, monkeypatch: pytest.MonkeyPatch, parse_workers: int
+) -> None:
+    def make_request(path: str, **kwargs: Any) -> dict[str, str]:
+        n = int(path.split("-")[1])
+        time.sleep(0.01 * (n % 3))  # Finish out of order
+        if n == 4:
+            return {"html": "<html><body>No lyrics</body></html>"}
+        return {"html": f'<div data-lyrics-container="true">Song {n}</div>'}
+
+    monkeypatch.setattr(genius, "_make_request", make_request)
+    urls = [f"https://genius.com/song-{n}-lyrics" for n in range(8)]
+
+    lyrics = list(
+        genius.iter_lyrics(urls, fetch_workers=3, parse_workers=parse_workers)
+    )
+
+    assert lyrics == [None if n == 4 else f"Song {n}" for n in range(8)]
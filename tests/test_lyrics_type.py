@@ -0,0 +1,75 @@
+import pytest
+
+from lyricsgenius import Genius
+from lyricsgenius.parsing import extract_lyrics
+from lyricsgenius.types import Lyrics, Section
+from lyricsgenius.types.lyrics import LyricsBuilder
+
+from .test_lyrics_parsing import PAGE
+
+
+@pytest.fixture
+def lyrics(monkeypatch: pytest.MonkeyPatch) -> Lyrics:
+    genius = Genius("dummy_token_for_testing")
+    monkeypatch.setattr(genius, "_make_request", lambda *a, **kw: {"html": PAGE})
+    result = genius.structured_lyrics(song_url="https://genius.com/x-lyrics")
+    assert result is not None
+    return result
+
+
+def test_text_matches_lyrics(lyrics: Lyrics) -> None:
+    assert lyrics.text == extract_lyrics(PAGE)
+    assert lyrics.headerless == extract_lyrics(PAGE, remove_section_headers=True)
+
+
+def test_sections(lyrics: Lyrics) -> None:
+    assert lyrics.sections == (
+        Section("Verse 1", None, 1, 3),
+        Section("Chorus", None, 5, 6),
+    )
+    assert [lyrics.section_text(s) for s in lyrics.sections] == [
+        "First line\nSecond line",
+        "Sing it",
+    ]
+
+
+def test_lines(lyrics: Lyrics) -> None:
+    assert lyrics.lines() == lyrics.text.split("\n")
+    assert len(lyrics) == 6
+    assert lyrics.line(0) == "[Verse 1]"
+    assert lyrics.line(-1) == "Sing it"
+    with pytest.raises(IndexError):
+        lyrics.line(6)
+
+
+def test_from_text() -> None:
+    text = "Intro line\n\n[Verse 1: Andy Shauf]\nOne\nTwo\n\n[Outro]"
+    lyrics = Lyrics.from_text(text)
+    assert lyrics.lines() == text.split("\n")
+    assert lyrics.sections == (
+        Section(None, None, 0, 1),
+        Section("Verse 1", "Andy Shauf", 3, 5),
+        Section("Outro", None, 7, 7),
+    )
+    assert lyrics.section_text(lyrics.sections[-1]) == ""
+    assert Lyrics.from_text("").sections == ()
+
+
+@pytest.mark.parametrize(
+    "text, headerless",
+    [
+        ("\n[Verse 1]\nOne\nTwo\n\n[Chorus]\nThree\n", "One\nTwo\n\nThree"),
+        # Other brackets are removed as well
+        ("[Verse 1]\nOne [?]\n [Chorus] \nTwo", "One \n  \nTwo"),
+    ],
+)
+def test_headerless(text: str, headerless: str) -> None:
+    # Headers split across chunks, like text nodes of a page
+    builder = LyricsBuilder()
+    for i in range(0, len(text), 3):
+        builder.add(text[i : i + 3])
+    lyrics = builder.build()
+    assert lyrics == Lyrics.from_text(text)
+    assert lyrics.sections == Lyrics.from_text(text).sections
+    assert [s.header for s in lyrics.sections] == ["Verse 1", "Chorus"]
+    assert lyrics.headerless == headerless
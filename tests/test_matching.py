@@ -0,0 +1,178 @@
+from typing import Any
+from unittest import mock
+
+import pytest
+import requests
+
+from benchmarks.mock_server import MockGeniusServer
+from lyricsgenius import Genius
+from lyricsgenius.cache import ResolutionCache
+from lyricsgenius.matching import Query, similarity, split_artists
+
+
+def _song(title: str, artist: str, *featured: str, id_: int = 0) -> dict[str, Any]:
+    return {
+        "id": id_,
+        "title": title,
+        "lyrics_state": "complete",
+        "primary_artist": {"name": artist},
+        "featured_artists": [{"name": name} for name in featured],
+    }
+
+
+def test_similarity() -> None:
+    assert similarity("creep", "creep") == 1.0
+    assert similarity("on water walk", "walk on water") > 0.8
+    assert similarity("radiohead", "radiohead tribute") < 1.0
+    assert similarity("creep", "karma police") < 0.5
+
+
+def test_split_artists() -> None:
+    assert split_artists("Eminem feat. Beyoncé & Ed Sheeran") == [
+        "eminem",
+        "beyoncé",
+        "ed sheeran",
+    ]
+
+
+@pytest.mark.parametrize(
+    "title",
+    ["Walk on Water (Ft. Beyoncé)", "Walk on Water [feat. Beyoncé]", "walk on water!"],
+)
+def test_featured_artists_ignored(title: str) -> None:
+    assert Query("Walk on Water").score_title(title) == 1.0
+
+
+def test_versions() -> None:
+    results = [
+        _song("Creep (Acoustic)", "Radiohead", id_=1),
+        _song("Creep - 2009 Remaster", "Radiohead", id_=2),
+        _song("Creep", "Radiohead", id_=3),
+    ]
+    assert Query("Creep", "Radiohead").rank(results)[0].result["id"] == 3
+    assert Query("Creep (Acoustic)", "Radiohead").rank(results)[0].result["id"] == 1
+    assert Query("Creep Remastered", "Radiohead").rank(results)[0].result["id"] == 2
+
+
+def test_artist() -> None:
+    query = Query("Walk on Water", "Eminem feat. Beyoncé")
+    results = [
+        _song("Walk on Water", "Thirty Seconds to Mars", id_=1),
+        _song("Walk on Water", "Eminem", "Beyoncé", id_=2),
+    ]
+    best = query.best(results)
+    assert best is not None
+    assert best.result["id"] == 2
+    assert best.score == 1.0
+    assert query.best(results[:1]) is None
+
+
+def test_albums() -> None:
+    album = {"name": "The Party", "artist": {"name": "Andy Shauf"}}
+    assert Query("the party", "Andy Shauf").score_result(album) == 1.0
+
+
+def _response(*songs: dict[str, Any]) -> dict[str, Any]:
+    hits = [{"index": "song", "result": song} for song in songs]
+    return {
+        "sections": [
+            {"type": "top_hit", "hits": hits[:1]},
+            {"type": "song", "hits": hits},
+        ]
+    }
+
+
+def test_search_response_ranking() -> None:
+    genius = Genius("token", sleep_time=0)
+    response = _response(
+        _song("Creep", "TLC", id_=1),
+        _song("Creep (Live)", "Radiohead", id_=2),
+        _song("Creep", "Radiohead", id_=3),
+    )
+    item = genius._get_item_from_search_response(
+        response, "Creep", "song", "title", artist="Radiohead"
+    )
+    assert item is not None
+    assert item["id"] == 3
+
+    # Without ranking, the first exact title match is picked
+    genius.match_threshold = None
+    item = genius._get_item_from_search_response(
+        response, "Creep", "song", "title", artist="Radiohead"
+    )
+    assert item is not None
+    assert item["id"] == 1
+
+
+def test_match_songs(server: MockGeniusServer) -> None:
+    genius = server.client(resolution_cache=ResolutionCache())
+    pairs = [
+        ("Mock Song 3", "Mock Artist 2"),
+        ("Nothing Like It", "Nobody"),
+        ("mock song 3!", "mock artist 2"),
+        ("Mock Song 1", "Mock Artist 3"),
+    ]
+    with mock.patch.object(genius, "search_all", wraps=genius.search_all) as search:
+        matches = genius.match_songs(pairs, workers=2)
+    assert search.call_count == 3
+
+    assert [m.title for m in matches] == [title for title, _ in pairs]
+    first, missing, duplicate, last = matches
+    assert first.song is not None and first.score == 1.0
+    assert first.song.key == ("id", 20003)
+    assert duplicate.song is first.song
+    assert missing.song is None
+    assert last.song is not None and last.song.key == ("id", 30001)
+    assert first.song.lyrics == ""
+
+    # Resolved songs are in the cache
+    with mock.patch.object(genius, "search_all", wraps=genius.search_all) as search:
+        (match,) = genius.match_songs(pairs[:1], fetch_lyrics=True)
+    assert search.call_count == 0
+    assert match.song is not None
+    assert match.song.lyrics.startswith("[Verse 1]")
+
+
+def test_match_songs_errors(server: MockGeniusServer) -> None:
+    cache = ResolutionCache()
+    genius = server.client(resolution_cache=cache, match_threshold=0.99)
+    # A cached song that doesn't reach the threshold isn't a match
+    settings = genius._cache_settings("song")
+    cache.set("song", 30001, "Mock Song 1", "Mock Artist 1", settings=settings)
+    search_all = genius.search_all
+
+    def flaky_search(search_term: str, *args: Any, **kwargs: Any) -> Any:
+        if search_term.startswith("Mock Song 2"):
+            raise requests.exceptions.Timeout("Timed out")
+        return search_all(search_term, *args, **kwargs)
+
+    pairs = [
+        ("Mock Song 1", "Mock Artist 1"),
+        ("Mock Song 2", "Mock Artist 1"),
+        ("Mock Song 3", "Mock Artist 1"),
+    ]
+    with mock.patch.object(genius, "search_all", side_effect=flaky_search):
+        cached, failed, matched = genius.match_songs(pairs, workers=2)
+    assert cached.song is None and 0 < cached.score < 0.99
+    assert cached.error is None
+    assert cache.get("song", "Mock Song 1", "Mock Artist 1", settings=settings) is None
+    assert failed.song is None and failed.score == 0.0
+    assert isinstance(failed.error, requests.exceptions.Timeout)
+    assert matched.song is not None and matched.error is None
+
+
+def test_match_songs_error_responses() -> None:
+    with MockGeniusServer(error_rate=0.3, seed=1) as server:
+        genius = server.client(match_threshold=0.5)
+        pairs = [
+            (song["title"], song["primary_artist"]["name"])
+            for song in server.catalogue.songs.values()
+        ]
+        matches = genius.match_songs(pairs, workers=4)
+    assert [(m.title, m.artist) for m in matches] == pairs
+    failed = [m for m in matches if m.error is not None]
+    assert failed and len(failed) < len(matches)
+    for match in failed:
+        assert isinstance(match.error, AssertionError)
+        assert match.song is None and match.score == 0.0
+    assert all(m.song is not None for m in matches if m.error is None)
@@ -0,0 +1,134 @@
+"""Offline tests for Genius against the local benchmark server."""
+
+import pytest
+
+from benchmarks.mock_server import Catalogue, MockGeniusServer
+from lyricsgenius import Genius
+from lyricsgenius.codec import available_codecs
+
+
+@pytest.fixture
+def genius(server: MockGeniusServer) -> Genius:
+    return server.client()
+
+
+def test_search_artist(genius: Genius) -> None:
+    artist = genius.search_artist("Mock Artist 2", max_songs=3, get_full_info=False)
+    assert artist is not None
+    assert artist.name == "Mock Artist 2"
+    assert artist.num_songs == 3
+    assert artist.songs[0].lyrics.startswith("[Verse 1]\nLine 0 of verse 1")
+
+
+def test_search_album(genius: Genius) -> None:
+    album = genius.search_album("Mock Album 1", "Mock Artist 1")
+    assert album is not None
+    assert len(album.tracks) == 6
+    assert album.tracks[-1][1].lyrics
+
+
+@pytest.mark.parametrize("codec", available_codecs())
+def test_json_codecs(server: MockGeniusServer, codec: str) -> None:
+    genius = server.client(json_codec=codec)
+    assert genius.json_codec.name == codec
+    assert genius.song(10001)["song"] == server.catalogue.songs[10001]
+
+
+def test_lyrics_page(genius: Genius, server: MockGeniusServer) -> None:
+    song = server.catalogue.songs[10001]
+    lyrics = genius.lyrics(song_url=song["url"])
+    assert lyrics is not None
+    assert "Embed" not in lyrics
+    assert lyrics.count("[Verse") == server.catalogue.verses
+
+
+@pytest.mark.parametrize("source", ["page_data", "auto"])
+def test_lyrics_source(server: MockGeniusServer, source: str) -> None:
+    web = server.client()
+    genius = server.client(lyrics_source=source)
+    artist = genius.search_artist("Mock Artist 1", max_songs=4, get_full_info=False)
+    assert artist is not None
+    for song in artist.songs:
+        assert song.lyrics == web.lyrics(song_url=song.url)
+    assert genius.lyrics(song_id=10001) == web.lyrics(song_id=10001)
+    expected = {"page_data"} if source == "page_data" else {"page_data", "web"}
+    assert set(genius.lyrics_timings) == expected
+
+
+def test_page_data_fallback(server: MockGeniusServer) -> None:
+    genius = server.client(lyrics_source="page_data")
+    song = dict(server.catalogue.songs[20001])
+
+    # The page data path can't be inferred from another artist's slug
+    song["primary_artist"] = server.catalogue.artists[1]
+    assert genius._page_data_args(song) is None
+    assert genius._song_lyrics(song) == genius.lyrics(song_url=song["url"])
+    assert set(genius.lyrics_timings) == {"web"}
+
+    # Or the page data doesn't exist
+    song = dict(server.catalogue.songs[20001], path="/Mock-artist-2-missing-lyrics")
+    assert genius._song_lyrics(song) == genius.lyrics(song_url=song["url"])
+    assert set(genius.lyrics_timings) == {"web", "page_data"}
+
+
+def test_tag(genius: Genius, server: MockGeniusServer) -> None:
+    first = genius.tag("mock")
+    assert first is not None
+    assert first["next_page"] is None  # 12 songs, a single page
+    hits = first["hits"]
+    assert isinstance(hits, list)
+    assert [hit["url"] for hit in hits] == [
+        song["url"] for song in server.catalogue.songs.values()
+    ]
+    featured = next(hit for hit in hits if hit["featured_artists"])
+    assert featured["featured_artists"] == ["Mock Artist 2"]
+    assert featured["title_with_artists"].endswith("(Ft. Mock Artist 2)")
+
+
+def test_iter_tag() -> None:
+    with MockGeniusServer(Catalogue(num_artists=3, songs_per_artist=15)) as server:
+        genius = server.client()
+        songs = list(genius.iter_tag("mock"))
+        assert [song["url"] for song in songs] == [
+            song["url"] for song in server.catalogue.songs.values()
+        ]
+        assert len(list(genius.iter_tag("mock", max_pages=1))) == 20
+
+        with_lyrics = list(
+            genius.iter_tag("mock", fetch_lyrics=True, parse_workers=0, max_pages=2)
+        )
+        assert [song["url"] for song in with_lyrics] == [s["url"] for s in songs[:40]]
+        for song in with_lyrics[::10]:
+            assert song["lyrics"] == genius.lyrics(song_url=song["url"])
+
+
+def test_song_annotations() -> None:
+    with MockGeniusServer(
+        Catalogue(num_artists=1, songs_per_artist=3, verses=7)
+    ) as server:
+        genius = server.client()
+        song_ids = list(server.catalogue.songs)
+        annotations = genius.song_annotations(song_ids[0])
+        assert annotations[0] == ("Line 0 of verse 1", [["About verse 1."]])
+        assert len(annotations) == 7
+
+        before = server.requests
+        paged = list(genius.iter_song_annotations(song_ids[0], per_page=3))
+        assert paged == annotations
+        assert server.requests - before == 3  # 3 + 3 + 1 referents
+        assert list(genius.iter_song_annotations(song_ids[0], per_page=7)) == paged
+        prefetched = genius.iter_song_annotations(
+            song_ids[0], page_workers=3, per_page=2
+        )
+        assert list(prefetched) == paged
+
+        harvested = list(genius.iter_annotations(reversed(song_ids), workers=2))
+        assert [song_id for song_id, _ in harvested] == song_ids[::-1]
+        assert harvested[-1][1] == annotations
+
+
+def test_error_rate() -> None:
+    with MockGeniusServer(error_rate=1.0) as server:
+        with pytest.raises(AssertionError, match="500"):
+            server.client().song(10001)
+        assert server.errors == server.requests == 1
@@ -0,0 +1,104 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from lyricsgenius.types import Song, save_many
+
+
+@pytest.fixture
+def songs() -> list[Song]:
+    with open("tests/fixtures/song_info_mocked.json", "r") as f:
+        data: list[dict[str, Any]] = json.load(f)
+    return [Song(f"[Verse]\nLyrics of {song['title']}", song) for song in data]
+
+
+def test_if_exists(tmp_path: Path, songs: list[Song]) -> None:
+    first, second = songs[0], songs[1]
+    filename = str(tmp_path / "song")
+    path = first.save_lyrics(filename, if_exists="fail")
+    assert path == tmp_path / "song.json"
+
+    with mock.patch("builtins.input") as prompt:
+        assert second.save_lyrics(filename, if_exists="skip") is None
+        assert json.loads(path.read_text())["title"] == first.title
+        with pytest.raises(FileExistsError):
+            second.save_lyrics(filename, if_exists="fail")
+
+        assert second.save_lyrics(filename, if_exists="version") == (
+            tmp_path / "song_1.json"
+        )
+        assert second.save_lyrics(filename, if_exists="version") == (
+            tmp_path / "song_2.json"
+        )
+        assert second.save_lyrics(filename, if_exists="overwrite") == path
+        assert json.loads(path.read_text())["title"] == second.title
+    prompt.assert_not_called()
+
+    with pytest.raises(ValueError):
+        first.save_lyrics(filename, if_exists="ask")  # type: ignore[arg-type]
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_prompt(tmp_path: Path, songs: list[Song]) -> None:
+    filename = str(tmp_path / "song")
+    songs[0].save_lyrics(filename, extension="txt")
+    with mock.patch("builtins.input", return_value="n"):
+        assert songs[1].save_lyrics(filename, extension="txt") is None
+    assert songs[0].title in (tmp_path / "song.txt").read_text()
+    with mock.patch("builtins.input", return_value="y"):
+        assert songs[1].save_lyrics(filename, extension="txt")
+    assert songs[1].title in (tmp_path / "song.txt").read_text()
+
+
+def test_atomic_write(tmp_path: Path, songs: list[Song]) -> None:
+    path = tmp_path / "song.json"
+    songs[0].save_lyrics(str(path), if_exists="overwrite")
+    with mock.patch.object(Song, "to_dict", side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            songs[1].save_lyrics(str(path), if_exists="overwrite")
+    # The previous file is untouched and no temporary file is left behind
+    assert json.loads(path.read_text())["title"] == songs[0].title
+    assert [p.name for p in tmp_path.iterdir()] == ["song.json"]
+
+
+def test_save_many(tmp_path: Path, songs: list[Song]) -> None:
+    threads = set()
+    to_dict = Song.to_dict
+
+    def record_thread(self: Song) -> dict[str, Any]:
+        threads.add(threading.get_ident())
+        return to_dict(self)
+
+    with mock.patch.object(Song, "to_dict", record_thread):
+        paths = save_many(songs, tmp_path / "lyrics", workers=2)
+    assert [p.name for p in paths if p] == [
+        f"{song._default_filename()}.json" for song in songs
+    ]
+    assert threads and threading.get_ident() not in threads
+    assert [json.loads(p.read_text())["title"] for p in paths if p] == [
+        song.title for song in songs
+    ]
+
+    # Files that already exist
+    assert save_many(songs, tmp_path / "lyrics") == [None] * 3
+    with pytest.raises(FileExistsError):
+        save_many(songs, tmp_path / "lyrics", if_exists="fail")
+    versions = save_many(
+        songs[:1] * 3,
+        tmp_path / "lyrics",
+        extension="txt",
+        if_exists="version",
+        filename=lambda song: song.title.replace(" ", "_"),
+        workers=3,
+    )
+    assert sorted(p.name for p in versions if p) == [
+        "Setup_Serenade.txt",
+        "Setup_Serenade_1.txt",
+        "Setup_Serenade_2.txt",
+    ]
+    with pytest.raises(ValueError):
+        save_many(songs, tmp_path, if_exists="prompt")
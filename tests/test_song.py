@@ -7,6 +7,7 @@ from unittest import mock
 import pytest
 
 from lyricsgenius.types import Song
+from lyricsgenius.types.base import BaseEntity
 from lyricsgenius.utils import clean_str
 
 
@@ -230,3 +231,28 @@ def test_save_lyrics_path_creates_directory(song_object: Song, tmp_path: Path) -
 
     assert new_dir.is_dir()
     assert (new_dir / "out.json").is_file()
+
+
+def test_song_equality_and_hash(
+    song_object: Song, mock_song_data: dict[str, Any], mock_lyrics: str
+) -> None:
+    """Test that songs are compared and hashed by ID, or by content without one."""
+    same_id = Song("Different lyrics", mock_song_data)
+    assert song_object == same_id
+    assert len({song_object, same_id}) == 1
+
+    body = {k: v for k, v in mock_song_data.items() if k != "id"}
+    first, second = Song(mock_lyrics, body), Song(mock_lyrics, dict(body))
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != song_object
+
+    digest = second.lyrics_digest
+    second.lyrics = "Changed"
+    assert second.lyrics_digest != digest
+    assert first != second
+
+
+def test_entity_hooks_are_abstract() -> None:
+    """Test that types must define how they're identified and saved."""
+    assert {"_content_key", "_default_filename"} <= BaseEntity.__abstractmethods__
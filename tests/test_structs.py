@@ -0,0 +1,99 @@
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.mock_server import MockGeniusServer
+from lyricsgenius import Genius
+from lyricsgenius.types.structs import SongData, from_dict
+
+
+@pytest.fixture
+def genius(server: MockGeniusServer) -> Genius:
+    return server.client()
+
+
+def test_song_data(genius: Genius, server: MockGeniusServer) -> None:
+    expected = server.catalogue.songs[10002]
+    song = genius.song_data(10002)
+    assert isinstance(song, SongData)
+    assert song.title == expected["title"]
+    assert song.primary_artist is not None
+    assert song.primary_artist.name == expected["primary_artist"]["name"]
+    assert song.album is not None
+    assert song.album.release_date_components is not None
+    assert song.album.release_date_components.year == 2020
+    assert song.featured_artists == []
+
+
+def test_artist_and_album_data(genius: Genius) -> None:
+    assert genius.artist_data(2).name == "Mock Artist 2"
+    album = genius.album_data(100)
+    assert album.name == "Mock Album 1"
+    assert album.artist is not None
+    assert album.artist.id == 1
+
+
+def test_search_songs_data(genius: Genius) -> None:
+    hits = genius.search_songs_data("Mock Song 3")
+    assert hits
+    assert all(hit.result.title == "Mock Song 3" for hit in hits)
+
+
+def test_referents_data(genius: Genius, server: MockGeniusServer) -> None:
+    referents = genius.referents_data(song_id=10001)
+    assert len(referents) == server.catalogue.verses
+    assert referents[0].annotations[0].body == {"plain": "About verse 1."}
+
+
+def test_from_dict_errors() -> None:
+    with pytest.raises(ValueError):
+        from_dict(SongData, {"title": "No ID"})
+
+
+def test_without_msgspec() -> None:
+    """The structs fall back to dataclasses when msgspec isn't installed."""
+    code = (
+        "import dataclasses, json, sys\n"
+        "sys.modules['msgspec'] = None\n"
+        "from lyricsgenius.codec import get_codec\n"
+        "from lyricsgenius.types import structs\n"
+        "assert not structs.HAS_MSGSPEC\n"
+        "song = json.load(open('tests/fixtures/song_info_mocked.json'))[0]\n"
+        "data = json.dumps({'response': {'song': song}}).encode()\n"
+        "body = structs.decode(\n"
+        "    data, structs.Envelope[structs.SongResponse], get_codec('json')\n"
+        ")\n"
+        "assert dataclasses.is_dataclass(body.response.song)\n"
+        "assert body.response.song.album.artist.name == 'Fixture Factory'\n"
+        "assert body.response.song.featured_artists == []\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_without_msgspec_errors() -> None:
+    """The dataclass fallback rejects wrongly typed fields like msgspec."""
+    code = (
+        "import sys\n"
+        "sys.modules['msgspec'] = None\n"
+        "from lyricsgenius.types import structs\n"
+        "assert not structs.HAS_MSGSPEC\n"
+        "invalid = [\n"
+        "    {'id': 'nope', 'title': 'T'},\n"
+        "    {'id': 1, 'title': 5},\n"
+        "    {'id': True, 'title': 'T'},\n"
+        "    {'id': 1, 'title': 'T', 'pyongs_count': 1.5},\n"
+        "    {'id': 1, 'title': 'T', 'featured_artists': {}},\n"
+        "    {'id': 1, 'title': 'T', 'primary_artist': {'id': 2, 'name': 'A',\n"
+        "     'is_verified': 'no'}},\n"
+        "]\n"
+        "for data in invalid:\n"
+        "    try:\n"
+        "        structs.from_dict(structs.SongData, data)\n"
+        "    except ValueError:\n"
+        "        continue\n"
+        "    raise AssertionError(data)\n"
+        "song = structs.from_dict(structs.SongData, {'id': 1, 'title': 'T'})\n"
+        "assert song.id == 1 and song.title == 'T'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
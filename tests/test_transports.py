@@ -0,0 +1,91 @@
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+from benchmarks.mock_server import Catalogue, MockGeniusServer
+from lyricsgenius import Genius
+from lyricsgenius.proxies import ProxyPool
+from lyricsgenius.transports import (
+    RecordingTransport,
+    ReplayTransport,
+    RequestsTransport,
+    get_transport,
+    request_key,
+)
+
+
+def test_get_transport() -> None:
+    transport = get_transport()
+    assert isinstance(transport, RequestsTransport)
+    assert get_transport(transport) is transport
+    with pytest.raises(ValueError):
+        get_transport("urllib")
+
+
+@pytest.mark.parametrize("name", ["requests", "httpx", "http2"])
+def test_transports(server: MockGeniusServer, name: str) -> None:
+    if name != "requests":
+        pytest.importorskip("httpx")
+    if name == "http2":
+        pytest.importorskip("h2")
+    genius = server.client(transport=name, web_proxy_pool=ProxyPool([server.url]))
+    assert genius.transport.name == name
+
+    artist = genius.search_artist("Mock Artist 1", max_songs=2)
+    assert artist is not None
+    assert len(artist.songs) == 2
+    assert all("Line 7 of verse 4" in song.lyrics for song in artist.songs)
+    assert genius.web_proxy_pool is not None
+    assert genius.web_proxy_pool.usage()[0].requests == 2
+    genius.transport.close()
+
+
+@pytest.mark.parametrize("name", ["requests", "httpx"])
+def test_errors(name: str) -> None:
+    if name != "requests":
+        pytest.importorskip("httpx")
+    transport = get_transport(name)
+    with MockGeniusServer(latency=0.5) as server:
+        with pytest.raises(requests.exceptions.Timeout):
+            transport.request("GET", server.url + "songs/10001", timeout=0.05)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        transport.request("GET", "http://127.0.0.1:9/songs/1", timeout=1)
+    transport.close()
+
+
+def test_record_and_replay(tmp_path: Path) -> None:
+    with MockGeniusServer(Catalogue(num_artists=1, songs_per_artist=4)) as server:
+        genius = server.client(transport=RecordingTransport(tmp_path))
+        recorded = genius.search_artist("Mock Artist 1", max_songs=3)
+        requests_made = server.requests
+        url = server.url
+
+    assert len(list(tmp_path.glob("*.json"))) == requests_made
+    replay = ReplayTransport(tmp_path)
+    # The server is stopped, every response comes from the recordings
+    genius = Genius("mock-token", sleep_time=0, transport=replay)
+    genius.API_ROOT = genius.WEB_ROOT = url
+    genius.PUBLIC_API_ROOT = url + "api/"
+    replayed = genius.search_artist("Mock Artist 1", max_songs=3)
+    assert replayed is not None and recorded is not None
+    assert replayed.to_dict() == recorded.to_dict()
+    assert replay.requests == requests_made
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        genius.song(123)
+
+    replay = ReplayTransport(tmp_path, latency=0.05)
+    genius.transport = replay
+    start = time.perf_counter()
+    genius.lyrics(song_url=replayed.songs[0].url)
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_request_key() -> None:
+    url = "https://api.genius.com/songs/1"
+    key = request_key("GET", url, {"text_format": None, "a": 1, "b": 2})
+    assert key == request_key("get", url, [("b", "2"), ("a", "1")])
+    assert key != request_key("GET", url, {"a": 1})
+    assert key != request_key("POST", url, {"a": 1, "b": 2}, json={"c": 3})
@@ -1,8 +1,13 @@
+import unicodedata
 import unittest
+from itertools import count
+from string import punctuation
 
 from lyricsgenius.utils import (
     auth_from_environment,
+    clean_str,
     parse_redirected_url,
+    prefetch,
     sanitize_filename,
 )
 
@@ -18,6 +23,23 @@ class TestUtils(unittest.TestCase):
         r = sanitize_filename(raw)
         self.assertEqual(r, cleaned)
 
+    def test_clean_str(self):
+        def reference(s):
+            table = str.maketrans("", "", punctuation + "\u200b")
+            return unicodedata.normalize("NFKC", s.translate(table).strip().lower())
+
+        strings = [
+            "  Don't Stop Me Now! ",
+            "Beyoncé",
+            "ＡＢＣ (Remix)",
+            "Zero\u200bWidth",
+            "Ǆemal's ﬁre",
+            "",
+        ]
+        for s in strings:
+            self.assertEqual(clean_str(s), reference(s))
+        self.assertEqual(clean_str("Mr. Brightside"), "mr brightside")
+
     def test_parse_redirected_url(self):
         redirected = "https://example.com/callback?code=test"
         flow = "code"
@@ -34,3 +56,15 @@ class TestUtils(unittest.TestCase):
     def test_auth_from_environment(self):
         credentials = auth_from_environment()
         self.assertTrue(len(credentials) == 3)
+
+    def test_prefetch(self):
+        for workers in (1, 3):
+            squares = prefetch(lambda x: x * x, range(10), workers)
+            self.assertEqual(list(squares), [x * x for x in range(10)])
+
+        # Endless items are only consumed a few calls ahead
+        calls = []
+        results = prefetch(calls.append, count(), 3)
+        next(results)
+        results.close()
+        self.assertLessEqual(len(calls), 4)